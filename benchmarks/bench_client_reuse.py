@@ -0,0 +1,65 @@
+"""
+Compare per-call sessions against a shared `Client` connection pool.
+
+Runs a local aiohttp stub server and issues the same number of requests through
+`Request.request()` with and without an active `Client`, reporting wall time and
+how many TCP connections the server had to accept.
+
+    python benchmarks/bench_client_reuse.py [requests] [concurrency]
+"""
+import asyncio
+import sys
+import time
+from http import HTTPMethod
+
+from aiohttp import web
+
+from proschedio_vultr import Client
+from proschedio_vultr.request import Request
+
+async def _start_stub() -> tuple[web.AppRunner, str, set[int]]:
+    connections: set[int] = set()
+
+    async def account(request: web.Request) -> web.Response:
+        connections.add(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"account": {"name": "stub", "balance": 0}})
+
+    app = web.Application()
+    app.router.add_get("/v2/account", account)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/v2/account", connections
+
+async def _run(url: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            result = await Request(url).set_method(HTTPMethod.GET).request()
+            assert result.is_ok()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return time.perf_counter() - started
+
+async def main(total: int, concurrency: int) -> None:
+    runner, url, connections = await _start_stub()
+    try:
+        elapsed = await _run(url, total, concurrency)
+        print(f"per-call session : {elapsed * 1000:8.1f} ms  {len(connections):5d} connections")
+
+        connections.clear()
+        async with Client(limit=concurrency):
+            elapsed = await _run(url, total, concurrency)
+        print(f"shared Client    : {elapsed * 1000:8.1f} ms  {len(connections):5d} connections")
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    asyncio.run(main(total, concurrency))
@@ -0,0 +1,110 @@
+"""
+Measure event-loop lag while large list pages are decoded, with and without `DecodeOffload`.
+
+A local stub serves a synthetic 500-item `/v2/bare-metals` page. While several requests fetch it
+concurrently, a heartbeat coroutine sleeps 1 ms at a time and records how late it wakes up; that
+overshoot is the time the loop was blocked. Reported per mode: heartbeat lag p50/p99/max and
+total wall time.
+
+    python benchmarks/bench_event_loop_lag.py [rounds] [concurrency] [items]
+"""
+import asyncio
+import json
+import statistics
+import sys
+import time
+from http import HTTPMethod
+
+from aiohttp import web
+
+from proschedio_vultr import Client, DecodeOffload
+from proschedio_vultr.request import Request
+
+def _page(items: int) -> bytes:
+    bare_metal = {
+        "id": "cb676a46-66fd-4dfb-b839-443f2e6c0b60",
+        "os": "Application",
+        "ram": "65536 MB",
+        "disk": "2x 1.92TB SSD",
+        "main_ip": "192.0.2.123",
+        "cpu_count": 24,
+        "region": "ams",
+        "default_password": "example-password",
+        "date_created": "2020-10-10T01:56:20+00:00",
+        "status": "active",
+        "netmask_v4": "255.255.254.0",
+        "gateway_v4": "192.0.2.1",
+        "plan": "vbm-24c-256gb-amd",
+        "v6_network": "2001:0db8:5001:3990::",
+        "v6_main_ip": "2001:0db8:5001:3990:0ec4:7aff:fe8e:f97a",
+        "v6_network_size": 64,
+        "mac_address": 2199756823533,
+        "label": "Example Bare Metal " * 8,
+        "tag": "Example Tag",
+        "tags": ["a tag", "another"],
+        "os_id": 183,
+        "app_id": 3,
+        "image_id": "",
+        "features": ["ipv6"],
+        "user_scheme": "root",
+        "notes": [{"line": i, "text": "x" * 64} for i in range(16)],
+    }
+    return json.dumps({"bare_metals": [bare_metal] * items, "meta": {"total": items, "links": {"next": "", "prev": ""}}}).encode()
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event, interval: float = 0.001) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+
+async def _run(url: str, offload: DecodeOffload | None, rounds: int, concurrency: int) -> tuple[list[float], float]:
+    async with Client(offload=offload):
+        # Warm up the connection pool and any worker pool outside the measurement.
+        await asyncio.gather(*(Request(url).set_method(HTTPMethod.GET).request() for _ in range(concurrency)))
+
+        lags: list[float] = []
+        stop = asyncio.Event()
+        heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+        started = time.perf_counter()
+        for _ in range(rounds):
+            results = await asyncio.gather(*(Request(url).set_method(HTTPMethod.GET).request() for _ in range(concurrency)))
+            assert all(result.is_ok() for result in results)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await heartbeat
+    return lags, elapsed
+
+async def main(rounds: int, concurrency: int, items: int) -> None:
+    body = _page(items)
+
+    async def bare_metals(_: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/v2/bare-metals", bare_metals)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/v2/bare-metals"
+    print(f"{items} items, {len(body) / 1024:.0f} KiB body, {rounds} rounds x {concurrency} concurrent requests")
+
+    modes: dict[str, DecodeOffload | None] = {
+        "inline (no offload)": None,
+        "thread pool": DecodeOffload(threshold=64 * 1024),
+        "process pool": DecodeOffload(threshold=64 * 1024, process_threshold=64 * 1024),
+    }
+    print(f"{'mode':<22} {'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'wall':>9}")
+    try:
+        for label, offload in modes.items():
+            lags, elapsed = await _run(url, offload, rounds, concurrency)
+            p99 = statistics.quantiles(lags, n=100, method="inclusive")[98] if len(lags) >= 2 else max(lags, default=0.0)
+            print(
+                f"{label:<22} {statistics.median(lags):7.2f}ms {p99:7.2f}ms "
+                f"{max(lags):7.2f}ms {elapsed * 1000:7.0f}ms"
+            )
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [20, 4, 500][len(args):])))
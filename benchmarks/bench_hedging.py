@@ -0,0 +1,63 @@
+"""
+Measure tail latency of `GET` calls with and without `HedgePolicy`.
+
+A local stub serves `/v2/instances/{id}` in a few milliseconds, except that one request in
+`slow_every` stalls for `stall_ms`. Requests are sent one after another so the stalls are not
+hidden by concurrency. Reported per mode: p50/p90/p99/max latency and, with hedging, how many
+hedges fired and won.
+
+    python benchmarks/bench_hedging.py [requests] [slow_every] [stall_ms]
+"""
+import asyncio
+import itertools
+import statistics
+import sys
+import time
+from http import HTTPMethod
+
+from aiohttp import web
+
+from proschedio_vultr import Client, HedgePolicy
+from proschedio_vultr.request import Request
+
+async def _run(url: str, hedging: HedgePolicy | None, requests: int) -> list[float]:
+    latencies: list[float] = []
+    async with Client(hedging=hedging):
+        for _ in range(requests):
+            started = time.perf_counter()
+            result = await Request(url).set_method(HTTPMethod.GET).request()
+            assert result.is_ok()
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+async def main(requests: int, slow_every: int, stall_ms: int) -> None:
+    counter = itertools.count()
+
+    async def instance(_: web.Request) -> web.Response:
+        await asyncio.sleep(stall_ms / 1000 if next(counter) % slow_every == slow_every - 1 else 0.002)
+        return web.json_response({"instance": {"id": "cb676a46-66fd-4dfb-b839-443f2e6c0b60"}})
+
+    app = web.Application()
+    app.router.add_get("/v2/instances/{id}", instance)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/v2/instances/cb676a46-66fd-4dfb-b839-443f2e6c0b60"
+    print(f"{requests} sequential GETs, 1 in {slow_every} stalls {stall_ms} ms")
+
+    print(f"{'mode':<12} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}  hedges")
+    try:
+        for label, hedging in (("no hedging", None), ("hedged", HedgePolicy(initial_delay=0.05, budget=0.2))):
+            latencies = await _run(url, hedging, requests)
+            cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+            hedges = f"{hedging.stats['fired']} fired, {hedging.stats['won']} won" if hedging is not None else "-"
+            print(
+                f"{label:<12} {cuts[49]:7.1f}ms {cuts[89]:7.1f}ms {cuts[98]:7.1f}ms "
+                f"{max(latencies):7.1f}ms  {hedges}"
+            )
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [500, 20, 500][len(args):])))
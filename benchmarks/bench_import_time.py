@@ -0,0 +1,76 @@
+"""
+Measure the import-time cost of the package with `python -X importtime`.
+
+Each scenario runs in a fresh interpreter several times; the median cumulative import time of
+the `proschedio_vultr` modules is reported along with the slowest modules pulled in. With
+`--max-ms`, the script exits non-zero when the bare `import proschedio_vultr` exceeds the budget,
+so it can guard against eager imports creeping back in.
+
+    python benchmarks/bench_import_time.py [runs] [--max-ms 50]
+"""
+import statistics
+import subprocess
+import sys
+
+SCENARIOS: dict[str, str] = {
+    "import proschedio_vultr": "import proschedio_vultr",
+    "Action.instance()": "from proschedio_vultr import Action; Action.instance()",
+    "import every action": "import proschedio_vultr.actions as a; [getattr(a, n) for n in a._CLASSES]",
+}
+
+def _importtime(code: str) -> dict[str, int]:
+    """
+    Run `code` in a fresh interpreter and return the cumulative import time (us) per module, keyed
+    by the indented module name so nesting is preserved.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+        _, total, name = line.removeprefix("import time:").split("|")
+        # One space of padding, then two more per nesting level.
+        cumulative[name[1:]] = int(total)
+    return cumulative
+
+def _measure(code: str, runs: int) -> tuple[float, list[tuple[str, float]]]:
+    totals: list[int] = []
+    per_module: dict[str, list[int]] = {}
+    for _ in range(runs):
+        cumulative = _importtime(code)
+        # Only top-level entries, so nested imports are not counted twice.
+        totals.append(sum(us for name, us in cumulative.items() if name == name.lstrip()))
+        for name, us in cumulative.items():
+            per_module.setdefault(name.strip(), []).append(us)
+    slowest = sorted(((name, statistics.median(us)) for name, us in per_module.items()), key=lambda item: -item[1])
+    return statistics.median(totals) / 1000, [(name, us / 1000) for name, us in slowest[:5]]
+
+def main() -> None:
+    args = sys.argv[1:]
+    budget: float | None = None
+    if "--max-ms" in args:
+        position = args.index("--max-ms")
+        budget = float(args[position + 1])
+        del args[position:position + 2]
+    runs = int(args[0]) if args else 5
+
+    baseline, _ = _measure("pass", runs)
+    results: dict[str, float] = {}
+    for label, code in SCENARIOS.items():
+        total, slowest = _measure(code, runs)
+        results[label] = total - baseline
+        print(f"{label:<26} {results[label]:8.1f} ms")
+        for name, ms in slowest:
+            print(f"    {name:<40} {ms:8.1f} ms")
+
+    if budget is not None and results["import proschedio_vultr"] > budget:
+        print(f"import proschedio_vultr took {results['import proschedio_vultr']:.1f} ms (budget {budget:.1f} ms)")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
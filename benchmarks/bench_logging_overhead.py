@@ -0,0 +1,65 @@
+"""
+Measure the per-call cost of the request logging path while logging is disabled.
+
+Times `Request.request()` against a local stub returning a large list page, once with the
+package logger at WARNING (the default for production) and once at DEBUG with a handler
+writing to a null stream, to show what the lazy formatting saves.
+
+    python benchmarks/bench_logging_overhead.py [calls] [items]
+"""
+import asyncio
+import io
+import json
+import logging
+import sys
+import time
+from http import HTTPMethod
+
+from aiohttp import web
+
+from proschedio_vultr import Client
+from proschedio_vultr.request import Request
+
+async def _timed(url: str, calls: int) -> float:
+    request = Request(url).set_method(HTTPMethod.GET).add_header("Authorization", "Bearer secret")
+    await request.request()
+    started = time.perf_counter()
+    for _ in range(calls):
+        await request.request()
+    return (time.perf_counter() - started) / calls
+
+async def main(calls: int, items: int) -> None:
+    body = json.dumps({"records": [{"id": str(i), "type": "A", "name": "www", "data": "192.0.2.123", "priority": -1, "ttl": 300} for i in range(items)]}).encode()
+
+    async def records(_: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/v2/domains/example.com/records", records)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/v2/domains/example.com/records"
+
+    package_logger = logging.getLogger("proschedio_vultr")
+    handler = logging.StreamHandler(io.StringIO())
+    package_logger.addHandler(handler)
+    package_logger.propagate = False
+    try:
+        async with Client():
+            package_logger.setLevel(logging.WARNING)
+            off = await _timed(url, calls)
+            package_logger.setLevel(logging.DEBUG)
+            on = await _timed(url, calls)
+    finally:
+        package_logger.removeHandler(handler)
+        await runner.cleanup()
+
+    print(f"{len(body) / 1024:.0f} KiB response, {calls} calls")
+    print(f"logging off  : {off * 1e6:8.1f} us/call")
+    print(f"logging DEBUG: {on * 1e6:8.1f} us/call")
+
+if __name__ == "__main__":
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    asyncio.run(main(calls, items))
@@ -0,0 +1,99 @@
+"""
+Measure the per-payload cost of the opt-in request validation.
+
+Times `Validator.errors()` for representative create payloads (flat, nested and invalid), and the
+full `check_request()` path that also matches the URL against the OpenAPI route table, in
+microseconds per payload. Compilation happens once, before timing.
+
+    python benchmarks/bench_payload_validation.py [iterations]
+"""
+import sys
+import time
+from http import HTTPMethod
+
+from proschedio_vultr.models.database import CreateDatabaseConfig
+from proschedio_vultr.models.instance import CreateConfig
+from proschedio_vultr.models.kubenetes import CreateKubernetesConfig
+from proschedio_vultr.models.load_balancer import CreateLoadBalancerConfig
+from proschedio_vultr.validation import check_request, compile_validator
+
+BASE = "https://api.vultr.com/v2/"
+
+CASES: list[tuple[str, type, str, dict[str, object]]] = [
+    (
+        "instance (flat)",
+        CreateConfig,
+        "instances",
+        {
+            "region": "ewr", "plan": "vc2-1c-1gb", "os_id": 2284, "label": "web-1", "hostname": "web-1",
+            "enable_ipv6": True, "backups": "disabled", "tags": ["web", "prod"], "sshkey_id": ["key-1"],
+        },
+    ),
+    (
+        "database (flat)",
+        CreateDatabaseConfig,
+        "databases",
+        {
+            "database_engine": "pg", "database_engine_version": "16", "region": "fra",
+            "plan": "vultr-dbaas-startup-cc-1-55-2", "label": "orders", "maintenance_dow": "sunday",
+            "trusted_ips": ["10.0.0.0/8"],
+        },
+    ),
+    (
+        "kubernetes (nested)",
+        CreateKubernetesConfig,
+        "kubernetes/clusters",
+        {
+            "label": "prod", "region": "ams", "version": "v1.31.2+1",
+            "node_pools": [
+                {"node_quantity": 3, "label": f"pool-{i}", "plan": "vc2-2c-4gb", "labels": {"tier": "app"}}
+                for i in range(4)
+            ],
+        },
+    ),
+    (
+        "load balancer (nested)",
+        CreateLoadBalancerConfig,
+        "load-balancers",
+        {
+            "region": "ewr", "label": "edge",
+            "forwarding_rules": [
+                {"frontend_protocol": "HTTPS", "frontend_port": 443, "backend_protocol": "HTTP", "backend_port": 8080},
+                {"frontend_protocol": "HTTP", "frontend_port": 80, "backend_protocol": "HTTP", "backend_port": 8080},
+            ],
+            "health_check": {"protocol": "HTTP", "port": 8080, "path": "/health"},
+        },
+    ),
+    (
+        "instance (invalid)",
+        CreateConfig,
+        "instances",
+        {"region": "ewr", "os_id": "2284", "lable": "web-1", "backups": "weekly"},
+    ),
+]
+
+def _per_call(fn: object, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()  # type: ignore[operator]
+    return (time.perf_counter() - started) / iterations * 1e6
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    started = time.perf_counter()
+    for _, model, _, _ in CASES:
+        compile_validator(model)
+    print(f"compile {len(CASES)} models: {(time.perf_counter() - started) * 1e3:.2f} ms (once per process)")
+
+    print(f"{'payload':<26} {'validator':>12} {'check_request':>15}  errors")
+    for label, model, path, payload in CASES:
+        validator = compile_validator(model)
+        url = BASE + path
+        errors = check_request(HTTPMethod.POST, url, model, payload)
+        direct = _per_call(lambda: validator.errors(payload), iterations)
+        full = _per_call(lambda: check_request(HTTPMethod.POST, url, model, payload), iterations)
+        print(f"{label:<26} {direct:9.2f} us {full:12.2f} us  {len(errors)}")
+
+if __name__ == "__main__":
+    main()
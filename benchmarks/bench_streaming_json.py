@@ -0,0 +1,101 @@
+"""
+Compare buffered `Request.request()` decoding with `Request.stream()` on a large list page.
+
+Serves a synthetic 500-item `/v2/instances` page from a local stub and reports, for each JSON
+backend available, the parse time and the peak Python heap allocated while handling the
+response (`tracemalloc`, which isolates the response from interpreter baseline RSS).
+
+    python benchmarks/bench_streaming_json.py [items]
+"""
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from http import HTTPMethod
+
+from aiohttp import web
+
+from proschedio_vultr import Client, codec
+from proschedio_vultr.request import Request
+
+def _page(items: int) -> bytes:
+    instance = {
+        "id": "cb676a46-66fd-4dfb-b839-443f2e6c0b60",
+        "os": "CentOS SELinux 8 x64",
+        "ram": 2048,
+        "disk": 60,
+        "main_ip": "192.0.2.123",
+        "vcpu_count": 2,
+        "region": "ewr",
+        "plan": "vc2-1c-2gb",
+        "date_created": "2020-10-10T01:56:20+00:00",
+        "status": "active",
+        "allowed_bandwidth": 2000,
+        "netmask_v4": "255.255.254.0",
+        "gateway_v4": "192.0.2.1",
+        "power_status": "running",
+        "server_status": "ok",
+        "v6_network": "2001:0db8:1112:18fb::",
+        "v6_main_ip": "2001:0db8:1112:18fb:0200:00ff:fe00:0000",
+        "v6_network_size": 64,
+        "label": "Example Instance " * 4,
+        "internal_ip": "",
+        "kvm": "https://my.vultr.com/subs/novnc/api.php?data=00example11223344",
+        "hostname": "my_hostname",
+        "tag": "Example Tag",
+        "tags": ["a tag", "another"],
+        "os_id": 215,
+        "app_id": 0,
+        "image_id": "",
+        "firewall_group_id": "",
+        "features": ["auto_backups", "ipv6", "ddos_protection"],
+        "user_scheme": "root",
+    }
+    return json.dumps({"instances": [instance] * items, "meta": {"total": items, "links": {"next": "", "prev": ""}}}).encode()
+
+async def main(items: int) -> None:
+    body = _page(items)
+
+    async def instances(_: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/v2/instances", instances)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/v2/instances"
+    print(f"{items} items, {len(body) / 1024:.0f} KiB body")
+
+    backends = ["json"] + (["orjson"] if codec.orjson is not None else [])
+    try:
+        async with Client():
+            for backend in backends:
+                codec.set_backend(backend)  # type: ignore[arg-type]
+
+                tracemalloc.start()
+                started = time.perf_counter()
+                result = await Request(url).set_method(HTTPMethod.GET).request()
+                elapsed = time.perf_counter() - started
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                assert result.is_ok()
+                del result
+                print(f"request() {backend:7s}: {elapsed * 1000:7.1f} ms  peak {peak / 1024:8.0f} KiB")
+
+                tracemalloc.start()
+                started = time.perf_counter()
+                count = 0
+                async for _ in Request(url).set_method(HTTPMethod.GET).stream("instances"):
+                    count += 1
+                elapsed = time.perf_counter() - started
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                assert count == items
+                print(f"stream()  {backend:7s}: {elapsed * 1000:7.1f} ms  peak {peak / 1024:8.0f} KiB")
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
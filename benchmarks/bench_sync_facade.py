@@ -0,0 +1,77 @@
+"""
+Compare blocking calls made with `asyncio.run()` per call against `SyncClient`.
+
+A local stub (on its own thread) serves `/v2/instances/{id}`. Three modes issue the same number
+of calls: `asyncio.run()` around every call (new loop and session each time), `SyncClient.call()`
+from one thread, and `SyncClient.call()` from a thread pool. Reported per mode: calls per second,
+mean latency, and the number of TCP connections the stub saw.
+
+    python benchmarks/bench_sync_facade.py [calls] [threads]
+"""
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPMethod
+
+from aiohttp import web
+
+from proschedio_vultr import Client, SyncClient
+from proschedio_vultr.request import Request
+
+def _serve(ready: threading.Event, ports: set[int], address: list[str]) -> None:
+    loop = asyncio.new_event_loop()
+
+    async def instance(request: web.Request) -> web.Response:
+        ports.add(request.transport.get_extra_info("peername")[1])  # type: ignore[union-attr]
+        return web.json_response({"instance": {"id": request.match_info["id"]}})
+
+    app = web.Application()
+    app.router.add_get("/v2/instances/{id}", instance)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", 0).start())
+    address.append(f"http://127.0.0.1:{runner.addresses[0][1]}/v2/instances/")
+    ready.set()
+    loop.run_forever()
+
+async def _get(url: str) -> None:
+    result = await Request(url).set_method(HTTPMethod.GET).request()
+    assert result.is_ok()
+
+def main(calls: int, threads: int) -> None:
+    ready = threading.Event()
+    ports: set[int] = set()
+    address: list[str] = []
+    threading.Thread(target=_serve, args=(ready, ports, address), daemon=True).start()
+    ready.wait()
+    base = address[0]
+    print(f"{calls} calls, {threads} threads for the pooled mode")
+    print(f"{'mode':<28} {'calls/s':>9} {'mean':>9} {'connections':>12}")
+
+    def report(label: str, elapsed: float) -> None:
+        print(f"{label:<28} {calls / elapsed:9.0f} {elapsed / calls * 1000:7.2f}ms {len(ports):12d}")
+        ports.clear()
+
+    started = time.perf_counter()
+    for i in range(calls):
+        asyncio.run(_get(f"{base}{i}"))
+    report("asyncio.run() per call", time.perf_counter() - started)
+
+    with SyncClient(Client(limit=threads)) as vultr:
+        vultr.call(_get, f"{base}warmup")
+        ports.clear()
+        started = time.perf_counter()
+        for i in range(calls):
+            vultr.call(_get, f"{base}{i}")
+        report("SyncClient, 1 thread", time.perf_counter() - started)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda i: vultr.call(_get, f"{base}{i}"), range(calls)))
+        report(f"SyncClient, {threads} threads", time.perf_counter() - started)
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [500, 8][len(args):]))
@@ -0,0 +1,131 @@
+"""
+Compile the bundled `openapi.json` into `src/proschedio_vultr/routes.py`.
+
+Every operation becomes one literal tuple (method, path segments, query parameters, required and
+declared body fields), so the generated module loads as a handful of marshalled constants and never parses the
+1 MB spec at runtime. Re-run after updating `openapi.json`:
+
+    python scripts/generate_routes.py [openapi.json] [src/proschedio_vultr/routes.py]
+"""
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+METHODS = ("get", "post", "put", "patch", "delete", "options")
+PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+HEADER = '''"""
+Route table compiled from the bundled `openapi.json` by `scripts/generate_routes.py`. Do not edit.
+
+`ROUTES` maps each OpenAPI operation id to `(method, path segments, query parameters, required
+body fields, declared body fields)`. Path segments are relative to `SERVER_URL` and alternate literal text and
+placeholder names, starting with a literal. Use `routing.route()` for a typed view.
+
+The hand-written actions still build their URLs from `urls.py`, which stays authoritative for
+them. This table backs `Request.for_route()` and payload validation; `tests/test_routes.py`
+checks that every `urls.py` template has a matching route here.
+"""
+from typing import Final
+'''
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+def _resolve(spec: dict, node: dict) -> dict:
+    while "$ref" in node:
+        target: object = spec
+        for part in node["$ref"].removeprefix("#/").split("/"):
+            target = target[part]  # type: ignore[index]
+        node = target  # type: ignore[assignment]
+    return node
+
+def _query(spec: dict, path_item: dict, operation: dict) -> tuple[str, ...]:
+    names: list[str] = []
+    for parameter in [*path_item.get("parameters", []), *operation.get("parameters", [])]:
+        parameter = _resolve(spec, parameter)
+        if parameter.get("in") == "query" and parameter["name"] not in names:
+            names.append(parameter["name"])
+    return tuple(names)
+
+def _body_schema(spec: dict, operation: dict) -> dict:
+    body = operation.get("requestBody")
+    if body is None:
+        return {}
+    return _resolve(spec, _resolve(spec, body).get("content", {}).get("application/json", {}).get("schema", {}))
+
+def _required(spec: dict, operation: dict) -> tuple[str, ...]:
+    return tuple(_body_schema(spec, operation).get("required", ()))
+
+def _properties(spec: dict, schema: dict) -> tuple[str, ...]:
+    """
+    Top-level body fields declared by `schema`, including those of every `oneOf`/`anyOf`/`allOf` branch.
+    """
+    names: list[str] = list(schema.get("properties", {}))
+    for combinator in ("oneOf", "anyOf", "allOf"):
+        for branch in schema.get(combinator, ()):
+            names.extend(name for name in _properties(spec, _resolve(spec, branch)) if name not in names)
+    return tuple(names)
+
+def compile_routes(spec: dict) -> dict[str, tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]]:
+    """
+    Return the route table for `spec`, keyed by operation id.
+
+    Operations without an id, or whose id is already taken, are keyed by the slug of their summary.
+    """
+    routes: dict[str, tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = {}
+    for path, path_item in spec["paths"].items():
+        # A few spec paths carry example query strings; the route is the bare path.
+        segments = tuple(PLACEHOLDER.split(path.lstrip("/").partition("?")[0]))
+        for method in METHODS:
+            operation = path_item.get(method)
+            if operation is None:
+                continue
+            operation_id = operation.get("operationId")
+            if not operation_id or operation_id in routes:
+                operation_id = _slug(operation.get("summary") or f"{method} {path}")
+            if operation_id in routes:
+                raise ValueError(f"Cannot derive a unique operation id for {method.upper()} {path}")
+            routes[operation_id] = (
+                method.upper(),
+                segments,
+                _query(spec, path_item, operation),
+                _required(spec, operation),
+                _properties(spec, _body_schema(spec, operation)),
+            )
+    return routes
+
+def _literal(value: str | tuple) -> str:
+    """
+    Render `value` as a Python literal with double-quoted strings, matching the package style.
+    """
+    if isinstance(value, str):
+        return json.dumps(value)
+    items = [_literal(item) for item in value]
+    return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+
+def render(spec: dict) -> str:
+    server_url = spec["servers"][0]["url"].rstrip("/") + "/"
+    lines = [
+        HEADER,
+        f"SPEC_VERSION: Final[str] = {_literal(spec['info']['version'])}",
+        "",
+        f"SERVER_URL: Final[str] = {_literal(server_url)}",
+        "",
+        "ROUTES: Final[dict[str, tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]]] = {",
+    ]
+    for operation_id, route in sorted(compile_routes(spec).items()):
+        lines.append(f"    {_literal(operation_id)}: {_literal(route)},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def main() -> None:
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else ROOT / "openapi.json"
+    target = Path(sys.argv[2]) if len(sys.argv) > 2 else ROOT / "src" / "proschedio_vultr" / "routes.py"
+    spec = json.loads(source.read_text(encoding="utf-8"))
+    target.write_text(render(spec), encoding="utf-8")
+    print(f"Wrote {len(compile_routes(spec))} routes to {target}")
+
+if __name__ == "__main__":
+    main()
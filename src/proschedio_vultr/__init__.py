@@ -1,27 +1,164 @@
-from .actions import Action
-from .models import (
-    bare_metal,
-    cdns,
-    container,
-    database,
-    dns,
-    firewall,
-    instance,
-    kubenetes,
-    load_balancer,
-    object_storage,
-    reserved_ips,
-    snapshots,
-    startup_script,
-    subaccount,
-    users,
-    vfs,
-    vpc2,
-    vpcs
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .actions import Action
+    from .breaker import CircuitBreaker
+    from ._bulk import Bulk, BulkReport, bulk
+    from .cache import CATALOG_TTLS, ResponseCache
+    from .catalog import PlanIndex
+    from .client import Client
+    from .coalesce import RequestCoalescer
+    from .hedging import HedgePolicy
+    from .metrics import MetricsRegistry
+    from .credentials import EnvCredentials, KeyPool, StaticCredentials, use_api_key
+    from .offload import DecodeOffload
+    from .pagination import Paginator, paginate
+    from .ratelimit import FileBackend, MemoryBackend, RateLimiter
+    from .retry import RetryPolicy
+    from .routing import Route, route
+    from .scheduler import PriorityScheduler, use_priority
+    from .snapshot import CatalogSnapshot, SnapshotStore
+    from .sync import SyncClient
+    from .timeouts import TimeoutPolicy, Timeouts, deadline
+    from .tracing import RequestTracer
+    from .validation import Validator, compile_validator
+    from .models import (
+        bare_metal,
+        cdns,
+        container,
+        database,
+        dns,
+        firewall,
+        instance,
+        kubenetes,
+        load_balancer,
+        object_storage,
+        reserved_ips,
+        snapshots,
+        startup_script,
+        subaccount,
+        users,
+        vfs,
+        vpc2,
+        vpcs
+    )
+
+_EXPORTS: dict[str, str] = {
+    "Action": ".actions",
+    "CircuitBreaker": ".breaker",
+    # `bulk()` lives in `._bulk`: a public `bulk` submodule would be bound as the package
+    # attribute on import and shadow the function.
+    "Bulk": "._bulk",
+    "BulkReport": "._bulk",
+    "bulk": "._bulk",
+    "CATALOG_TTLS": ".cache",
+    "ResponseCache": ".cache",
+    "PlanIndex": ".catalog",
+    "Client": ".client",
+    "RequestCoalescer": ".coalesce",
+    "HedgePolicy": ".hedging",
+    "MetricsRegistry": ".metrics",
+    "EnvCredentials": ".credentials",
+    "KeyPool": ".credentials",
+    "StaticCredentials": ".credentials",
+    "use_api_key": ".credentials",
+    "DecodeOffload": ".offload",
+    "Paginator": ".pagination",
+    "paginate": ".pagination",
+    "FileBackend": ".ratelimit",
+    "MemoryBackend": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "Route": ".routing",
+    "route": ".routing",
+    "PriorityScheduler": ".scheduler",
+    "use_priority": ".scheduler",
+    "CatalogSnapshot": ".snapshot",
+    "SnapshotStore": ".snapshot",
+    "SyncClient": ".sync",
+    "TimeoutPolicy": ".timeouts",
+    "Timeouts": ".timeouts",
+    "deadline": ".timeouts",
+    "RequestTracer": ".tracing",
+    "Validator": ".validation",
+    "compile_validator": ".validation",
+}
+"""Public name -> defining module. Nothing below is imported until it is first accessed."""
+
+_MODELS: frozenset[str] = frozenset({
+    "bare_metal",
+    "cdns",
+    "container",
+    "database",
+    "dns",
+    "firewall",
+    "instance",
+    "kubenetes",
+    "load_balancer",
+    "object_storage",
+    "reserved_ips",
+    "snapshots",
+    "startup_script",
+    "subaccount",
+    "users",
+    "vfs",
+    "vpc2",
+    "vpcs",
+})
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _MODELS:
+        value = importlib.import_module(f".models.{name}", __name__)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
 __all__ = [
     "Action",
+    "Bulk",
+    "BulkReport",
+    "bulk",
+    "CATALOG_TTLS",
+    "CatalogSnapshot",
+    "CircuitBreaker",
+    "Client",
+    "DecodeOffload",
+    "EnvCredentials",
+    "FileBackend",
+    "HedgePolicy",
+    "KeyPool",
+    "MemoryBackend",
+    "MetricsRegistry",
+    "Paginator",
+    "paginate",
+    "PlanIndex",
+    "PriorityScheduler",
+    "use_priority",
+    "RateLimiter",
+    "RequestCoalescer",
+    "RequestTracer",
+    "ResponseCache",
+    "RetryPolicy",
+    "Route",
+    "route",
+    "SnapshotStore",
+    "StaticCredentials",
+    "SyncClient",
+    "use_api_key",
+    "TimeoutPolicy",
+    "Timeouts",
+    "deadline",
+    "Validator",
+    "compile_validator",
     "bare_metal",
     "cdns",
     "container",
@@ -40,4 +177,4 @@ __all__ = [
     "vfs",
     "vpc2",
     "vpcs"
-]
\ No newline at end of file
+]
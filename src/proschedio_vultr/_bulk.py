@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import TypedDict
+
+from rustipy.result import Err, Result
+
+from .request import ErrorResponse, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+ItemMethod = Callable[..., Awaitable[Result[SuccessResponse, ErrorResponse]]]
+
+class BulkFailure(TypedDict):
+    index: int
+    item: str
+    error: ErrorResponse
+
+class BulkReport(TypedDict):
+    results: list[Result[SuccessResponse, ErrorResponse]]
+    succeeded: int
+    failures: list[BulkFailure]
+    cancelled: int
+
+def _cancelled() -> Result[SuccessResponse, ErrorResponse]:
+    return Err(ErrorResponse(status_code=0, error="Cancelled"))
+
+class Bulk:
+    """
+    Run one action method for every id in a list with at most `concurrency` calls in flight.
+
+    ```python
+    bulk = Bulk(Action.instance().get_bandwidth, instance_ids, None, concurrency=10)
+    report = await bulk.run()
+    for failure in report["failures"]:
+        ...
+    ```
+
+    The id is passed as the first argument of `method`, followed by `*args` and `**kwargs`.
+    `stream()` yields `(index, result)` pairs in completion order; `run()` collects them in input
+    order. Items that never ran because of `cancel()` or `stop_on_error` resolve to an
+    `Err(ErrorResponse(status_code=0, error="Cancelled"))`.
+    """
+    def __init__(
+        self,
+        method: ItemMethod,
+        items: Sequence[str],
+        *args: object,
+        concurrency: int = 8,
+        stop_on_error: bool = False,
+        **kwargs: object,
+    ):
+        """
+        Args:
+            method (ItemMethod): The action method to call for each item, e.g. `Instance.get`.
+            items (Sequence[str]): The ids to fan out over.
+            *args (object): Extra positional arguments passed after the id.
+            concurrency (int): Maximum number of calls in flight.
+            stop_on_error (bool): Cancel the remaining items after the first `Err`.
+            **kwargs (object): Extra keyword arguments passed to `method`.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self._method = method
+        self._items = items
+        self._args = args
+        self._kwargs = kwargs
+        self._concurrency = concurrency
+        self._stop_on_error = stop_on_error
+        self._cancelled = False
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """
+        Stop starting new items and cancel the calls currently in flight.
+        """
+        self._cancelled = True
+        current = asyncio.current_task()
+        for worker in self._workers:
+            if worker is not current:
+                worker.cancel()
+
+    async def _call(self, item: str) -> Result[SuccessResponse, ErrorResponse]:
+        try:
+            return await self._method(item, *self._args, **self._kwargs)
+        except Exception as e:
+            logger.error("Bulk call for %s raised: %s", item, e, exc_info=True)
+            return Err(ErrorResponse(status_code=0, error=f"Unexpected error: {e}"))
+
+    async def stream(self) -> AsyncIterator[tuple[int, Result[SuccessResponse, ErrorResponse]]]:
+        """
+        Yield `(index, result)` pairs as calls complete.
+        """
+        self._cancelled = False
+        queue: asyncio.Queue[tuple[int, Result[SuccessResponse, ErrorResponse]] | None] = asyncio.Queue()
+        indices = iter(range(len(self._items)))
+
+        async def worker() -> None:
+            try:
+                for index in indices:
+                    if self._cancelled:
+                        return
+                    result = await self._call(self._items[index])
+                    queue.put_nowait((index, result))
+                    if self._stop_on_error and result.is_err():
+                        self.cancel()
+                        return
+            finally:
+                queue.put_nowait(None)
+
+        self._workers = [asyncio.create_task(worker()) for _ in range(min(self._concurrency, len(self._items)))]
+        remaining = len(self._workers)
+        try:
+            while remaining:
+                entry = await queue.get()
+                if entry is None:
+                    remaining -= 1
+                    continue
+                yield entry
+        finally:
+            for task in self._workers:
+                task.cancel()
+            self._workers = []
+
+    async def run(self) -> BulkReport:
+        """
+        Run every item and collect the results in input order.
+
+        Returns:
+            BulkReport: Per-item results plus a summary of failures and cancelled items.
+        """
+        results: list[Result[SuccessResponse, ErrorResponse] | None] = [None] * len(self._items)
+        async for index, result in self.stream():
+            results[index] = result
+
+        report = BulkReport(results=[], succeeded=0, failures=[], cancelled=0)
+        for index, result in enumerate(results):
+            if result is None:
+                result = _cancelled()
+                report["cancelled"] += 1
+            elif result.is_ok():
+                report["succeeded"] += 1
+            else:
+                report["failures"].append(BulkFailure(index=index, item=self._items[index], error=result.unwrap_err()))
+            report["results"].append(result)
+
+        if report["failures"] or report["cancelled"]:
+            logger.info(
+                "Bulk run finished: %d succeeded, %d failed, %d cancelled",
+                report["succeeded"], len(report["failures"]), report["cancelled"],
+            )
+        return report
+
+async def bulk(
+    method: ItemMethod,
+    items: Sequence[str],
+    *args: object,
+    concurrency: int = 8,
+    stop_on_error: bool = False,
+    **kwargs: object,
+) -> BulkReport:
+    """
+    Shorthand for `await Bulk(method, items, *args, ...).run()`.
+    """
+    return await Bulk(method, items, *args, concurrency=concurrency, stop_on_error=stop_on_error, **kwargs).run()
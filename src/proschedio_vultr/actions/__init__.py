@@ -1,156 +1,241 @@
-from .instance import Instance
-from .block_storage import BlockStorage
-from .database import Database
-from .account import Account
-from .applications import Applications
-from .backups import Backups
-from .bare_metal import BareMetal
-from .billings import Billing
-from .cdns import CDNs
-from .container_registry import ContainerRegistry
-from .dns import DNS
-from .firewall import Firewall
-from .inference import Inference
-from .iso import Iso
-from .kubernetes import Kubernetes
-from .load_balancers import LoadBalancers
-from .marketplace import Marketplace
-from .object_storage import ObjectStorage
-from .operating_systems import OperatingSystems
-from .plans import Plans
-from .plans_metal import PlansMetal
-from .regions import Regions
-from .reserved_ips import ReservedIPs
-from .snapshots import Snapshots
-from .ssh_keys import SSHKeys
-from .startup_script import StartupScript
-from .subaccounts import Subaccounts
-from .users import Users
-from .vfs import VFS
-from .vpc2 import VPC2
-from .vpcs import VPCs
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .instance import Instance
+    from .block_storage import BlockStorage
+    from .database import Database
+    from .account import Account
+    from .applications import Applications
+    from .backups import Backups
+    from .bare_metal import BareMetal
+    from .billings import Billing
+    from .cdns import CDNs
+    from .container_registry import ContainerRegistry
+    from .dns import DNS
+    from .firewall import Firewall
+    from .inference import Inference
+    from .iso import Iso
+    from .kubernetes import Kubernetes
+    from .load_balancers import LoadBalancers
+    from .marketplace import Marketplace
+    from .object_storage import ObjectStorage
+    from .operating_systems import OperatingSystems
+    from .plans import Plans
+    from .plans_metal import PlansMetal
+    from .regions import Regions
+    from .reserved_ips import ReservedIPs
+    from .snapshots import Snapshots
+    from .ssh_keys import SSHKeys
+    from .startup_script import StartupScript
+    from .subaccounts import Subaccounts
+    from .users import Users
+    from .vfs import VFS
+    from .vpc2 import VPC2
+    from .vpcs import VPCs
+
+_CLASSES: dict[str, str] = {
+    "Instance": "instance",
+    "BlockStorage": "block_storage",
+    "Database": "database",
+    "Account": "account",
+    "Applications": "applications",
+    "Backups": "backups",
+    "BareMetal": "bare_metal",
+    "Billing": "billings",
+    "CDNs": "cdns",
+    "ContainerRegistry": "container_registry",
+    "DNS": "dns",
+    "Firewall": "firewall",
+    "Inference": "inference",
+    "Iso": "iso",
+    "Kubernetes": "kubernetes",
+    "LoadBalancers": "load_balancers",
+    "Marketplace": "marketplace",
+    "ObjectStorage": "object_storage",
+    "OperatingSystems": "operating_systems",
+    "Plans": "plans",
+    "PlansMetal": "plans_metal",
+    "Regions": "regions",
+    "ReservedIPs": "reserved_ips",
+    "Snapshots": "snapshots",
+    "SSHKeys": "ssh_keys",
+    "StartupScript": "startup_script",
+    "Subaccounts": "subaccounts",
+    "Users": "users",
+    "VFS": "vfs",
+    "VPC2": "vpc2",
+    "VPCs": "vpcs",
+}
+"""Action class name -> defining module. Modules are imported on first access."""
+
+def __getattr__(name: str) -> object:
+    module = _CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_CLASSES})
 
 class Action:
+    """
+    Entry point to every action group. Each accessor imports its module on first use, so
+    `Action.instance()` never loads the other thirty action modules.
+    """
     @staticmethod
-    def instance() -> Instance:
+    def instance() -> 'Instance':
+        from .instance import Instance
         return Instance()
-    
+
     @staticmethod
-    def block_storage() -> BlockStorage:
+    def block_storage() -> 'BlockStorage':
+        from .block_storage import BlockStorage
         return BlockStorage()
-    
+
     @staticmethod
-    def database() -> Database:
+    def database() -> 'Database':
+        from .database import Database
         return Database()
 
     @staticmethod
-    def account() -> Account:
+    def account() -> 'Account':
+        from .account import Account
         return Account()
 
     @staticmethod
-    def applications() -> Applications:
+    def applications() -> 'Applications':
+        from .applications import Applications
         return Applications()
 
     @staticmethod
-    def backups() -> Backups:
+    def backups() -> 'Backups':
+        from .backups import Backups
         return Backups()
 
     @staticmethod
-    def bare_metal() -> BareMetal:
+    def bare_metal() -> 'BareMetal':
+        from .bare_metal import BareMetal
         return BareMetal()
 
     @staticmethod
-    def billings() -> Billing:
+    def billings() -> 'Billing':
+        from .billings import Billing
         return Billing()
 
     @staticmethod
-    def cdns() -> CDNs:
+    def cdns() -> 'CDNs':
+        from .cdns import CDNs
         return CDNs()
 
     @staticmethod
-    def container_registry() -> ContainerRegistry:
+    def container_registry() -> 'ContainerRegistry':
+        from .container_registry import ContainerRegistry
         return ContainerRegistry()
 
     @staticmethod
-    def dns() -> DNS:
+    def dns() -> 'DNS':
+        from .dns import DNS
         return DNS()
 
     @staticmethod
-    def firewall() -> Firewall:
+    def firewall() -> 'Firewall':
+        from .firewall import Firewall
         return Firewall()
 
     @staticmethod
-    def inference() -> Inference:
+    def inference() -> 'Inference':
+        from .inference import Inference
         return Inference()
 
     @staticmethod
-    def iso() -> Iso:
+    def iso() -> 'Iso':
+        from .iso import Iso
         return Iso()
 
     @staticmethod
-    def kubernetes() -> Kubernetes:
+    def kubernetes() -> 'Kubernetes':
+        from .kubernetes import Kubernetes
         return Kubernetes()
 
     @staticmethod
-    def load_balancers() -> LoadBalancers:
+    def load_balancers() -> 'LoadBalancers':
+        from .load_balancers import LoadBalancers
         return LoadBalancers()
 
     @staticmethod
-    def marketplace() -> Marketplace:
+    def marketplace() -> 'Marketplace':
+        from .marketplace import Marketplace
         return Marketplace()
 
     @staticmethod
-    def object_storage() -> ObjectStorage:
+    def object_storage() -> 'ObjectStorage':
+        from .object_storage import ObjectStorage
         return ObjectStorage()
 
     @staticmethod
-    def operating_systems() -> OperatingSystems:
+    def operating_systems() -> 'OperatingSystems':
+        from .operating_systems import OperatingSystems
         return OperatingSystems()
 
     @staticmethod
-    def plans() -> Plans:
+    def plans() -> 'Plans':
+        from .plans import Plans
         return Plans()
 
     @staticmethod
-    def plans_metal() -> PlansMetal:
+    def plans_metal() -> 'PlansMetal':
+        from .plans_metal import PlansMetal
         return PlansMetal()
 
     @staticmethod
-    def regions() -> Regions:
+    def regions() -> 'Regions':
+        from .regions import Regions
         return Regions()
 
     @staticmethod
-    def reserved_ips() -> ReservedIPs:
+    def reserved_ips() -> 'ReservedIPs':
+        from .reserved_ips import ReservedIPs
         return ReservedIPs()
 
     @staticmethod
-    def snapshots() -> Snapshots:
+    def snapshots() -> 'Snapshots':
+        from .snapshots import Snapshots
         return Snapshots()
 
     @staticmethod
-    def ssh_keys() -> SSHKeys:
+    def ssh_keys() -> 'SSHKeys':
+        from .ssh_keys import SSHKeys
         return SSHKeys()
 
     @staticmethod
-    def startup_script() -> StartupScript:
+    def startup_script() -> 'StartupScript':
+        from .startup_script import StartupScript
         return StartupScript()
 
     @staticmethod
-    def subaccounts() -> Subaccounts:
+    def subaccounts() -> 'Subaccounts':
+        from .subaccounts import Subaccounts
         return Subaccounts()
 
     @staticmethod
-    def users() -> Users:
+    def users() -> 'Users':
+        from .users import Users
         return Users()
 
     @staticmethod
-    def vfs() -> VFS:
+    def vfs() -> 'VFS':
+        from .vfs import VFS
         return VFS()
 
     @staticmethod
-    def vpc2() -> VPC2:
+    def vpc2() -> 'VPC2':
+        from .vpc2 import VPC2
         return VPC2()
 
     @staticmethod
-    def vpcs() -> VPCs:
-        return VPCs()
\ No newline at end of file
+    def vpcs() -> 'VPCs':
+        from .vpcs import VPCs
+        return VPCs()
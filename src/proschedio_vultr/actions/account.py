@@ -1,5 +1,3 @@
-import os
-
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -20,7 +18,7 @@ class Account:
         return (
             await Request(URL_ACCOUNT.to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -36,6 +34,6 @@ class Account:
         return (
             await Request(URL_ACCOUNT_BANDWIDTH.to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
\ No newline at end of file
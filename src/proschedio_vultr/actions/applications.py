@@ -1,4 +1,3 @@
-import os
 from http import HTTPMethod
 from typing import Literal
 
@@ -28,7 +27,7 @@ class Applications: # Renamed class from BlockStorage to Applications
 
         request = Request(URL_APPLICATIONS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if type is not None:
             request.add_param("type", type)
@@ -1,4 +1,3 @@
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -26,7 +25,7 @@ class Backups:
         """
         request = (Request(URL_BACKUPS.to_str())
             .set_method(HTTPMethod.GET)
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}"))
+            .authorize())
 
         if instance_id is not None:
             request.add_param("instance_id", instance_id)
@@ -51,6 +50,6 @@ class Backups:
         return (
             await Request(URL_BACKUPS_ID.assign("backup-id", backup_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
\ No newline at end of file
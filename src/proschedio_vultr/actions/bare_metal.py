@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 from typing import Literal, Any # Added Any for flexibility
 
@@ -43,7 +41,7 @@ class BareMetal:
         request = (
             Request(URL_BARE_METAL.to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if per_page is not None:
@@ -69,9 +67,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL.to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(body_dict))
+                .set_json(body_dict)
                 .request()
         )
 
@@ -89,7 +87,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_ID.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -110,9 +108,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_ID.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.PATCH)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(body_dict))
+                .set_json(body_dict)
                 .request()
         )
 
@@ -130,7 +128,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_ID.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.DELETE)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -148,7 +146,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_IPV4.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -166,7 +164,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_IPV6.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -187,9 +185,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_IPV4_REVERSE.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(body_dict))
+                .set_json(body_dict)
                 .request()
         )
 
@@ -210,9 +208,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_IPV6_REVERSE.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(body_dict))
+                .set_json(body_dict)
                 .request()
         )
 
@@ -231,9 +229,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_IPV4_REVERSE_DEFAULT.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"ip": ip})) # Use json.dumps
+                .set_json({"ip": ip})
                 .request()
         )
 
@@ -252,7 +250,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_IPV6_REVERSE_IPV6.assign("baremetal-id", baremetal_id).assign("ipv6", ipv6).to_str())
                 .set_method(HTTPMethod.DELETE)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -270,7 +268,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_START.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -288,7 +286,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_REBOOT.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -307,14 +305,14 @@ class BareMetal:
         request = (
             Request(URL_BARE_METAL_REINSTALL.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
         )
 
-        body_dict = {}
+        body_dict: dict[str, object] = {}
         if hostname is not None:
             body_dict["hostname"] = hostname
-        request.set_body(json.dumps(body_dict)) # Send empty JSON {} if hostname is None
+        request.set_json(body_dict) # Send empty JSON {} if hostname is None
 
         return await request.request()
 
@@ -332,7 +330,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_HALT.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -350,7 +348,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METAL_BANDWIDTH.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -368,9 +366,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_HALT.to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"baremetal_ids": baremetal_ids}))
+                .set_json({"baremetal_ids": baremetal_ids})
                 .request()
         )
 
@@ -388,9 +386,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_REBOOT.to_str()) # Corrected URL
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"baremetal_ids": baremetal_ids}))
+                .set_json({"baremetal_ids": baremetal_ids})
                 .request()
         )
 
@@ -408,9 +406,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_START.to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"baremetal_ids": baremetal_ids}))
+                .set_json({"baremetal_ids": baremetal_ids})
                 .request()
         )
 
@@ -428,7 +426,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_USER_DATA.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -447,7 +445,7 @@ class BareMetal:
         request = (
             Request(URL_BARE_METALS_ID_AVAILABLE_UPGRADES.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if type is not None:
@@ -469,7 +467,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_ID_VNC.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -488,9 +486,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_ATTACH_VPC_TO_INSTANCE.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"vpc_id": vpc_id})) # Use json.dumps
+                .set_json({"vpc_id": vpc_id})
                 .request()
         )
 
@@ -509,9 +507,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_DETACH_VPC_FROM_INSTANCE.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"vpc_id": vpc_id})) # Use json.dumps
+                .set_json({"vpc_id": vpc_id})
                 .request()
         )
 
@@ -529,7 +527,7 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_VPCS.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -546,7 +544,7 @@ class BareMetal:
         Returns:
             Result[SuccessResponse, ErrorResponse]: The result of the API request.
         """
-        body = {}
+        body: dict[str, object] = {}
 
         if vpc_id is not None:
             body["vpc_id"] = vpc_id
@@ -557,9 +555,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_ATTACH_VPC2_TO_INSTANCE.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(body)) # Use json.dumps
+                .set_json(body)
                 .request()
         )
 
@@ -578,9 +576,9 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_DETACH_VPC2_FROM_INSTANCE.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"vpc_id": vpc_id})) # Use json.dumps
+                .set_json({"vpc_id": vpc_id})
                 .request()
         )
 
@@ -598,6 +596,6 @@ class BareMetal:
         return (
             await Request(URL_BARE_METALS_VPCS2.assign("baremetal-id", baremetal_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
\ No newline at end of file
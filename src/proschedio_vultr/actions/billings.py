@@ -1,4 +1,3 @@
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -25,7 +24,7 @@ class Billing:
         request = (
             Request(URL_BILLING_LIST_HISTORY.to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if per_page is not None:
@@ -49,7 +48,7 @@ class Billing:
         request = (
             Request(URL_BILLING_INVOICES.to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if per_page is not None:
@@ -72,7 +71,7 @@ class Billing:
         return (
             await Request(URL_BILLING_INVOICE_ID.assign("invoice-id", invoice_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -91,7 +90,7 @@ class Billing:
         request = (
             Request(URL_BILLING_INVOICE_ID_ITEMS.assign("invoice-id", invoice_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if per_page is not None:
@@ -111,6 +110,6 @@ class Billing:
         return (
             await Request(URL_BILLING_LIST_PENDING_CHARGES.to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
\ No newline at end of file
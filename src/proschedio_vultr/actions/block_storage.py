@@ -1,6 +1,3 @@
-import json
-import os
-
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -23,7 +20,7 @@ class BlockStorage:
         """
         request = (Request(URL_BLOCK_STORAGE.to_str())
             .set_method(HTTPMethod.GET)
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}"))
+            .authorize())
 
         if per_page is not None:
             request.add_param("per_page", per_page)
@@ -50,9 +47,9 @@ class BlockStorage:
         return (
             await Request(URL_BLOCK_STORAGE.to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({k: v for k, v in {"region": region, "size_gb": size_gb, "label": label, "block_type": block_type}.items() if v is not None}))
+                .set_json({k: v for k, v in {"region": region, "size_gb": size_gb, "label": label, "block_type": block_type}.items() if v is not None})
                 .request()
         )
 
@@ -70,7 +67,7 @@ class BlockStorage:
         return (
             await Request(URL_BLOCK_STORAGE_ID.assign("block-id", block_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -91,9 +88,9 @@ class BlockStorage:
         return (
             await Request(URL_BLOCK_STORAGE_ID.assign("block-id", block_id).to_str())
                 .set_method(HTTPMethod.PATCH)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({k: v for k, v in {"label": label, "size_gb": size_gb}.items() if v is not None}))
+                .set_json({k: v for k, v in {"label": label, "size_gb": size_gb}.items() if v is not None})
                 .request()
         )
 
@@ -111,7 +108,7 @@ class BlockStorage:
         return (
             await Request(URL_BLOCK_STORAGE_ID.assign("block-id", block_id).to_str())
                 .set_method(HTTPMethod.DELETE)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
 
@@ -132,9 +129,9 @@ class BlockStorage:
         return (
             await Request(URL_BLOCK_STORAGE_ATTACH.assign("block-id", block_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({k: v for k, v in {"instance_id": instance_id, "live": live}.items() if v is not None}))
+                .set_json({k: v for k, v in {"instance_id": instance_id, "live": live}.items() if v is not None})
                 .request()
         )
 
@@ -154,8 +151,8 @@ class BlockStorage:
         return (
             await Request(URL_BLOCK_STORAGE_DETACH.assign("block-id", block_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({k: v for k, v in {"live": live}.items() if v is not None}))
+                .set_json({k: v for k, v in {"live": live}.items() if v is not None})
                 .request()
         )
\ No newline at end of file
@@ -1,10 +1,8 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
 
-from ..models.cdns import CreatePullZoneConfig, CreatePushZoneConfig, UpdatePullZoneConfig, UpdatePushZoneConfig
+from ..models.cdns import CreatePullZoneConfig, CreatePushZoneConfig, CreatePushZoneFileConfig, UpdatePullZoneConfig, UpdatePushZoneConfig
 from ..request import Request, SuccessResponse, ErrorResponse
 from ..urls import (
     URL_CDN_LIST_PULL_ZONES, URL_CDN_PULL_ZONE_ID, URL_CDN_PULL_ZONE_PURGE,
@@ -23,7 +21,7 @@ class CDNs:
         """
         return await Request(URL_CDN_LIST_PULL_ZONES.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -40,9 +38,9 @@ class CDNs:
 
         return await Request(URL_CDN_LIST_PULL_ZONES.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreatePullZoneConfig) \
             .request()
 
     @staticmethod
@@ -58,7 +56,7 @@ class CDNs:
         """
         return await Request(URL_CDN_PULL_ZONE_ID.assign("pullzone-id", pullzone_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -76,9 +74,9 @@ class CDNs:
 
         return await Request(URL_CDN_PULL_ZONE_ID.assign("pullzone-id", pullzone_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdatePullZoneConfig) \
             .request()
 
     @staticmethod
@@ -94,7 +92,7 @@ class CDNs:
         """
         return await Request(URL_CDN_PULL_ZONE_ID.assign("pullzone-id", pullzone_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -110,9 +108,9 @@ class CDNs:
         """
         return await Request(URL_CDN_PULL_ZONE_PURGE.assign("pullzone-id", pullzone_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({})) \
+            .set_json({}) \
             .request()
 
     @staticmethod
@@ -125,7 +123,7 @@ class CDNs:
         """
         return await Request(URL_CDN_PUSH_ZONES.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -142,9 +140,9 @@ class CDNs:
 
         return await Request(URL_CDN_PUSH_ZONES.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreatePushZoneConfig) \
             .request()
 
     @staticmethod
@@ -160,7 +158,7 @@ class CDNs:
         """
         return await Request(URL_CDN_PUSH_ZONE_ID.assign("pushzone-id", pushzone_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -178,9 +176,9 @@ class CDNs:
 
         return await Request(URL_CDN_PUSH_ZONE_ID.assign("pushzone-id", pushzone_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdatePushZoneConfig) \
             .request()
 
     @staticmethod
@@ -196,7 +194,7 @@ class CDNs:
         """
         return await Request(URL_CDN_PUSH_ZONE_ID.assign("pushzone-id", pushzone_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -212,17 +210,17 @@ class CDNs:
         """
         return await Request(URL_CDN_PUSH_ZONE_FILES.assign("pushzone-id", pushzone_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
-    async def create_cdn_push_zone_file(pushzone_id: str, data: CreatePushZoneConfig) -> Result[SuccessResponse, ErrorResponse]:
+    async def create_cdn_push_zone_file(pushzone_id: str, data: CreatePushZoneFileConfig) -> Result[SuccessResponse, ErrorResponse]:
         """
         Create a presigned post endpoint that can be used to upload a file to your Push Zone.
 
         Args:
             pushzone_id (str): The Push Zone ID.
-            data (CreatePushZoneConfig): The data to create the file.
+            data (CreatePushZoneFileConfig): The data to create the file.
 
         Returns:
             Result[SuccessResponse, ErrorResponse]: The result of the API request.
@@ -230,9 +228,9 @@ class CDNs:
 
         return await Request(URL_CDN_PUSH_ZONE_FILES.assign("pushzone-id", pushzone_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreatePushZoneFileConfig) \
             .request()
 
     @staticmethod
@@ -249,7 +247,7 @@ class CDNs:
         """
         return await Request(URL_CDN_PUSH_ZONE_FILE.assign("pushzone-id", pushzone_id).assign("file-name", file_name).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -266,5 +264,5 @@ class CDNs:
         """
         return await Request(URL_CDN_PUSH_ZONE_FILE.assign("pushzone-id", pushzone_id).assign("file-name", file_name).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
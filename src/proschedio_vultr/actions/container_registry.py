@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -29,7 +27,7 @@ class ContainerRegistry:
         """
         request = Request(URL_CONTAINER_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -52,9 +50,9 @@ class ContainerRegistry:
 
         return await Request(URL_CONTAINER.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateContainerRegistryConfig) \
             .request()
 
     @staticmethod
@@ -70,7 +68,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ID.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -88,9 +86,9 @@ class ContainerRegistry:
 
         return await Request(URL_CONTAINER_ID.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateContainerRegistryConfig) \
             .request()
 
     @staticmethod
@@ -106,7 +104,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ID.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -122,7 +120,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_REPOSITORY.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -139,7 +137,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_REPOSITORY_IMAGE.assign("registry-id", registry_id).assign("repository-image", repository_image).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -158,9 +156,9 @@ class ContainerRegistry:
 
         return await Request(URL_CONTAINER_REPOSITORY_IMAGE.assign("registry-id", registry_id).assign("repository-image", repository_image).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateContainerRepositoryConfig) \
             .request()
 
     @staticmethod
@@ -177,7 +175,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_REPOSITORY_IMAGE.assign("registry-id", registry_id).assign("repository-image", repository_image).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -195,7 +193,7 @@ class ContainerRegistry:
         """
         request = Request(URL_CONTAINER_DOCKER_CREDENTIALS.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.OPTIONS) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if expiry_seconds is not None:
             request.add_param("expiry_seconds", str(expiry_seconds))
@@ -220,7 +218,7 @@ class ContainerRegistry:
         """
         request = Request(URL_CONTAINER_KUBERNETES_DOCKER_CREDENTIALS.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.OPTIONS) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if expiry_seconds is not None:
             request.add_param("expiry_seconds", str(expiry_seconds))
@@ -244,7 +242,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ROBOTS.assign("registry-id", registry_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -261,7 +259,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ROBOT.assign("registry-id", registry_id).assign("robot-name", robot_name).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -280,9 +278,9 @@ class ContainerRegistry:
 
         return await Request(URL_CONTAINER_ROBOT.assign("registry-id", registry_id).assign("robot-name", robot_name).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateContainerRobotConfig) \
             .request()
 
     @staticmethod
@@ -299,7 +297,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ROBOT.assign("registry-id", registry_id).assign("robot-name", robot_name).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -316,7 +314,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ARTIFACTS.assign("registry-id", registry_id).assign("repository-image", repository_image).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -334,7 +332,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ARTIFACT.assign("registry-id", registry_id).assign("repository-image", repository_image).assign("artifact-digest", artifact_digest).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -352,7 +350,7 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_ARTIFACT.assign("registry-id", registry_id).assign("repository-image", repository_image).assign("artifact-digest", artifact_digest).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -365,5 +363,5 @@ class ContainerRegistry:
         """
         return await Request(URL_CONTAINER_LIST_REGIONS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 from typing import Literal
 
@@ -40,7 +38,7 @@ class Database:
         """
         request = Request(URL_DATABASE_LIST_PLANS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if engine is not None:
             request.add_param("engine", engine)
@@ -66,7 +64,7 @@ class Database:
         """
         request = Request(URL_DATABASE_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if label is not None:
             request.add_param("label", label)
@@ -91,9 +89,9 @@ class Database:
 
         return await Request(URL_DATABASE_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDatabaseConfig) \
             .request()
 
     @staticmethod
@@ -109,7 +107,7 @@ class Database:
         """
         return await Request(URL_DATABASE_ID.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -127,9 +125,9 @@ class Database:
 
         return await Request(URL_DATABASE_ID.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateDatabaseConfig) \
             .request()
 
     @staticmethod
@@ -145,7 +143,7 @@ class Database:
         """
         return await Request(URL_DATABASE_ID.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -161,7 +159,7 @@ class Database:
         """
         return await Request(URL_DATABASE_USAGE.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -177,7 +175,7 @@ class Database:
         """
         return await Request(URL_DATABASE_USERS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -195,9 +193,9 @@ class Database:
 
         return await Request(URL_DATABASE_USERS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDatabaseUserConfig) \
             .request()
 
     @staticmethod
@@ -214,7 +212,7 @@ class Database:
         """
         return await Request(URL_DATABASE_USER.assign("database-id", database_id).assign("username", username).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -235,9 +233,9 @@ class Database:
         
         return await Request(URL_DATABASE_USER.assign("database-id", database_id).assign("username", username).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data) \
             .request()
 
     @staticmethod
@@ -254,7 +252,7 @@ class Database:
         """
         return await Request(URL_DATABASE_USER.assign("database-id", database_id).assign("username", username).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -273,9 +271,9 @@ class Database:
 
         return await Request(URL_DATABASE_USER_ACCESS_CONTROL.assign("database-id", database_id).assign("username", username).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateDatabaseUserAccessControlConfig) \
             .request()
 
     @staticmethod
@@ -291,7 +289,7 @@ class Database:
         """
         return await Request(URL_DATABASE_LOGICAL_DATABASES.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -311,9 +309,9 @@ class Database:
 
         return await Request(URL_DATABASE_LOGICAL_DATABASES.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data) \
             .request()
 
     @staticmethod
@@ -330,7 +328,7 @@ class Database:
         """
         return await Request(URL_DATABASE_LOGICAL_DATABASE.assign("database-id", database_id).assign("db-name", db_name).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -347,7 +345,7 @@ class Database:
         """
         return await Request(URL_DATABASE_LOGICAL_DATABASE.assign("database-id", database_id).assign("db-name", db_name).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -363,7 +361,7 @@ class Database:
         """
         return await Request(URL_DATABASE_TOPICS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -381,9 +379,9 @@ class Database:
 
         return await Request(URL_DATABASE_TOPICS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDatabaseTopicConfig) \
             .request()
 
     @staticmethod
@@ -400,7 +398,7 @@ class Database:
         """
         return await Request(URL_DATABASE_TOPIC.assign("database-id", database_id).assign("topic-name", topic_name).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -419,9 +417,9 @@ class Database:
 
         return await Request(URL_DATABASE_TOPIC.assign("database-id", database_id).assign("topic-name", topic_name).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateDatabaseTopicConfig) \
             .request()
 
     @staticmethod
@@ -438,7 +436,7 @@ class Database:
         """
         return await Request(URL_DATABASE_TOPIC.assign("database-id", database_id).assign("topic-name", topic_name).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -454,7 +452,7 @@ class Database:
         """
         return await Request(URL_DATABASE_QUOTAS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -472,9 +470,9 @@ class Database:
 
         return await Request(URL_DATABASE_QUOTAS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDatabaseQuotaConfig) \
             .request()
 
     @staticmethod
@@ -490,7 +488,7 @@ class Database:
         """
         return await Request(URL_DATABASE_MAINTENANCE.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -507,7 +505,7 @@ class Database:
 
         return await Request(URL_DATABASE_MAINTENANCE.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -524,7 +522,7 @@ class Database:
 
         return await Request(URL_DATABASE_MIGRATION.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -542,9 +540,9 @@ class Database:
 
         return await Request(URL_DATABASE_MIGRATION.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, StartDatabaseMigrationConfig) \
             .request()
 
     @staticmethod
@@ -561,7 +559,7 @@ class Database:
 
         return await Request(URL_DATABASE_MIGRATION.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -579,9 +577,9 @@ class Database:
 
         return await Request(URL_DATABASE_READ_REPLICA.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"region": region, "label": label})) \
+            .set_json({"region": region, "label": label}) \
             .request()
 
     @staticmethod
@@ -598,7 +596,7 @@ class Database:
 
         return await Request(URL_DATABASE_PROMOTE_READ_REPLICA.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -615,7 +613,7 @@ class Database:
 
         return await Request(URL_DATABASE_BACKUPS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -633,9 +631,9 @@ class Database:
 
         return await Request(URL_DATABASE_RESTORE.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, RestoreDatabaseFromBackupConfig) \
             .request()
 
     @staticmethod
@@ -653,9 +651,9 @@ class Database:
 
         return await Request(URL_DATABASE_FORK.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, ForkDatabaseFromBackupConfig) \
             .request()
 
     @staticmethod
@@ -672,7 +670,7 @@ class Database:
 
         return await Request(URL_DATABASE_CONNECTION_POOLS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -690,9 +688,9 @@ class Database:
 
         return await Request(URL_DATABASE_CONNECTION_POOLS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDatabaseConnectionPoolConfig) \
             .request()
 
     @staticmethod
@@ -710,7 +708,7 @@ class Database:
         
         return await Request(URL_DATABASE_CONNECTION_POOL.assign("database-id", database_id).assign("pool-name", pool_name).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -729,9 +727,9 @@ class Database:
 
         return await Request(URL_DATABASE_CONNECTION_POOL.assign("database-id", database_id).assign("pool-name", pool_name).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateDatabaseConnectionPoolConfig) \
             .request()
 
     @staticmethod
@@ -749,7 +747,7 @@ class Database:
 
         return await Request(URL_DATABASE_CONNECTION_POOL.assign("database-id", database_id).assign("pool-name", pool_name).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -766,7 +764,7 @@ class Database:
 
         return await Request(URL_DATABASE_ADVANCED_OPTIONS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -785,9 +783,9 @@ class Database:
 
         return await Request(URL_DATABASE_ADVANCED_OPTIONS.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({option_name: value})) \
+            .set_json({option_name: value}) \
             .request()
 
     @staticmethod
@@ -804,7 +802,7 @@ class Database:
 
         return await Request(URL_DATABASE_VERSION_UPGRADE.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -822,7 +820,7 @@ class Database:
 
         return await Request(URL_DATABASE_VERSION_UPGRADE.assign("database-id", database_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"version": version})) \
+            .set_json({"version": version}) \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 from typing import Literal
 
@@ -27,7 +25,7 @@ class DNS:
         """
         request = Request(URL_DOMAIN_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -50,9 +48,9 @@ class DNS:
 
         return await Request(URL_DOMAIN_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDomainConfig) \
             .request()
 
     @staticmethod
@@ -68,7 +66,7 @@ class DNS:
         """
         return await Request(URL_DOMAIN.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -86,9 +84,9 @@ class DNS:
 
         return await Request(URL_DOMAIN.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"dns_sec": dns_sec})) \
+            .set_json({"dns_sec": dns_sec}) \
             .request()
 
     @staticmethod
@@ -105,7 +103,7 @@ class DNS:
 
         return await Request(URL_DOMAIN.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -121,7 +119,7 @@ class DNS:
         """
         return await Request(URL_DOMAIN_SOA.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -139,9 +137,9 @@ class DNS:
 
         return await Request(URL_DOMAIN_SOA.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateDomainSOAConfig) \
             .request()
 
     @staticmethod
@@ -158,7 +156,7 @@ class DNS:
 
         return await Request(URL_DOMAIN_DNSSEC.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -176,7 +174,7 @@ class DNS:
         """
         request = Request(URL_DOMAIN_RECORDS.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -200,9 +198,9 @@ class DNS:
 
         return await Request(URL_DOMAIN_RECORDS.assign("dns-domain", dns_domain).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateDomainRecordConfig) \
             .request()
 
     @staticmethod
@@ -219,7 +217,7 @@ class DNS:
         """
         return await Request(URL_DOMAIN_RECORD.assign("dns-domain", dns_domain).assign("record-id", record_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -238,9 +236,9 @@ class DNS:
 
         return await Request(URL_DOMAIN_RECORD.assign("dns-domain", dns_domain).assign("record-id", record_id).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateDomainRecordConfig) \
             .request()
 
     @staticmethod
@@ -258,5 +256,5 @@ class DNS:
 
         return await Request(URL_DOMAIN_RECORD.assign("dns-domain", dns_domain).assign("record-id", record_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -26,7 +24,7 @@ class Firewall:
         """
         request = Request(URL_FIREWALL_GROUP_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -49,9 +47,9 @@ class Firewall:
 
         return await Request(URL_FIREWALL_GROUP_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"description": description})) \
+            .set_json({"description": description}) \
             .request()
 
     @staticmethod
@@ -67,7 +65,7 @@ class Firewall:
         """
         return await Request(URL_FIREWALL_GROUP_ID.assign("firewall-group-id", firewall_group_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -85,9 +83,9 @@ class Firewall:
 
         return await Request(URL_FIREWALL_GROUP_ID.assign("firewall-group-id", firewall_group_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"description": description})) \
+            .set_json({"description": description}) \
             .request()
 
     @staticmethod
@@ -103,7 +101,7 @@ class Firewall:
         """
         return await Request(URL_FIREWALL_GROUP_ID.assign("firewall-group-id", firewall_group_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -121,7 +119,7 @@ class Firewall:
         """
         request = Request(URL_FIREWALL_GROUP_RULES.assign("firewall-group-id", firewall_group_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -145,9 +143,9 @@ class Firewall:
 
         return await Request(URL_FIREWALL_GROUP_RULES.assign("firewall-group-id", firewall_group_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateFirewallRuleConfig) \
             .request()
 
     @staticmethod
@@ -164,7 +162,7 @@ class Firewall:
         """
         return await Request(URL_FIREWALL_GROUP_RULE.assign("firewall-group-id", firewall_group_id).assign("firewall-rule-id", firewall_rule_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -181,5 +179,5 @@ class Firewall:
         """
         return await Request(URL_FIREWALL_GROUP_RULE.assign("firewall-group-id", firewall_group_id).assign("firewall-rule-id", firewall_rule_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -20,7 +18,7 @@ class Inference:
         """
         return await Request(URL_INFERENCE_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -36,9 +34,9 @@ class Inference:
         """
         return await Request(URL_INFERENCE_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"label": label})) \
+            .set_json({"label": label}) \
             .request()
 
     @staticmethod
@@ -54,7 +52,7 @@ class Inference:
         """
         return await Request(URL_INFERENCE_ID.assign("inference-id", inference_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -71,9 +69,9 @@ class Inference:
         """
         return await Request(URL_INFERENCE_ID.assign("inference-id", inference_id).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"label": label})) \
+            .set_json({"label": label}) \
             .request()
 
     @staticmethod
@@ -89,7 +87,7 @@ class Inference:
         """
         return await Request(URL_INFERENCE_ID.assign("inference-id", inference_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -105,5 +103,5 @@ class Inference:
         """
         return await Request(URL_INFERENCE_USAGE.assign("inference-id", inference_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
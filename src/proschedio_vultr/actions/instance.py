@@ -1,6 +1,5 @@
 import json
 import logging
-import os
 from http import HTTPMethod
 from typing import Literal
 
@@ -30,7 +29,7 @@ class Instance:
         request = (
             Request(URL_INSTANCE_LIST.to_str()) 
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if filters is not None:
@@ -45,9 +44,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_CREATE.to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(config))
+                .set_json(config, CreateConfig)
                 .request()
         )
     @staticmethod
@@ -58,7 +57,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_BY_ID.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -69,9 +68,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_BY_ID.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.PATCH)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(data))
+                .set_json(data, UpdateConfig)
                 .request()
         )
     @staticmethod
@@ -82,7 +81,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_BY_ID.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.DELETE)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -93,12 +92,12 @@ class Instance:
         request = (
             Request(URL_INSTANCE_REINSTALL.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
         )
         
         if hostname is not None:
-            request.set_body(json.dumps({"hostname": hostname}))
+            request.set_json({"hostname": hostname})
         
         return await request.request()
     @staticmethod
@@ -109,7 +108,7 @@ class Instance:
         request = (
             Request(URL_INSTANCE_BANDWIDTH.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if date_range is not None:
@@ -124,7 +123,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_NEIGHBORS.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -135,7 +134,7 @@ class Instance:
         request = (
             Request(URL_INSTANCE_VPCS.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
         if per_page is not None:
             request.add_param("per_page", per_page)
@@ -151,7 +150,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_ISO.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -162,9 +161,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_ISO_ATTACH.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"iso_id": iso_id}))
+                .set_json({"iso_id": iso_id})
                 .request()
         )
     @staticmethod
@@ -175,8 +174,8 @@ class Instance:
         return (
             await Request(URL_INSTANCE_ISO_DETACH.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
-                .set_body(json.dumps({}))
+                .authorize()
+                .set_json({})
                 .request()
         )
     @staticmethod
@@ -187,9 +186,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_VPCS_ATTACH.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"vpc_id": vpc_id}))
+                .set_json({"vpc_id": vpc_id})
                 .request()
         )
     @staticmethod
@@ -200,9 +199,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_VPCS_DETACH.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"vpc_id": vpc_id}))
+                .set_json({"vpc_id": vpc_id})
                 .request()
         )
     @staticmethod
@@ -213,7 +212,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_BACKUP_SCHEDULE.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -224,9 +223,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_BACKUP_SCHEDULE.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps(data))
+                .set_json(data, BackupScheduleConfig)
                 .request()
         )
     @staticmethod
@@ -237,13 +236,13 @@ class Instance:
         request = (
             Request(URL_INSTANCE_RESTORE.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
         )
         if backup_id is not None:
-            request.set_body(json.dumps({"backup_id": backup_id}))
+            request.set_json({"backup_id": backup_id})
         elif snapshot_id is not None:
-            request.set_body(json.dumps({"snapshot_id": snapshot_id}))
+            request.set_json({"snapshot_id": snapshot_id})
         # else: # Consider raising an error if neither is provided
         #     raise ValueError("Either backup_id or snapshot_id must be provided for restore.")
 
@@ -256,7 +255,7 @@ class Instance:
         request = (
             Request(URL_INSTANCE_IPV4.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if public_network is not None:
@@ -275,12 +274,12 @@ class Instance:
         request = (
             Request(URL_INSTANCE_IPV4.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
         )
         
         if reboot is not None:
-            request.set_body(json.dumps({"reboot": reboot}))
+            request.set_json({"reboot": reboot})
 
         return await request.request()
     @staticmethod
@@ -291,7 +290,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_IPV6.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -302,9 +301,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_IPV4_REVERSE.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"ip": ip, "reverse": reverse}))
+                .set_json({"ip": ip, "reverse": reverse})
                 .request()
         )
     @staticmethod
@@ -315,7 +314,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_IPV6_REVERSE.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -326,9 +325,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_IPV6_REVERSE.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"ip": ip, "reverse": reverse}))
+                .set_json({"ip": ip, "reverse": reverse})
                 .request()
         )
     @staticmethod
@@ -339,9 +338,9 @@ class Instance:
         return (
             await Request(URL_INSTANCE_IPV4_REVERSE_DEFAULT.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"ip": ip}))
+                .set_json({"ip": ip})
                 .request()
         )
     @staticmethod
@@ -352,7 +351,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_IPV6_REVERSE_IPV6.assign("instance-id", instance_id).assign("ipv6", ipv6).to_str())
                 .set_method(HTTPMethod.DELETE)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -363,7 +362,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_HALT.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -374,7 +373,7 @@ class Instance:
         return (
             await Request(URL_INSTANCE_USER_DATA.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .request()
         )
     @staticmethod
@@ -385,7 +384,7 @@ class Instance:
         request = (
             Request(URL_INSTANCE_UPGRADES.assign("instance-id", instance_id).to_str())
                 .set_method(HTTPMethod.GET)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
         )
 
         if type is not None:
@@ -400,9 +399,9 @@ class Instance:
         return (
             await Request(URL_INSTANCES_REBOOT.to_str())
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"instance_ids": instance_ids}))
+                .set_json({"instance_ids": instance_ids})
                 .request()
         )
     @staticmethod
@@ -413,8 +412,8 @@ class Instance:
         return (
             await Request(URL_INSTANCES_START.to_str()) # Use the correct URL constant
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize()
                 .add_header("Content-Type", "application/json")
-                .set_body(json.dumps({"instance_ids": instance_ids}))
+                .set_json({"instance_ids": instance_ids})
                 .request()
         )
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -22,7 +20,7 @@ class Iso:
         """
         request = Request(URL_ISO_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -44,9 +42,9 @@ class Iso:
         """
         return await Request(URL_ISO_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"url": url})) \
+            .set_json({"url": url}) \
             .request()
 
     @staticmethod
@@ -62,7 +60,7 @@ class Iso:
         """
         return await Request(URL_ISO_ID.assign("iso-id", iso_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -78,7 +76,7 @@ class Iso:
         """
         return await Request(URL_ISO_ID.assign("iso-id", iso_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -91,5 +89,5 @@ class Iso:
         """
         return await Request(URL_ISO_PUBLIC_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
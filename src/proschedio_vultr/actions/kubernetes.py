@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -24,7 +22,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -55,9 +53,9 @@ class Kubernetes:
 
         return await Request(URL_KUBERNETES_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body)) \
+            .set_json(body) \
             .request()
 
     @staticmethod
@@ -73,7 +71,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_ID.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -93,9 +91,9 @@ class Kubernetes:
 
         return await Request(URL_KUBERNETES_ID.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body_dict)) \
+            .set_json(body_dict) \
             .request()
 
     @staticmethod
@@ -111,7 +109,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_ID.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -127,7 +125,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_DELETE_WITH_LINKED_RESOURCES.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -143,7 +141,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_RESOURCES.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -159,7 +157,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_AVAILABLE_UPGRADES.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -176,9 +174,9 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_UPGRADES.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"upgrade_version": upgrade_version})) \
+            .set_json({"upgrade_version": upgrade_version}) \
             .request()
 
     @staticmethod
@@ -194,7 +192,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_NODEPOOLS.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -212,9 +210,9 @@ class Kubernetes:
 
         return await Request(URL_KUBERNETES_NODEPOOLS.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, NodePoolConfig) \
             .request()
 
     @staticmethod
@@ -231,7 +229,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_NODEPOOL.assign("vke-id", vke_id).assign("nodepool-id", nodepool_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -263,9 +261,9 @@ class Kubernetes:
 
         return await Request(URL_KUBERNETES_NODEPOOL.assign("vke-id", vke_id).assign("nodepool-id", nodepool_id).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body)) \
+            .set_json(body) \
             .request()
 
     @staticmethod
@@ -282,7 +280,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_NODEPOOL.assign("vke-id", vke_id).assign("nodepool-id", nodepool_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -300,7 +298,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_NODEPOOL_INSTANCE.assign("vke-id", vke_id).assign("nodepool-id", nodepool_id).assign("node-id", node_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -318,7 +316,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_NODEPOOL_INSTANCE_RECYCLE.assign("vke-id", vke_id).assign("nodepool-id", nodepool_id).assign("node-id", node_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -334,7 +332,7 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_CONFIG.assign("vke-id", vke_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -347,5 +345,5 @@ class Kubernetes:
         """
         return await Request(URL_KUBERNETES_VERSIONS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
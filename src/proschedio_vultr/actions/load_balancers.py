@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -28,7 +26,7 @@ class LoadBalancers:
         """
         request = Request(URL_LOAD_BALANCER_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -51,9 +49,9 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_CREATE.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateLoadBalancerConfig) \
             .request()
 
     @staticmethod
@@ -70,7 +68,7 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_ID.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -88,9 +86,9 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_ID.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, UpdateLoadBalancerConfig) \
             .request()
 
     @staticmethod
@@ -107,7 +105,7 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_ID.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -124,7 +122,7 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_SSL.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -141,7 +139,7 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_AUTO_SSL.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -160,7 +158,7 @@ class LoadBalancers:
 
         request = Request(URL_LOAD_BALANCER_FORWARDING_RULES.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -184,9 +182,9 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_FORWARDING_RULES.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, ForwardingRuleConfig) \
             .request()
 
     @staticmethod
@@ -204,7 +202,7 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_FORWARDING_RULE.assign("load-balancer-id", load_balancer_id).assign("forwarding-rule-id", forwarding_rule_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -222,7 +220,7 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_FORWARDING_RULE.assign("load-balancer-id", load_balancer_id).assign("forwarding-rule-id", forwarding_rule_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -241,7 +239,7 @@ class LoadBalancers:
 
         request = Request(URL_LOAD_BALANCER_FIREWALL_RULES.assign("load-balancer-id", load_balancer_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -265,5 +263,5 @@ class LoadBalancers:
 
         return await Request(URL_LOAD_BALANCER_FIREWALL_RULE.assign("load-balancer-id", load_balancer_id).assign("firewall-rule-id", firewall_rule_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
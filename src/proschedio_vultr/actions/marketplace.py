@@ -1,4 +1,3 @@
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -20,5 +19,5 @@ class Marketplace:
         """
         return await Request(URL_MARKETPLACE_APP_VARIABLES.assign("image-id", image_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
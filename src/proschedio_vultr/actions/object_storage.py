@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -26,7 +24,7 @@ class ObjectStorage:
         """
         request = Request(URL_OBJECT_STORAGE_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -49,9 +47,9 @@ class ObjectStorage:
 
         return await Request(URL_OBJECT_STORAGE_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateConfig) \
             .request()
 
     @staticmethod
@@ -67,7 +65,7 @@ class ObjectStorage:
         """
         return await Request(URL_OBJECT_STORAGE_ID.assign("object-storage-id", object_storage_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -85,9 +83,9 @@ class ObjectStorage:
 
         return await Request(URL_OBJECT_STORAGE_ID.assign("object-storage-id", object_storage_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"label": label})) \
+            .set_json({"label": label}) \
             .request()
 
     @staticmethod
@@ -103,7 +101,7 @@ class ObjectStorage:
         """
         return await Request(URL_OBJECT_STORAGE_ID.assign("object-storage-id", object_storage_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -119,7 +117,7 @@ class ObjectStorage:
         """
         return await Request(URL_OBJECT_STORAGE_ID_REGENERATE_KEY.assign("object-storage-id", object_storage_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -136,7 +134,7 @@ class ObjectStorage:
         """
         request = Request(URL_OBJECT_STORAGE_CLUSTERS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -1,4 +1,3 @@
-import os
 from http import HTTPMethod
 # Removed Optional import
 
@@ -22,7 +21,7 @@ class PlansMetal:
         """
         request = Request(URL_PLAN_METAL.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") # Use os.environ
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page)) # Ensure param is string
@@ -1,4 +1,3 @@
-import os
 from http import HTTPMethod
 from typing import Literal
 
@@ -22,7 +21,7 @@ class Regions:
         """
         request = Request(URL_REGION.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") # Use os.environ
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page)) # Ensure param is string
@@ -61,7 +60,7 @@ class Regions:
         """
         request = Request(URL_REGION_ID_AVAILABLE.assign("region-id", region_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") # Use os.environ
+            .authorize()
 
         if type is not None:
             request.add_param("type", type)
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -26,7 +24,7 @@ class ReservedIPs:
         """
         request = Request(URL_RESERVED_IP.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -49,9 +47,9 @@ class ReservedIPs:
 
         return await Request(URL_RESERVED_IP.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateReservedIpConfig) \
             .request()
 
     @staticmethod
@@ -67,7 +65,7 @@ class ReservedIPs:
         """
         return await Request(URL_RESERVED_IP_ID.assign("reserved-ip", reserved_ip).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -84,9 +82,9 @@ class ReservedIPs:
         """
         return await Request(URL_RESERVED_IP_ID.assign("reserved-ip", reserved_ip).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"label": label})) \
+            .set_json({"label": label}) \
             .request()
 
     @staticmethod
@@ -103,7 +101,7 @@ class ReservedIPs:
 
         return await Request(URL_RESERVED_IP_ID.assign("reserved-ip", reserved_ip).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -121,9 +119,9 @@ class ReservedIPs:
 
         return await Request(URL_RESERVED_IP_ATTACH.assign("reserved-ip", reserved_ip).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"instance_id": instance_id})) \
+            .set_json({"instance_id": instance_id}) \
             .request()
 
     @staticmethod
@@ -140,7 +138,7 @@ class ReservedIPs:
 
         return await Request(URL_RESERVED_IP_DETACH.assign("reserved-ip", reserved_ip).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -158,7 +156,7 @@ class ReservedIPs:
 
         return await Request(URL_RESERVED_IP_CONVERT.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"ip_address": ip_address, "label": label})) \
+            .set_json({"ip_address": ip_address, "label": label}) \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -30,7 +28,7 @@ class Snapshots:
         """
         request = Request(URL_SNAPSHOT_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if description is not None:
             request.add_param("description", description)
@@ -56,9 +54,9 @@ class Snapshots:
 
         return await Request(URL_SNAPSHOT_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"instance_id": instance_id, "description": description})) \
+            .set_json({"instance_id": instance_id, "description": description}) \
             .request()
 
     @staticmethod
@@ -74,7 +72,7 @@ class Snapshots:
         """
         return await Request(URL_SNAPSHOT_ID.assign("snapshot-id", snapshot_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -91,9 +89,9 @@ class Snapshots:
         """
         return await Request(URL_SNAPSHOT_ID.assign("snapshot-id", snapshot_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"description": description})) \
+            .set_json({"description": description}) \
             .request()
 
     @staticmethod
@@ -110,7 +108,7 @@ class Snapshots:
 
         return await Request(URL_SNAPSHOT_ID.assign("snapshot-id", snapshot_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -127,7 +125,7 @@ class Snapshots:
 
         return await Request(URL_SNAPSHOT_CREATE_FROM_URL.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateSnapshotFromUrlConfig) \
             .request()
\ No newline at end of file
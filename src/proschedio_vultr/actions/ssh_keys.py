@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -22,7 +20,7 @@ class SSHKeys:
         """
         request = Request(URL_SSH_KEY_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -45,9 +43,9 @@ class SSHKeys:
         """
         return await Request(URL_SSH_KEY_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"name": name, "ssh_key": ssh_key})) \
+            .set_json({"name": name, "ssh_key": ssh_key}) \
             .request()
 
     @staticmethod
@@ -63,7 +61,7 @@ class SSHKeys:
         """
         return await Request(URL_SSH_KEY_ID.assign("ssh-key-id", ssh_key_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -82,9 +80,9 @@ class SSHKeys:
 
         return await Request(URL_SSH_KEY_ID.assign("ssh-key-id", ssh_key_id).to_str()) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"name": name, "ssh_key": ssh_key})) \
+            .set_json({"name": name, "ssh_key": ssh_key}) \
             .request()
 
     @staticmethod
@@ -100,5 +98,5 @@ class SSHKeys:
         """
         return await Request(URL_SSH_KEY_ID.assign("ssh-key-id", ssh_key_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
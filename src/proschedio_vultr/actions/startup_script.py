@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 from typing import Literal
 
@@ -26,7 +24,7 @@ class StartupScript:
         """
         request = Request(URL_STARTUP_SCRIPTS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -57,9 +55,9 @@ class StartupScript:
 
         return await Request(URL_STARTUP_SCRIPTS.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body_dict)) \
+            .set_json(body_dict) \
             .request()
 
     @staticmethod
@@ -76,7 +74,7 @@ class StartupScript:
         return (
             await Request(URL_STARTUP_SCRIPT_ID.assign("startup-id", startup_id).to_str()) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize() \
                 .request()
         )
 
@@ -95,9 +93,9 @@ class StartupScript:
         return (
             await Request(URL_STARTUP_SCRIPT_ID.assign("startup-id", startup_id).to_str()) \
                 .set_method(HTTPMethod.PATCH) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize() \
                 .add_header("Content-Type", "application/json") \
-                .set_body(json.dumps(data)) \
+                .set_json(data, UpdateStartupScriptConfig) \
                 .request()
         )
 
@@ -115,6 +113,6 @@ class StartupScript:
         return (
             await Request(URL_STARTUP_SCRIPT_ID.assign("startup-id", startup_id).to_str()) \
                 .set_method(HTTPMethod.DELETE) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize() \
                 .request()
         )
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -22,7 +20,7 @@ class VFS:
         """
         return await Request(URL_VFS_REGIONS.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -39,7 +37,7 @@ class VFS:
         """
         request = Request(URL_VFS_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -62,9 +60,9 @@ class VFS:
 
         return await Request(URL_VFS_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateConfig) \
             .request()
 
     @staticmethod
@@ -80,7 +78,7 @@ class VFS:
         """
         return await Request(URL_VFS_ID.assign("vfs-id", vfs_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -99,9 +97,9 @@ class VFS:
 
         return await Request(URL_VFS_ID.assign("vfs-id", vfs_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"label": label, "storage_size": storage_size})) \
+            .set_json({"label": label, "storage_size": storage_size}) \
             .request()
 
     @staticmethod
@@ -117,7 +115,7 @@ class VFS:
         """
         return await Request(URL_VFS_ID.assign("vfs-id", vfs_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -133,7 +131,7 @@ class VFS:
         """
         return await Request(URL_VFS_ATTACHMENTS.assign("vfs-id", vfs_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -150,7 +148,7 @@ class VFS:
         """
         return await Request(URL_VFS_ATTACHMENT.assign("vfs-id", vfs_id).assign("vps-id", vps_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -167,7 +165,7 @@ class VFS:
         """
         return await Request(URL_VFS_ATTACHMENT.assign("vfs-id", vfs_id).assign("vps-id", vps_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -184,5 +182,5 @@ class VFS:
         """
         return await Request(URL_VFS_ATTACHMENT.assign("vfs-id", vfs_id).assign("vps-id", vps_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -26,7 +24,7 @@ class VPC2:
         """
         request = Request(URL_VPC2_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -51,9 +49,9 @@ class VPC2:
 
         return await Request(URL_VPC2_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body_dict)) \
+            .set_json(body_dict) \
             .request()
 
     @staticmethod
@@ -69,7 +67,7 @@ class VPC2:
         """
         return await Request(URL_VPC2_ID.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -86,9 +84,9 @@ class VPC2:
         """
         return await Request(URL_VPC2_ID.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"description": description})) \
+            .set_json({"description": description}) \
             .request()
 
     @staticmethod
@@ -104,7 +102,7 @@ class VPC2:
         """
         return await Request(URL_VPC2_ID.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -122,7 +120,7 @@ class VPC2:
         """
         request = Request(URL_VPC2_NODES.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -148,9 +146,9 @@ class VPC2:
 
         return await Request(URL_VPC2_ATTACH_NODES.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body_dict)) \
+            .set_json(body_dict) \
             .request()
 
     @staticmethod
@@ -170,7 +168,7 @@ class VPC2:
 
         return await Request(URL_VPC2_DETACH_NODES.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(body_dict)) \
+            .set_json(body_dict) \
             .request()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from http import HTTPMethod
 
 from rustipy.result import Result
@@ -23,7 +21,7 @@ class VPCs:
         """
         request = Request(URL_VPC_LIST.to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize()
 
         if per_page is not None:
             request.add_param("per_page", str(per_page))
@@ -46,9 +44,9 @@ class VPCs:
 
         return await Request(URL_VPC_LIST.to_str()) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps(data)) \
+            .set_json(data, CreateConfig) \
             .request()
 
     @staticmethod
@@ -64,7 +62,7 @@ class VPCs:
         """
         return await Request(URL_VPC_ID.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
 
     @staticmethod
@@ -82,9 +80,9 @@ class VPCs:
 
         return await Request(URL_VPC_ID.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.PUT) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"description": description})) \
+            .set_json({"description": description}) \
             .request()
 
     @staticmethod
@@ -101,5 +99,5 @@ class VPCs:
 
         return await Request(URL_VPC_ID.assign("vpc-id", vpc_id).to_str()) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize() \
             .request()
\ No newline at end of file
@@ -0,0 +1,191 @@
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import Final, Literal
+
+from .request import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+Listener = Callable[[str, CircuitState, CircuitState], object]
+"""Called with `(endpoint family, old state, new state)` on every transition."""
+
+FAILURE_STATUSES: Final[frozenset[int]] = frozenset({0, 408, 500, 502, 503, 504})
+"""Statuses that count as failures. `429` does not: it means the client, not the API, is overloaded."""
+
+class Circuit:
+    """
+    State of one endpoint family: the outcomes of its recent calls while closed, and the trial
+    calls while half-open.
+    """
+    __slots__ = ("state", "outcomes", "opened_at", "trials", "successes")
+
+    def __init__(self, window: int):
+        self.state: CircuitState = "closed"
+        self.outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.trials = 0
+        self.successes = 0
+
+class CircuitBreaker:
+    """
+    Stops sending requests to an endpoint family while the API keeps failing it.
+
+    Attach it with `Client(breaker=CircuitBreaker())`. Each endpoint family (`instances`,
+    `databases`, ...) has its own circuit, so a failing family is isolated while the others
+    keep full throughput. A closed circuit tracks the last `window` attempts and opens once at
+    least `minimum_calls` were seen and either the share of failures reaches
+    `failure_rate_threshold` or the share of attempts slower than `slow_call_duration` reaches
+    `slow_call_rate_threshold`. Attempts the client gives up on before sending them, such as
+    those past an exhausted `deadline()` or shed by the scheduler, are not counted. While open, attempts fail at once with `status_code` 0 and
+    `circuit_open` set, without waiting on the rate limiter; the retry policy does not retry
+    them. After `open_duration` seconds the circuit is half-open and lets `half_open_calls`
+    trial attempts through. It closes when all of them succeed, and opens again on the first
+    failed or slow one.
+
+    Register transition hooks with `Client(breaker=CircuitBreaker(on_transition=hook))` or
+    `listeners.append(hook)`.
+    """
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 10.0,
+        window: int = 50,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+        failure_statuses: frozenset[int] = FAILURE_STATUSES,
+        families: frozenset[str] | None = None,
+        on_transition: Listener | None = None,
+    ):
+        """
+        Args:
+            failure_rate_threshold (float): Share of failed attempts (0..1) that opens the circuit.
+            slow_call_rate_threshold (float): Share of slow attempts (0..1) that opens the circuit.
+            slow_call_duration (float): Seconds after which an attempt counts as slow.
+            window (int): Recent attempts per endpoint family the rates are computed over.
+            minimum_calls (int): Attempts needed in the window before the rates are evaluated.
+            open_duration (float): Seconds a circuit stays open before trial attempts are let through.
+            half_open_calls (int): Trial attempts that must succeed to close the circuit again.
+            failure_statuses (frozenset[int]): Status codes that count as failures.
+            families (frozenset[str] | None): Endpoint families to protect. `None` protects every family.
+            on_transition (Listener | None): Called with `(family, old_state, new_state)` on every transition.
+        """
+        if minimum_calls < 1 or half_open_calls < 1:
+            raise ValueError("minimum_calls and half_open_calls must be at least 1")
+
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._slow_call_duration = slow_call_duration
+        self._window = window
+        self._minimum_calls = min(minimum_calls, window)
+        self._open_duration = open_duration
+        self._half_open_calls = half_open_calls
+        self._failure_statuses = failure_statuses
+        self._families = families
+        self._circuits: dict[str, Circuit] = {}
+        self.listeners: list[Listener] = [on_transition] if on_transition is not None else []
+        self.stats: Counter[str] = Counter()
+
+    def applies_to(self, family: str) -> bool:
+        return self._families is None or family in self._families
+
+    def _circuit(self, family: str) -> Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = Circuit(self._window)
+        return circuit
+
+    def state(self, family: str) -> CircuitState:
+        circuit = self._circuits.get(family)
+        return circuit.state if circuit is not None else "closed"
+
+    def states(self) -> dict[str, CircuitState]:
+        return {family: circuit.state for family, circuit in self._circuits.items()}
+
+    def _transition(self, family: str, circuit: Circuit, state: CircuitState) -> None:
+        previous, circuit.state = circuit.state, state
+        if state == "open":
+            circuit.opened_at = time.monotonic()
+        else:
+            circuit.outcomes.clear()
+        circuit.trials = circuit.successes = 0
+        self.stats[state] += 1
+        logger.warning("circuit.transition family=%s from=%s to=%s", family, previous, state)
+        for listener in self.listeners:
+            try:
+                listener(family, previous, state)
+            except Exception as e:
+                logger.warning("circuit.listener_failed family=%s error=%s", family, e, exc_info=True)
+
+    def allow(self, family: str) -> bool:
+        """
+        Return whether an attempt to `family` may be sent now. A permitted attempt must be
+        followed by `record()` or, if it is abandoned, `release()`.
+        """
+        circuit = self._circuit(family)
+        if circuit.state == "open":
+            if time.monotonic() - circuit.opened_at < self._open_duration:
+                self.stats["rejected"] += 1
+                return False
+            self._transition(family, circuit, "half_open")
+        if circuit.state == "half_open":
+            if circuit.trials >= self._half_open_calls:
+                self.stats["rejected"] += 1
+                return False
+            circuit.trials += 1
+        return True
+
+    def release(self, family: str) -> None:
+        """
+        Give back the trial slot of a permitted attempt that was cancelled before it finished.
+        """
+        circuit = self._circuit(family)
+        if circuit.state == "half_open":
+            circuit.trials = max(0, circuit.trials - 1)
+
+    def record(self, family: str, status: int, duration: float) -> None:
+        """
+        Record the outcome of a permitted attempt and open or close the circuit accordingly.
+        """
+        circuit = self._circuit(family)
+        failed = status in self._failure_statuses
+        slow = duration >= self._slow_call_duration
+
+        if circuit.state == "half_open":
+            if failed or slow:
+                self._transition(family, circuit, "open")
+                return
+            circuit.successes += 1
+            if circuit.successes >= self._half_open_calls:
+                self._transition(family, circuit, "closed")
+            return
+        if circuit.state == "open":
+            return
+
+        outcomes = circuit.outcomes
+        outcomes.append((failed, slow))
+        if len(outcomes) < self._minimum_calls:
+            return
+        failures = sum(1 for f, _ in outcomes if f)
+        slow_calls = sum(1 for _, s in outcomes if s)
+        if failures >= self._failure_rate_threshold * len(outcomes) or slow_calls >= self._slow_call_rate_threshold * len(outcomes):
+            self._transition(family, circuit, "open")
+
+    def rejection(self, family: str) -> ErrorResponse:
+        """
+        The error returned for an attempt `allow()` refused.
+        """
+        circuit = self._circuit(family)
+        wait = max(0.0, circuit.opened_at + self._open_duration - time.monotonic())
+        error = ErrorResponse(status_code=0, error=f"Circuit open for endpoint family {family!r}", circuit_open=True)
+        if wait > 0:
+            error["retry_after"] = wait
+        return error
+
+    def metrics(self) -> dict[str, int]:
+        return dict(self.stats)
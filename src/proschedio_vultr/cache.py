@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Final
+
+from rustipy.result import Result
+
+from .request import ErrorResponse, SuccessResponse, api_path
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+CATALOG_TTLS: Final[dict[str, float]] = {
+    "regions": 3600.0,
+    "plans": 3600.0,
+    "plans-metal": 3600.0,
+    "os": 3600.0,
+    "applications": 3600.0,
+    "iso-public": 3600.0,
+    "kubernetes/versions": 3600.0,
+}
+"""Default TTLs (seconds) for the near-static catalog endpoints, keyed by API path prefix."""
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], str]
+
+class ResponseCache:
+    """
+    Opt-in in-memory cache for successful `GET` responses of selected endpoints.
+
+    Attach it with `Client(cache=ResponseCache())`. Only URLs whose API path starts with one of
+    the configured prefixes are cached, each with that prefix's TTL. Entries are keyed on URL, query
+    parameters and a hash of the API key, so callers with different keys never see each other's
+    responses, and evicted least-recently-used beyond `max_entries`. Concurrent misses for
+    the same key share one upstream call. Cached responses are shared between callers and must be
+    treated as read-only.
+
+    ```python
+    cache = ResponseCache({**CATALOG_TTLS, "plans": 600.0})
+    async with Client(cache=cache):
+        await Action.plans().list_plans("vhf", 500, None, None)   # network
+        await Action.plans().list_plans("vhf", 500, None, None)   # cache hit
+    cache.invalidate("plans")
+    ```
+    """
+    def __init__(self, ttls: Mapping[str, float] = CATALOG_TTLS, max_entries: int = 512):
+        """
+        Args:
+            ttls (Mapping[str, float]): TTL in seconds per API path prefix, e.g. `"regions"` or `"kubernetes/versions"`.
+            max_entries (int): Maximum number of cached responses before LRU eviction.
+        """
+        # Longest prefix first so `plans-metal` is never shadowed by `plans`.
+        self._ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, Result[SuccessResponse, ErrorResponse]]] = OrderedDict()
+        self._flight: SingleFlight[CacheKey, Result[SuccessResponse, ErrorResponse]] = SingleFlight()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, url: str) -> float | None:
+        """
+        Return the TTL configured for `url`, or `None` when the endpoint is not cached.
+        """
+        path = api_path(url)
+        for prefix, ttl in self._ttls:
+            if path == prefix or path.startswith(prefix + "/"):
+                return ttl
+        return None
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, str | int], credential: str) -> CacheKey:
+        fingerprint = hashlib.sha256(credential.encode()).hexdigest()[:16]
+        return url, tuple(sorted((k, str(v)) for k, v in params.items())), fingerprint
+
+    def get(self, key: CacheKey) -> Result[SuccessResponse, ErrorResponse] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: CacheKey, result: Result[SuccessResponse, ErrorResponse], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def fetch(
+        self,
+        url: str,
+        params: Mapping[str, str | int],
+        credential: str,
+        ttl: float,
+        load: Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]],
+    ) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Return the cached response for `url` + `params` under the API key `credential`, calling
+        `load()` once on a miss. Only `Ok` results are stored.
+        """
+        key = self.key(url, params, credential)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        generation = self._generation
+
+        async def load_and_store() -> Result[SuccessResponse, ErrorResponse]:
+            result = await load()
+            # Skip storing when an invalidation happened while the call was in flight.
+            if result.is_ok() and generation == self._generation:
+                self.put(key, result, ttl)
+            return result
+
+        result, shared = await self._flight.do(key, load_and_store)
+        if shared:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+        return result
+
+    def invalidate(self, prefix: str | None = None) -> int:
+        """
+        Drop cached entries whose API path starts with `prefix`, or every entry when `prefix` is `None`.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        self._generation += 1
+        if prefix is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        prefix = prefix.strip("/")
+        stale = [
+            key for key in self._entries
+            if (path := api_path(key[0])) == prefix or path.startswith(prefix + "/")
+        ]
+        for key in stale:
+            del self._entries[key]
+        logger.debug("Invalidated %d cached response(s) under %r", len(stale), prefix)
+        return len(stale)
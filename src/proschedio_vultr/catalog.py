@@ -0,0 +1,298 @@
+import bisect
+import logging
+from collections.abc import Iterable
+from typing import Final, Literal, TypedDict, cast
+
+from .snapshot import CatalogSnapshot
+
+logger = logging.getLogger(__name__)
+
+RangeField = Literal["vcpu", "ram", "disk", "monthly_cost"]
+
+RANGE_FIELDS: Final[tuple[RangeField, ...]] = ("vcpu", "ram", "disk", "monthly_cost")
+
+class PlanEntry(TypedDict):
+    """
+    Normalized view of a VPS or Bare Metal plan. `ram` is in MB, `disk` in GB, `monthly_cost` in USD.
+    """
+    id: str
+    type: str
+    vcpu: int
+    ram: int
+    disk: int
+    monthly_cost: float
+    locations: frozenset[str]
+    metal: bool
+    plan: dict[str, object]
+
+def _number(value: object) -> float:
+    return float(value) if isinstance(value, (int, float, str)) and value else 0.0
+
+def _entry(plan: dict[str, object], metal: bool) -> PlanEntry:
+    vcpu = plan.get("vcpu_count") if not metal else plan.get("cpu_threads") or plan.get("cpu_count")
+    locations = plan.get("locations")
+    return PlanEntry(
+        id=str(plan["id"]),
+        type="vbm" if metal else str(plan.get("type", "")),
+        vcpu=int(_number(vcpu)),
+        ram=int(_number(plan.get("ram"))),
+        disk=int(_number(plan.get("disk"))),
+        monthly_cost=_number(plan.get("monthly_cost")),
+        locations=frozenset(str(region) for region in cast(list[object], locations)) if isinstance(locations, list) else frozenset(),
+        metal=metal,
+        plan=plan,
+    )
+
+class PlanIndex:
+    """
+    Local query engine over the plan and region catalogs.
+
+    Indexes are built once: plan -> regions, region -> plans, type -> plans, continent/country ->
+    regions, and a sorted `(value, plan id)` column for each of `vcpu`, `ram`, `disk` and
+    `monthly_cost`, so range filters are two `bisect` calls. A query intersects candidate sets
+    smallest first and touches only matching plans.
+
+    ```python
+    index = PlanIndex.from_snapshot(store.load())
+    index.cheapest(type="vhf", min_ram=8192, continent="Europe")
+    ```
+
+    `update()` applies a changed catalog incrementally, re-indexing only added, removed or
+    modified plans.
+    """
+    def __init__(self):
+        self._plans: dict[str, PlanEntry] = {}
+        self._by_region: dict[str, set[str]] = {}
+        self._by_type: dict[str, set[str]] = {}
+        self._columns: dict[RangeField, list[tuple[float, str]]] = {field: [] for field in RANGE_FIELDS}
+        self._regions: dict[str, dict[str, object]] = {}
+        self._by_continent: dict[str, set[str]] = {}
+        self._by_country: dict[str, set[str]] = {}
+
+    @classmethod
+    def from_catalogs(
+        cls,
+        plans: Iterable[dict[str, object]],
+        metal_plans: Iterable[dict[str, object]] = (),
+        regions: Iterable[dict[str, object]] = (),
+    ) -> 'PlanIndex':
+        index = cls()
+        index.update(plans, metal_plans, regions)
+        return index
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot) -> 'PlanIndex':
+        return cls.from_catalogs(snapshot.catalog("plans"), snapshot.catalog("plans_metal"), snapshot.catalog("regions"))
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, plan_id: str) -> PlanEntry | None:
+        return self._plans.get(plan_id)
+
+    def regions_for_plan(self, plan_id: str) -> frozenset[str]:
+        entry = self._plans.get(plan_id)
+        return entry["locations"] if entry is not None else frozenset()
+
+    def plans_in_region(self, region_id: str) -> frozenset[str]:
+        return frozenset(self._by_region.get(region_id, ()))
+
+    def _add(self, entry: PlanEntry) -> None:
+        plan_id = entry["id"]
+        self._plans[plan_id] = entry
+        for region in entry["locations"]:
+            self._by_region.setdefault(region, set()).add(plan_id)
+        self._by_type.setdefault(entry["type"], set()).add(plan_id)
+        for field in RANGE_FIELDS:
+            bisect.insort(self._columns[field], (entry[field], plan_id))
+
+    def _remove(self, plan_id: str) -> None:
+        entry = self._plans.pop(plan_id)
+        for region in entry["locations"]:
+            plans = self._by_region[region]
+            plans.discard(plan_id)
+            if not plans:
+                del self._by_region[region]
+        self._by_type[entry["type"]].discard(plan_id)
+        for field in RANGE_FIELDS:
+            column = self._columns[field]
+            position = bisect.bisect_left(column, (entry[field], plan_id))
+            del column[position]
+
+    def _set_regions(self, regions: Iterable[dict[str, object]]) -> None:
+        self._regions = {str(region["id"]): region for region in regions}
+        self._by_continent = {}
+        self._by_country = {}
+        for region_id, region in self._regions.items():
+            self._by_continent.setdefault(str(region.get("continent", "")), set()).add(region_id)
+            self._by_country.setdefault(str(region.get("country", "")), set()).add(region_id)
+
+    def update(
+        self,
+        plans: Iterable[dict[str, object]],
+        metal_plans: Iterable[dict[str, object]] = (),
+        regions: Iterable[dict[str, object]] | None = None,
+    ) -> tuple[int, int, int]:
+        """
+        Bring the index in line with a (possibly changed) catalog.
+
+        Args:
+            plans (Iterable[dict[str, object]]): The full `Plans.list_plans` catalog.
+            metal_plans (Iterable[dict[str, object]]): The full `PlansMetal.list_metal_plans` catalog.
+            regions (Iterable[dict[str, object]] | None): The `Regions.list_regions` catalog, or `None` to keep the current one.
+
+        Returns:
+            tuple[int, int, int]: Number of plans added, changed and removed.
+        """
+        incoming: dict[str, PlanEntry] = {}
+        for plan in plans:
+            entry = _entry(plan, metal=False)
+            incoming[entry["id"]] = entry
+        for plan in metal_plans:
+            entry = _entry(plan, metal=True)
+            incoming[entry["id"]] = entry
+
+        removed = [plan_id for plan_id in self._plans if plan_id not in incoming]
+        added = changed = 0
+        for plan_id in removed:
+            self._remove(plan_id)
+        for plan_id, entry in incoming.items():
+            current = self._plans.get(plan_id)
+            if current is None:
+                added += 1
+            elif current["plan"] == entry["plan"]:
+                continue
+            else:
+                changed += 1
+                self._remove(plan_id)
+            self._add(entry)
+
+        if regions is not None:
+            self._set_regions(regions)
+
+        if added or changed or removed:
+            logger.debug("Plan index updated: %d added, %d changed, %d removed", added, changed, len(removed))
+        return added, changed, len(removed)
+
+    def _range(self, field: RangeField, low: float | None, high: float | None) -> set[str] | None:
+        if low is None and high is None:
+            return None
+        column = self._columns[field]
+        start = 0 if low is None else bisect.bisect_left(column, (low, ""))
+        end = len(column) if high is None else bisect.bisect_right(column, (high, "\U0010ffff"))
+        return {plan_id for _, plan_id in column[start:end]}
+
+    def _region_filter(self, regions: Iterable[str] | None, continent: str | None, country: str | None) -> set[str] | None:
+        selected: set[str] | None = set(regions) if regions is not None else None
+        for mapping, key in ((self._by_continent, continent), (self._by_country, country)):
+            if key is not None:
+                matching = mapping.get(key, set())
+                selected = set(matching) if selected is None else selected & matching
+        return selected
+
+    def query(
+        self,
+        type: str | None = None,
+        min_vcpu: int | None = None,
+        max_vcpu: int | None = None,
+        min_ram: int | None = None,
+        max_ram: int | None = None,
+        min_disk: int | None = None,
+        max_disk: int | None = None,
+        max_monthly_cost: float | None = None,
+        regions: Iterable[str] | None = None,
+        continent: str | None = None,
+        country: str | None = None,
+        order_by: RangeField = "monthly_cost",
+        limit: int | None = None,
+    ) -> list[PlanEntry]:
+        """
+        Return plans matching every given filter, ordered by `order_by` (ascending).
+
+        Args:
+            type (str | None): Plan type such as `"vc2"`, `"vhf"` or `"vbm"` for Bare Metal.
+            min_vcpu (int | None): Minimum vCPU (threads for Bare Metal).
+            max_vcpu (int | None): Maximum vCPU.
+            min_ram (int | None): Minimum RAM in MB.
+            max_ram (int | None): Maximum RAM in MB.
+            min_disk (int | None): Minimum disk in GB.
+            max_disk (int | None): Maximum disk in GB.
+            max_monthly_cost (float | None): Maximum monthly cost in USD.
+            regions (Iterable[str] | None): Only plans available in at least one of these region ids.
+            continent (str | None): Only plans available in a region on this continent, e.g. `"Europe"`.
+            country (str | None): Only plans available in a region in this country code, e.g. `"DE"`.
+            order_by (RangeField): Sort key.
+            limit (int | None): Maximum number of plans returned.
+
+        Returns:
+            list[PlanEntry]: The matching plans.
+        """
+        candidates: list[set[str]] = []
+        if type is not None:
+            candidates.append(self._by_type.get(type, set()))
+        ranges: tuple[tuple[RangeField, float | None, float | None], ...] = (
+            ("vcpu", min_vcpu, max_vcpu),
+            ("ram", min_ram, max_ram),
+            ("disk", min_disk, max_disk),
+            ("monthly_cost", None, max_monthly_cost),
+        )
+        for field, low, high in ranges:
+            matching = self._range(field, low, high)
+            if matching is not None:
+                candidates.append(matching)
+
+        region_ids = self._region_filter(regions, continent, country)
+        if region_ids is not None:
+            in_regions: set[str] = set()
+            for region_id in region_ids:
+                in_regions |= self._by_region.get(region_id, set())
+            candidates.append(in_regions)
+
+        if candidates:
+            candidates.sort(key=len)
+            selected = set(candidates[0])
+            for other in candidates[1:]:
+                selected &= other
+                if not selected:
+                    return []
+            matches = [self._plans[plan_id] for plan_id in selected]
+            matches.sort(key=lambda entry: (entry[order_by], entry["id"]))
+        else:
+            matches = [self._plans[plan_id] for _, plan_id in self._columns[order_by]]
+
+        return matches if limit is None else matches[:limit]
+
+    def cheapest(
+        self,
+        *,
+        type: str | None = None,
+        min_vcpu: int | None = None,
+        max_vcpu: int | None = None,
+        min_ram: int | None = None,
+        max_ram: int | None = None,
+        min_disk: int | None = None,
+        max_disk: int | None = None,
+        max_monthly_cost: float | None = None,
+        regions: Iterable[str] | None = None,
+        continent: str | None = None,
+        country: str | None = None,
+    ) -> PlanEntry | None:
+        """
+        Return the cheapest plan matching every given filter (see `query()`), if any.
+        """
+        matches = self.query(
+            type=type,
+            min_vcpu=min_vcpu,
+            max_vcpu=max_vcpu,
+            min_ram=min_ram,
+            max_ram=max_ram,
+            min_disk=min_disk,
+            max_disk=max_disk,
+            max_monthly_cost=max_monthly_cost,
+            regions=regions,
+            continent=continent,
+            country=country,
+            order_by="monthly_cost",
+            limit=1,
+        )
+        return matches[0] if matches else None
@@ -0,0 +1,188 @@
+import logging
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .breaker import CircuitBreaker
+    from .cache import ResponseCache
+    from .coalesce import RequestCoalescer
+    from .credentials import CredentialProvider
+    from .hedging import HedgePolicy
+    from .metrics import MetricsRegistry
+    from .offload import DecodeOffload
+    from .tracing import RequestTracer
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .scheduler import PriorityScheduler
+    from .timeouts import TimeoutPolicy
+
+logger = logging.getLogger(__name__)
+
+_current_client: ContextVar['Client | None'] = ContextVar("proschedio_vultr_client", default=None)
+
+def current_client() -> 'Client | None':
+    """
+    Return the `Client` activated by the innermost `async with Client(...)` block, if any.
+    """
+    return _current_client.get()
+
+class Client:
+    """
+    Owns a long-lived `aiohttp.ClientSession` and `TCPConnector` shared by every action call.
+
+    Without a client each `Request.request()` opens (and tears down) its own session, paying a
+    fresh TCP + TLS handshake per API call. Inside an `async with Client(...)` block every
+    `Action.*` call made from the same task (or tasks spawned from it) reuses pooled connections.
+
+    ```python
+    async with Client(limit=64, limit_per_host=32) as client:
+        await asyncio.gather(*(Action.instance().get(i) for i in instance_ids))
+    ```
+    """
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int | None = 300,
+        rate_limiter: 'RateLimiter | None' = None,
+        retry_policy: 'RetryPolicy | None' = None,
+        cache: 'ResponseCache | None' = None,
+        coalescer: 'RequestCoalescer | None' = None,
+        credentials: 'CredentialProvider | None' = None,
+        validate_payloads: bool = False,
+        offload: 'DecodeOffload | None' = None,
+        metrics: 'MetricsRegistry | None' = None,
+        tracer: 'RequestTracer | None' = None,
+        hedging: 'HedgePolicy | None' = None,
+        timeouts: 'TimeoutPolicy | None' = None,
+        breaker: 'CircuitBreaker | None' = None,
+        scheduler: 'PriorityScheduler | None' = None,
+    ):
+        """
+        Args:
+            limit (int): Total number of simultaneous connections in the pool. `0` means unlimited.
+            limit_per_host (int): Simultaneous connections to the same endpoint. `0` means unlimited.
+            keepalive_timeout (float): Seconds an idle connection is kept open for reuse.
+            ttl_dns_cache (int | None): Seconds resolved addresses are cached. `None` caches forever.
+            rate_limiter (RateLimiter | None): Token bucket limiter every request waits on before it is sent.
+            retry_policy (RetryPolicy | None): Backoff policy for failed requests. Each retry waits on the rate limiter again.
+            cache (ResponseCache | None): TTL cache consulted for `GET` requests to the endpoints it covers.
+            coalescer (RequestCoalescer | None): Shares one in-flight call between concurrent identical requests.
+            credentials (CredentialProvider | None): Chooses the API key per request. Defaults to the `VULTR_API_KEY` environment variable.
+            validate_payloads (bool): Check JSON bodies against their model and the OpenAPI required fields before sending; invalid ones fail locally with `status_code` 0.
+            offload (DecodeOffload | None): Decodes large response bodies on worker threads or processes instead of the event loop.
+            metrics (MetricsRegistry | None): Records per-endpoint counts, status codes, latency histograms, bytes, retries and event-loop lag.
+            tracer (RequestTracer | None): Attaches a per-phase timing breakdown to a sample of responses.
+            hedging (HedgePolicy | None): Sends a second copy of slow `GET` requests and keeps the first answer. Each copy waits on the rate limiter.
+            timeouts (TimeoutPolicy | None): Connect, socket-read and total timeouts per endpoint family. Defaults to aiohttp's 5-minute total timeout.
+            breaker (CircuitBreaker | None): Fails requests to an endpoint family at once while the API keeps failing it.
+            scheduler (PriorityScheduler | None): Hands out the rate limiter's tokens by priority class and tenant instead of arrival order.
+        """
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.coalescer = coalescer
+        self.credentials = credentials
+        self.validate_payloads = validate_payloads
+        self.offload = offload
+        self.metrics = metrics
+        self.tracer = tracer
+        self.hedging = hedging
+        self.timeouts = timeouts
+        self.breaker = breaker
+        self.scheduler = scheduler
+        self._session: 'aiohttp.ClientSession | None' = None
+        self._tokens: list[Token['Client | None']] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        if self._session is None or self._session.closed:
+            raise RuntimeError("Client is not open; use `async with Client(...)` or `await client.open()`")
+        return self._session
+
+    async def open(self) -> 'Client':
+        """
+        Create the connector and session. Calling `open()` on an already open client is a no-op.
+        """
+        if self.is_open:
+            return self
+
+        import aiohttp
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=self._ttl_dns_cache,
+            use_dns_cache=True,
+        )
+        trace_configs = None
+        if self.metrics is not None or self.tracer is not None:
+            from .tracing import trace_config
+            trace_configs = [trace_config()]
+        self._session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+        if self.metrics is not None:
+            self.metrics.start_loop_monitor()
+        logger.debug("Client opened (limit=%d, limit_per_host=%d)", self._limit, self._limit_per_host)
+        return self
+
+    def bind(self) -> Token['Client | None']:
+        """
+        Activate the client for the current context (and tasks spawned from it) without opening
+        or closing it, like the body of an `async with` block. Returns the token that restores
+        the previously active client.
+        """
+        return _current_client.set(self)
+
+    def reset_after_fork(self) -> None:
+        """
+        Drop the session, decode pools, metrics tasks and scheduler queues inherited from the
+        parent process without closing them, since their sockets, workers and event loop belong
+        to the parent. The next `open()` creates fresh ones.
+        """
+        self._session = None
+        if self.offload is not None:
+            self.offload.reset_after_fork()
+        if self.metrics is not None:
+            self.metrics.reset_after_fork()
+        if self.scheduler is not None:
+            self.scheduler.reset_after_fork()
+
+    async def close(self) -> None:
+        """
+        Close the session, every pooled connection, the decode workers, and the metrics sampler
+        and push exporter.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            logger.debug("Client closed")
+        if self.offload is not None:
+            self.offload.close()
+        if self.metrics is not None:
+            await self.metrics.stop()
+
+    async def __aenter__(self) -> 'Client':
+        await self.open()
+        self._tokens.append(self.bind())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        _current_client.reset(self._tokens.pop())
+        await self.close()
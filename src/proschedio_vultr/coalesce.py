@@ -0,0 +1,60 @@
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from http import HTTPMethod
+
+from rustipy.result import Result
+
+from .request import ErrorResponse, SuccessResponse
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+CoalesceKey = tuple[str, str, tuple[tuple[str, str], ...], str]
+
+class RequestCoalescer:
+    """
+    Shares one in-flight call between concurrent identical requests.
+
+    Attach it with `Client(coalescer=RequestCoalescer())`. Requests with the same method, URL,
+    query parameters and credential that arrive while an identical one is still in flight await
+    that call and receive the same `Result` instead of issuing their own. Only `GET` is coalesced
+    by default. Shared responses must be treated as read-only.
+
+    `hits` counts requests served by another caller's call (API calls saved); `misses` counts
+    requests that went to the network.
+    """
+    def __init__(self, methods: frozenset[HTTPMethod] = frozenset({HTTPMethod.GET})):
+        """
+        Args:
+            methods (frozenset[HTTPMethod]): Methods eligible for coalescing. Only add idempotent ones.
+        """
+        self._methods = methods
+        self._flight: SingleFlight[CoalesceKey, Result[SuccessResponse, ErrorResponse]] = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    def applies_to(self, method: HTTPMethod) -> bool:
+        return method in self._methods
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flight)
+
+    async def run(
+        self,
+        method: HTTPMethod,
+        url: str,
+        params: Mapping[str, str | int],
+        credential: str,
+        send: Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]],
+    ) -> Result[SuccessResponse, ErrorResponse]:
+        key: CoalesceKey = (method.name, url, tuple(sorted((k, str(v)) for k, v in params.items())), credential)
+        result, shared = await self._flight.do(key, send)
+        if shared:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return result
+
+    def metrics(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "in_flight": self.in_flight}
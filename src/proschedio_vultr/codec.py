@@ -0,0 +1,200 @@
+import codecs
+import json
+import logging
+from collections.abc import Callable
+from typing import Final, Literal, cast
+
+logger = logging.getLogger(__name__)
+
+Backend = Literal["json", "orjson"]
+
+Loads = Callable[[bytes | str], object]
+Dumps = Callable[[object], bytes]
+
+_orjson: tuple[Loads, Dumps] | None
+try:
+    import orjson
+    _orjson = (orjson.loads, orjson.dumps)
+except ImportError:
+    _orjson = None
+
+_decoder: Final[json.JSONDecoder] = json.JSONDecoder()
+
+_loads: Loads = json.loads
+_dumps: Dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode()
+_backend: Backend = "json"
+
+def set_backend(name: Backend | None = None) -> Backend:
+    """
+    Select the JSON implementation used to decode responses (and encode request bodies).
+
+    Args:
+        name (Backend | None): `"json"`, `"orjson"`, or `None` to pick `orjson` when it is installed.
+
+    Returns:
+        Backend: The backend now in use.
+    """
+    global _loads, _dumps, _backend
+
+    if name is None:
+        name = "orjson" if _orjson is not None else "json"
+
+    if name == "orjson":
+        if _orjson is None:
+            raise ImportError("orjson is not installed")
+        _loads, _dumps = _orjson
+    else:
+        _loads = json.loads
+        _dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode()
+    _backend = name
+    logger.debug("JSON backend set to %s", name)
+    return name
+
+def backend() -> Backend:
+    return _backend
+
+def loads(data: bytes | str) -> object:
+    """
+    Decode JSON with the selected backend. Errors are `json.JSONDecodeError` (or a subclass) for every backend.
+    """
+    return _loads(data)
+
+def dumps(obj: object) -> bytes:
+    """
+    Encode `obj` as compact UTF-8 JSON with the selected backend.
+    """
+    return _dumps(obj)
+
+set_backend()
+
+def without_none(value: object) -> object:
+    """
+    Return a copy of `value` with `None`-valued keys removed from every nested dict.
+
+    Optional `TypedDict` fields left as `None` are omitted from the request body instead of being
+    sent as explicit `null`s.
+    """
+    if isinstance(value, dict):
+        return {k: without_none(v) for k, v in cast(dict[str, object], value).items() if v is not None}
+    if isinstance(value, list):
+        return [without_none(v) for v in cast(list[object], value)]
+    return value
+
+_WHITESPACE: Final[str] = " \t\n\r"
+_DELIMITERS: Final[str] = _WHITESPACE + ",]}"
+
+class ArrayItemParser:
+    """
+    Incremental parser that yields the elements of one top-level array in a JSON object.
+
+    Feed it raw body chunks as they arrive; each `feed()` returns the array elements completed so
+    far, so only one element (plus an unparsed tail) is buffered at a time. The array is the value
+    of `key`, or of the first top-level key other than `meta` when `key` is `None`. Other top-level
+    values are decoded whole and kept in `fields` (e.g. `fields["meta"]`).
+    """
+    def __init__(self, key: str | None = None):
+        self._key = key
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._current_key: str | None = None
+        self.array_key: str | None = None
+        self.fields: dict[str, object] = {}
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def _skip_whitespace(self) -> bool:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode(self, final: bool) -> tuple[object, bool]:
+        try:
+            value, end = cast(tuple[object, int], _decoder.raw_decode(self._buffer, self._pos))
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None, False
+        # A number is complete only once a delimiter follows it; `-0.` or `1e` may still be growing.
+        if not final and isinstance(value, (int, float)) and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+            return None, False
+        self._pos = end
+        return value, True
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._pos] != char:
+            raise json.JSONDecodeError(f"Expected {char!r}", self._buffer, self._pos)
+        self._pos += 1
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[object]:
+        """
+        Parse `chunk` and return the array elements it completed.
+
+        Args:
+            chunk (bytes): The next piece of the response body.
+            final (bool): Whether this is the last chunk.
+
+        Raises:
+            json.JSONDecodeError: If the body is not a JSON object of the expected shape.
+        """
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk, final)
+        self._pos = 0
+        items: list[object] = []
+
+        while self._state != "done" and self._skip_whitespace():
+            char = self._buffer[self._pos]
+            if self._state == "start":
+                self._expect("{")
+                self._state = "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "done"
+                    break
+                if char == ",":
+                    self._pos += 1
+                    continue
+                key, complete = self._decode(final)
+                if not complete:
+                    break
+                if not isinstance(key, str):
+                    raise json.JSONDecodeError("Expected an object key", self._buffer, self._pos)
+                self._current_key = key
+                self._state = "colon"
+            elif self._state == "colon":
+                self._expect(":")
+                self._state = "value"
+            elif self._state == "value":
+                key = self._current_key
+                is_target = key == self._key if self._key is not None else key != "meta" and self.array_key is None
+                if char == "[" and is_target:
+                    self._pos += 1
+                    self.array_key = key
+                    self._state = "items"
+                    continue
+                value, complete = self._decode(final)
+                if not complete:
+                    break
+                self.fields[key] = value  # type: ignore[index]
+                self._state = "key"
+            elif self._state == "items":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "key"
+                    continue
+                if char == ",":
+                    self._pos += 1
+                    continue
+                value, complete = self._decode(final)
+                if not complete:
+                    break
+                items.append(value)
+
+        if final and self._state != "done":
+            raise json.JSONDecodeError("Unexpected end of JSON body", self._buffer, self._pos)
+        return items
@@ -0,0 +1,162 @@
+import itertools
+import logging
+import os
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http import HTTPMethod
+from typing import Final, Literal, Protocol
+
+logger = logging.getLogger(__name__)
+
+API_KEY_ENV: Final[str] = "VULTR_API_KEY"
+
+class Credential:
+    """
+    An API key with its prebuilt `Authorization` header value and per-key request accounting.
+    """
+    __slots__ = ("api_key", "authorization", "requests", "in_flight", "failures")
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self.authorization = f"Bearer {api_key}"
+        self.requests = 0
+        self.in_flight = 0
+        self.failures = 0
+
+    @property
+    def label(self) -> str:
+        """
+        Masked form of the key, safe for logs and metrics.
+        """
+        return f"...{self.api_key[-4:]}" if len(self.api_key) > 4 else "***"
+
+    def begin(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+
+    def end(self, ok: bool) -> None:
+        self.in_flight -= 1
+        if not ok:
+            self.failures += 1
+
+    def metrics(self) -> dict[str, int]:
+        return {"requests": self.requests, "in_flight": self.in_flight, "failures": self.failures}
+
+class CredentialProvider(Protocol):
+    """
+    Chooses the credential a request is sent with.
+    """
+    def select(self, method: HTTPMethod) -> Credential: ...
+
+class StaticCredentials:
+    """
+    Always uses one fixed API key.
+    """
+    def __init__(self, api_key: str):
+        self._credential = Credential(api_key)
+
+    @property
+    def credential(self) -> Credential:
+        return self._credential
+
+    def select(self, method: HTTPMethod) -> Credential:
+        return self._credential
+
+class EnvCredentials:
+    """
+    Uses the API key in an environment variable (`VULTR_API_KEY` by default).
+
+    The header is built once and reused until the variable changes, instead of being formatted
+    again on every call.
+    """
+    def __init__(self, variable: str = API_KEY_ENV):
+        self._variable = variable
+        self._credential = Credential("")
+
+    def select(self, method: HTTPMethod) -> Credential:
+        api_key = os.environ.get(self._variable, "")
+        if api_key != self._credential.api_key:
+            self._credential = Credential(api_key)
+        return self._credential
+
+class KeyPool:
+    """
+    Spreads read traffic over several API keys to raise the aggregate rate limit.
+
+    Requests whose method is in `spread_methods` (`GET` by default) are assigned a key round-robin
+    or to the key with the fewest requests in flight. Every other request uses the first
+    (primary) key, so writes stay on one key. All pooled keys must be able to see the same
+    resources, e.g. keys of several users of one account.
+
+    ```python
+    pool = KeyPool([key_a, key_b, key_c], strategy="least_loaded")
+    async with Client(credentials=pool, rate_limiter=RateLimiter()):
+        ...
+    pool.metrics()
+    ```
+    """
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        strategy: Literal["round_robin", "least_loaded"] = "round_robin",
+        spread_methods: frozenset[HTTPMethod] = frozenset({HTTPMethod.GET}),
+    ):
+        """
+        Args:
+            api_keys (Sequence[str]): The keys to use. The first one is the primary key.
+            strategy (Literal["round_robin", "least_loaded"]): How spread requests pick a key.
+            spread_methods (frozenset[HTTPMethod]): Methods whose requests are spread over the pool.
+        """
+        if not api_keys:
+            raise ValueError("KeyPool needs at least one API key")
+
+        self._credentials = [Credential(api_key) for api_key in api_keys]
+        self._strategy = strategy
+        self._spread_methods = spread_methods
+        self._cycle = itertools.cycle(self._credentials)
+
+    @property
+    def credentials(self) -> list[Credential]:
+        return list(self._credentials)
+
+    def select(self, method: HTTPMethod) -> Credential:
+        if method not in self._spread_methods:
+            return self._credentials[0]
+        if self._strategy == "least_loaded":
+            return min(self._credentials, key=lambda credential: (credential.in_flight, credential.requests))
+        return next(self._cycle)
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Per-key accounting keyed by pool position and masked key, e.g. `"0:...a1b2"`. The position
+        keeps keys that share their last characters apart.
+        """
+        return {f"{index}:{credential.label}": credential.metrics() for index, credential in enumerate(self._credentials)}
+
+_default_provider: Final[EnvCredentials] = EnvCredentials()
+
+_override: ContextVar[Credential | None] = ContextVar("proschedio_vultr_credential", default=None)
+
+@contextmanager
+def use_api_key(api_key: str | Credential) -> Generator[Credential, None, None]:
+    """
+    Send every request made inside the block (and tasks spawned from it) with `api_key`,
+    regardless of the client's credential provider.
+    """
+    credential = api_key if isinstance(api_key, Credential) else Credential(api_key)
+    token = _override.set(credential)
+    try:
+        yield credential
+    finally:
+        _override.reset(token)
+
+def resolve_credential(provider: CredentialProvider | None, method: HTTPMethod) -> Credential:
+    """
+    Return the credential for a request: a `use_api_key()` override, else `provider`, else the
+    `VULTR_API_KEY` environment variable.
+    """
+    override = _override.get()
+    if override is not None:
+        return override
+    return (provider if provider is not None else _default_provider).select(method)
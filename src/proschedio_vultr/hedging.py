@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from http import HTTPMethod
+
+from rustipy.result import Result
+
+from .request import ErrorResponse, SuccessResponse, endpoint_family
+
+logger = logging.getLogger(__name__)
+
+class HedgePolicy:
+    """
+    Sends a second, identical `GET` when the first one is slower than usual.
+
+    Attach it with `Client(hedging=HedgePolicy())`. The hedge delay of an endpoint family is the
+    `percentile` of its recent attempt latencies, clamped to `[min_delay, max_delay]`;
+    `initial_delay` is used until `min_samples` latencies are known. An attempt cancelled because
+    the other one answered first is recorded with its elapsed time as a lower bound of its
+    latency, so the percentile is not biased towards the attempts fast enough to finish. If the first attempt has not
+    answered by then, a second one goes out on another pooled connection. The first answer wins
+    and the other attempt is cancelled. A network error (status 0) only wins when the other
+    attempt failed the same way.
+
+    Each attempt waits on the client's rate limiter, and hedges are capped at `budget` times the
+    number of hedged calls, so a slow API does not double the request rate. `fired` counts hedges
+    sent, `won` the ones that answered first and `censored` the cancelled attempts whose latency
+    was recorded as a lower bound; all are returned by `metrics()`.
+    """
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.02,
+        max_delay: float = 2.0,
+        initial_delay: float = 0.5,
+        min_samples: int = 20,
+        window: int = 256,
+        budget: float = 0.1,
+        families: frozenset[str] | None = None,
+    ):
+        """
+        Args:
+            percentile (float): Latency percentile (0..1) after which a hedge is sent.
+            min_delay (float): Lower bound of the hedge delay in seconds.
+            max_delay (float): Upper bound of the hedge delay in seconds.
+            initial_delay (float): Hedge delay in seconds until `min_samples` latencies are recorded.
+            min_samples (int): Latencies an endpoint family needs before its percentile is trusted.
+            window (int): Recent latencies kept per endpoint family.
+            budget (float): Maximum ratio of hedges to hedged calls.
+            families (frozenset[str] | None): Endpoint families to hedge, e.g. `frozenset({"instances", "databases"})`. `None` hedges every `GET`.
+        """
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._window = window
+        self._budget = budget
+        self._families = families
+        self._latencies: dict[str, deque[float]] = {}
+        self.stats: Counter[str] = Counter()
+
+    def applies_to(self, method: HTTPMethod, url: str) -> bool:
+        return method == HTTPMethod.GET and (self._families is None or endpoint_family(url) in self._families)
+
+    def record(self, family: str, latency: float, censored: bool = False) -> None:
+        """
+        Add an attempt latency for `family`. A `censored` one was cut short and is a lower bound.
+        """
+        latencies = self._latencies.get(family)
+        if latencies is None:
+            latencies = self._latencies[family] = deque(maxlen=self._window)
+        latencies.append(latency)
+        if censored:
+            self.stats["censored"] += 1
+
+    def delay(self, family: str) -> float:
+        """
+        Seconds to wait for the first attempt before hedging a call to `family`.
+        """
+        latencies = self._latencies.get(family)
+        if latencies is None or len(latencies) < self._min_samples:
+            return self._initial_delay
+        ordered = sorted(latencies)
+        value = ordered[min(len(ordered) - 1, int(self._percentile * len(ordered)))]
+        return min(self._max_delay, max(self._min_delay, value))
+
+    async def _timed(self, family: str, send: Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]]) -> Result[SuccessResponse, ErrorResponse]:
+        started = time.monotonic()
+        try:
+            result = await send()
+        except asyncio.CancelledError:
+            self.record(family, time.monotonic() - started, censored=True)
+            raise
+        self.record(family, time.monotonic() - started)
+        return result
+
+    async def run(
+        self,
+        url: str,
+        send: Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]],
+    ) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Call `send`, and call it once more if the first call is still running after `delay()`.
+
+        Args:
+            url (str): URL of the request, used to pick its endpoint family.
+            send (Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]]): Performs one attempt.
+
+        Returns:
+            Result[SuccessResponse, ErrorResponse]: The first answer.
+        """
+        family = endpoint_family(url)
+        self.stats["calls"] += 1
+        primary = asyncio.ensure_future(self._timed(family, send))
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.delay(family))
+            if done or self.stats["fired"] >= self._budget * self.stats["calls"]:
+                return await primary
+
+            self.stats["fired"] += 1
+            logger.debug("hedge.fired url=%s", url)
+            hedge = asyncio.ensure_future(self._timed(family, send))
+            attempts.append(hedge)
+            pending: set[asyncio.Future[Result[SuccessResponse, ErrorResponse]]] = {primary, hedge}
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                finished = [(attempt, attempt.result()) for attempt in attempts if attempt in done]
+                for attempt, result in finished:
+                    if result.is_ok() or result.unwrap_err()["status_code"] != 0:
+                        if attempt is hedge:
+                            self.stats["won"] += 1
+                        return result
+                if not pending:
+                    return finished[0][1]
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    def metrics(self) -> dict[str, int]:
+        return {key: self.stats[key] for key in ("calls", "fired", "won", "censored")}
@@ -0,0 +1,268 @@
+import asyncio
+import bisect
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from typing import Final
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""Default histogram upper bounds in seconds; an implicit `+Inf` bucket follows."""
+
+LAG_BUCKETS: Final[tuple[float, ...]] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+PHASES: Final[tuple[str, ...]] = ("connect", "ttfb", "total")
+"""Latency phases: new-connection setup (DNS, TCP and TLS), time to response headers, and the whole attempt."""
+
+Snapshot = dict[str, object]
+
+class Histogram:
+    """
+    Fixed-bucket histogram with Prometheus semantics (cumulative `le` buckets, sum and count).
+    """
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the `q` quantile (0..1) as the upper bound of the bucket it falls in.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, object]:
+        cumulative: list[tuple[float, int]] = []
+        seen = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            seen += count
+            cumulative.append((bound, seen))
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+class EndpointMetrics:
+    """
+    Counters and latency histograms of one `(method, endpoint family)` pair.
+    """
+    __slots__ = ("requests", "statuses", "latency", "bytes", "retries")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.requests = 0
+        self.statuses: Counter[int] = Counter()
+        self.latency: dict[str, Histogram] = {phase: Histogram(bounds) for phase in PHASES}
+        self.bytes = 0
+        self.retries = 0
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "latency": {phase: histogram.snapshot() for phase, histogram in self.latency.items()},
+            "bytes": self.bytes,
+            "retries": self.retries,
+        }
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _labels(**labels: object) -> str:
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+def _bound(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(value)
+
+class MetricsRegistry:
+    """
+    In-process metrics for every request sent through a `Client`.
+
+    Per `(method, endpoint family)` it records the request count, status codes (0 for network
+    errors), latency histograms for connection setup, time to first byte and the whole attempt,
+    response bytes and retries. It can also sample event-loop lag. Read it with `snapshot()`,
+    push it periodically with `start_push()`, or scrape `to_prometheus()`.
+
+    ```python
+    metrics = MetricsRegistry()
+    async with Client(metrics=metrics):
+        ...
+    metrics.snapshot()["endpoints"]["GET instances"]["latency"]["total"]
+    ```
+    """
+    def __init__(
+        self,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        loop_lag_interval: float | None = 0.5,
+        namespace: str = "proschedio_vultr",
+    ):
+        """
+        Args:
+            buckets (Sequence[float]): Latency histogram upper bounds in seconds.
+            loop_lag_interval (float | None): Seconds between event-loop lag samples while a client is open, or `None` to disable sampling.
+            namespace (str): Prefix of the Prometheus metric names.
+        """
+        self._buckets = tuple(buckets)
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self.loop_lag = Histogram(LAG_BUCKETS)
+        self.loop_lag_interval = loop_lag_interval
+        self.namespace = namespace
+        self._lag_task: asyncio.Task[None] | None = None
+        self._push_task: asyncio.Task[None] | None = None
+
+    def endpoint(self, method: str, family: str) -> EndpointMetrics:
+        key = (method, family)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = EndpointMetrics(self._buckets)
+        return metrics
+
+    def observe(self, method: str, family: str, status: int, timings: dict[str, float]) -> None:
+        """
+        Record one attempt. `timings` holds `total` and, when known, the other `RequestTimings` fields.
+        """
+        metrics = self.endpoint(method, family)
+        metrics.requests += 1
+        metrics.statuses[status] += 1
+        if "connect" in timings:
+            metrics.latency["connect"].observe(timings.get("dns", 0.0) + timings["connect"])
+        for phase in ("ttfb", "total"):
+            value = timings.get(phase)
+            if value is not None:
+                metrics.latency[phase].observe(value)
+        metrics.bytes += int(timings.get("bytes", 0))
+
+    def record_retries(self, method: str, family: str, retries: int) -> None:
+        if retries:
+            self.endpoint(method, family).retries += retries
+
+    def snapshot(self) -> Snapshot:
+        """
+        Return every metric as plain data, e.g. for JSON export.
+        """
+        return {
+            "endpoints": {f"{method} {family}": metrics.snapshot() for (method, family), metrics in self._endpoints.items()},
+            "loop_lag": self.loop_lag.snapshot(),
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+        """
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_requests_total Requests sent, by method, endpoint family and status (0 = network error).",
+            f"# TYPE {ns}_requests_total counter",
+        ]
+        for (method, family), metrics in self._endpoints.items():
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f"{ns}_requests_total{_labels(method=method, endpoint=family, status=status)} {count}")
+
+        lines += [
+            f"# HELP {ns}_request_duration_seconds Request latency by phase (connect, ttfb, total).",
+            f"# TYPE {ns}_request_duration_seconds histogram",
+        ]
+        for (method, family), metrics in self._endpoints.items():
+            for phase, histogram in metrics.latency.items():
+                lines += self._histogram_lines(f"{ns}_request_duration_seconds", histogram, method=method, endpoint=family, phase=phase)
+
+        for name, attribute, help_text in (
+            ("response_bytes_total", "bytes", "Response body bytes received."),
+            ("retries_total", "retries", "Attempts repeated by the retry policy."),
+        ):
+            lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} counter"]
+            for (method, family), metrics in self._endpoints.items():
+                lines.append(f"{ns}_{name}{_labels(method=method, endpoint=family)} {getattr(metrics, attribute)}")
+
+        lines += [
+            f"# HELP {ns}_event_loop_lag_seconds Delay of the lag probe past its scheduled wake-up.",
+            f"# TYPE {ns}_event_loop_lag_seconds histogram",
+        ]
+        lines += self._histogram_lines(f"{ns}_event_loop_lag_seconds", self.loop_lag)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(name: str, histogram: Histogram, **labels: object) -> list[str]:
+        lines: list[str] = []
+        seen = 0
+        for bound, count in zip((*histogram.bounds, float("inf")), histogram.counts):
+            seen += count
+            lines.append(f"{name}_bucket{_labels(**labels, le=_bound(bound))} {seen}")
+        suffix = _labels(**labels) if labels else ""
+        lines.append(f"{name}_sum{suffix} {histogram.sum}")
+        lines.append(f"{name}_count{suffix} {histogram.count}")
+        return lines
+
+    def start_loop_monitor(self) -> asyncio.Task[None] | None:
+        """
+        Sample event-loop lag every `loop_lag_interval` seconds until `stop()`.
+        """
+        interval = self.loop_lag_interval
+        if interval is None:
+            return None
+
+        async def monitor() -> None:
+            while True:
+                started = time.perf_counter()
+                await asyncio.sleep(interval)
+                self.loop_lag.observe(max(0.0, time.perf_counter() - started - interval))
+
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = asyncio.create_task(monitor())
+        return self._lag_task
+
+    def start_push(self, callback: Callable[[Snapshot], object], interval: float = 10.0) -> asyncio.Task[None]:
+        """
+        Call `callback(snapshot())` every `interval` seconds, and once more on `stop()`.
+        """
+        async def push() -> None:
+            try:
+                while True:
+                    await asyncio.sleep(interval)
+                    self._push(callback)
+            finally:
+                self._push(callback)
+
+        if self._push_task is None or self._push_task.done():
+            self._push_task = asyncio.create_task(push())
+        return self._push_task
+
+    def _push(self, callback: Callable[[Snapshot], object]) -> None:
+        try:
+            callback(self.snapshot())
+        except Exception as e:
+            logger.warning("metrics.push_failed error=%s", e, exc_info=True)
+
+    def reset_after_fork(self) -> None:
+        """
+        Forget the sampler and exporter tasks inherited from the parent process; they ran on its
+        event loop. The next `start_loop_monitor()` and `start_push()` create fresh ones.
+        """
+        self._lag_task = self._push_task = None
+
+    async def stop(self) -> None:
+        """
+        Stop the loop-lag sampler and the push exporter.
+        """
+        for task in (self._lag_task, self._push_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._lag_task = self._push_task = None
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from . import codec
+
+if TYPE_CHECKING:
+    from .request import MetaInfo
+
+logger = logging.getLogger(__name__)
+
+Decoded = tuple[object, 'dict[str, object] | list[object] | None', 'MetaInfo | None']
+"""Raw decoded body, extracted data payload, and `meta`, as returned by `request.decode_response`."""
+
+def _decode_in_process(body: bytes, url: str, extract: bool, backend: codec.Backend) -> Decoded:
+    from .request import decode_response
+
+    if codec.backend() != backend:
+        codec.set_backend(backend)
+    return decode_response(body, url, extract)
+
+class DecodeOffload:
+    """
+    Moves decoding of large response bodies off the event loop.
+
+    Bodies smaller than `threshold` bytes are decoded inline, where a thread hop would cost more
+    than it saves. Larger ones are decoded, and their payload extracted, on a bounded thread pool,
+    so the loop keeps running other coroutines between GIL switches. Bodies of at least
+    `process_threshold` bytes go to a process pool instead, which takes the decode off this
+    interpreter's GIL entirely at the cost of pickling the result back. Worker processes are
+    spawned, so the main module must be import-safe (`if __name__ == "__main__":`).
+
+    ```python
+    async with Client(offload=DecodeOffload(threshold=128 * 1024, process_threshold=8 * 1024 * 1024)):
+        await Action.bare_metal().list_bare_metals(500, None)
+    ```
+    """
+    def __init__(
+        self,
+        threshold: int = 256 * 1024,
+        max_workers: int = 2,
+        process_threshold: int | None = None,
+        max_processes: int = 1,
+    ):
+        """
+        Args:
+            threshold (int): Minimum body size in bytes decoded on the thread pool.
+            max_workers (int): Threads available for decoding.
+            process_threshold (int | None): Minimum body size decoded in a worker process, or `None` to never use processes.
+            max_processes (int): Worker processes available for decoding.
+        """
+        self.threshold = threshold
+        self.process_threshold = process_threshold
+        self._max_workers = max_workers
+        self._max_processes = max_processes
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self.inline = 0
+        self.threaded = 0
+        self.processed = 0
+
+    def applies_to(self, size: int) -> bool:
+        return size >= self.threshold or (self.process_threshold is not None and size >= self.process_threshold)
+
+    def _executor(self, size: int) -> Executor:
+        if self.process_threshold is not None and size >= self.process_threshold:
+            if self._processes is None:
+                # `spawn` avoids forking a process that already runs an event loop and threads.
+                self._processes = ProcessPoolExecutor(self._max_processes, mp_context=multiprocessing.get_context("spawn"))
+            self.processed += 1
+            return self._processes
+        self.threaded += 1
+        return self._thread_pool()
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self._max_workers, thread_name_prefix="proschedio-decode")
+        return self._threads
+
+    async def decode(self, body: bytes, url: str, extract: bool = True) -> Decoded:
+        """
+        Decode `body` (and extract its payload, see `request.decode_response`), off the loop when
+        it is large enough.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        from .request import decode_response
+
+        size = len(body)
+        if not self.applies_to(size):
+            self.inline += 1
+            return decode_response(body, url, extract)
+
+        executor = self._executor(size)
+        loop = asyncio.get_running_loop()
+        logger.debug("response.offload url=%s bytes=%d executor=%s", url, size, type(executor).__name__)
+        if isinstance(executor, ProcessPoolExecutor):
+            try:
+                return await loop.run_in_executor(executor, _decode_in_process, body, url, extract, codec.backend())
+            except BrokenProcessPool as e:
+                logger.warning("response.offload_failed url=%s error=%s; decoding on a thread instead", url, e)
+                self._processes = None
+                executor.shutdown(wait=False)
+                executor = self._thread_pool()
+        return await loop.run_in_executor(executor, decode_response, body, url, extract)
+
+    def metrics(self) -> dict[str, int]:
+        return {"inline": self.inline, "threaded": self.threaded, "processed": self.processed}
+
+    def reset_after_fork(self) -> None:
+        """
+        Forget the pools inherited from the parent process; their workers did not survive the fork.
+        """
+        self._threads = self._processes = None
+
+    def close(self) -> None:
+        """
+        Shut the pools down. They are recreated on the next large body.
+        """
+        threads, self._threads = self._threads, None
+        processes, self._processes = self._processes, None
+        if threads is not None:
+            threads.shutdown(wait=False)
+        if processes is not None:
+            processes.shutdown(wait=False)
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Final
+
+from rustipy.result import Err, Ok, Result
+
+from .request import ErrorResponse, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+MAX_PER_PAGE: Final[int] = 500
+
+ListMethod = Callable[..., Awaitable[Result[SuccessResponse, ErrorResponse]]]
+
+def next_cursor(response: SuccessResponse) -> str | None:
+    """
+    Return the cursor of the following page from `meta.links.next`, or `None` on the last page.
+    """
+    meta = response["meta"]
+    if not meta:
+        return None
+    links = meta.get("links") or {}
+    return links.get("next") or None
+
+class Paginator:
+    """
+    Async iterator that follows `meta.links.next` across every page of a cursor-based list method.
+
+    Items are yielded as each page arrives; at most the current page (plus one prefetched page)
+    is held in memory, so the footprint stays bounded for accounts with tens of thousands of
+    resources. Arguments preceding `per_page`/`cursor` are passed through positionally.
+
+    ```python
+    pager = Paginator(Action.dns().list_domain_records, "example.com", prefetch=True)
+    async for record in pager:
+        ...
+    if pager.error is not None:
+        ...
+    ```
+
+    Iteration stops at the first failed page and the `ErrorResponse` is kept on `error`.
+    """
+    def __init__(
+        self,
+        method: ListMethod,
+        *args: object,
+        per_page: int = MAX_PER_PAGE,
+        prefetch: bool = False,
+        **kwargs: object,
+    ):
+        """
+        Args:
+            method (ListMethod): A list action accepting `per_page` and `cursor` keyword arguments.
+            *args (object): Leading positional arguments of `method`, e.g. an instance id or filter.
+            per_page (int): Page size requested from the API. Default is the maximum, 500.
+            prefetch (bool): Request the next page while the current one is being consumed.
+            **kwargs (object): Additional keyword arguments of `method`.
+        """
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+        self._per_page = per_page
+        self._prefetch = prefetch
+        self.error: ErrorResponse | None = None
+        self.pages = 0
+
+    def _fetch(self, cursor: str | None) -> Awaitable[Result[SuccessResponse, ErrorResponse]]:
+        return self._method(*self._args, per_page=self._per_page, cursor=cursor, **self._kwargs)
+
+    async def _iterate(self) -> AsyncIterator[object]:
+        self.error = None
+        self.pages = 0
+        seen: set[str] = set()
+        pending: asyncio.Future[Result[SuccessResponse, ErrorResponse]] | None = asyncio.ensure_future(self._fetch(None))
+
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+
+                if result.is_err():
+                    self.error = result.unwrap_err()
+                    logger.warning("Pagination stopped after %d page(s): %s", self.pages, self.error["error"])
+                    return
+
+                response = result.unwrap()
+                data = response["data"]
+                if data is None:
+                    items: list[object] = []
+                elif isinstance(data, list):
+                    items = data
+                else:
+                    self.error = ErrorResponse(status_code=response["status_code"], error="Expected a list payload while paginating")
+                    return
+
+                self.pages += 1
+                cursor = next_cursor(response)
+                if cursor is not None and cursor in seen:
+                    logger.warning("Pagination cursor repeated, stopping: %s", cursor)
+                    cursor = None
+                if cursor is not None:
+                    seen.add(cursor)
+                    if self._prefetch:
+                        pending = asyncio.ensure_future(self._fetch(cursor))
+
+                # Release the response before yielding so only the page list stays referenced.
+                del response, data, result
+                for item in items:
+                    yield item
+                del items
+
+                if cursor is not None and pending is None:
+                    pending = asyncio.ensure_future(self._fetch(cursor))
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    def __aiter__(self) -> AsyncIterator[object]:
+        return self._iterate()
+
+    async def collect(self) -> Result[list[object], ErrorResponse]:
+        """
+        Drain every page into one list.
+
+        Returns:
+            Result[list[object], ErrorResponse]: All items, or the error of the first failed page.
+        """
+        items = [item async for item in self]
+        if self.error is not None:
+            return Err(self.error)
+        return Ok(items)
+
+def paginate(
+    method: ListMethod,
+    *args: object,
+    per_page: int = MAX_PER_PAGE,
+    prefetch: bool = False,
+    **kwargs: object,
+) -> Paginator:
+    """
+    Shorthand for `Paginator(method, *args, per_page=..., prefetch=..., **kwargs)`.
+    """
+    return Paginator(method, *args, per_page=per_page, prefetch=prefetch, **kwargs)
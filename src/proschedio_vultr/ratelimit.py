@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from typing import Final, Protocol
+
+logger = logging.getLogger(__name__)
+
+VULTR_REQUESTS_PER_SECOND: Final[float] = 30.0
+"""Vultr's documented API rate limit per API key."""
+
+DEFAULT_HEADROOM: Final[float] = 0.95
+
+class BucketBackend(Protocol):
+    """
+    Storage for token bucket state.
+
+    `reserve()` takes one token from bucket `key`, letting the level go negative when empty, and
+    returns how many seconds the caller must wait before its token becomes valid. Reserving
+    instead of polling keeps waiters in arrival order and needs a single critical section.
+    """
+    def reserve(self, key: str, rate: float, burst: float) -> float: ...
+
+class MemoryBackend:
+    """
+    In-process bucket state shared by every coroutine (and thread) using the same limiter.
+    """
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate) - 1.0
+            self._buckets[key] = (tokens, now)
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+class FileBackend:
+    """
+    Bucket state kept in small lock-protected files, shared by every worker process on one host.
+
+    Each bucket is a 16-byte file (`tokens`, `timestamp`) under `directory`, named by a hash of
+    the bucket key so API keys never appear on disk. Updates are serialized with `fcntl.flock`,
+    which makes this backend POSIX-only.
+    """
+    _STATE: Final[struct.Struct] = struct.Struct("<dd")
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        import fcntl
+
+        self._fcntl = fcntl
+        self._directory = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+        self._fds: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _fd(self, key: str) -> int:
+        fd = self._fds.get(key)
+        if fd is None:
+            name = hashlib.sha256(key.encode()).hexdigest()[:32]
+            fd = os.open(os.path.join(self._directory, f"{name}.bucket"), os.O_RDWR | os.O_CREAT, 0o600)
+            self._fds[key] = fd
+        return fd
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        with self._lock:
+            fd = self._fd(key)
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                raw = os.pread(fd, self._STATE.size, 0)
+                tokens, last = self._STATE.unpack(raw) if len(raw) == self._STATE.size else (burst, now)
+                tokens = min(burst, tokens + max(0.0, now - last) * rate) - 1.0
+                os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+            finally:
+                self._fcntl.flock(fd, self._fcntl.LOCK_UN)
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    def close(self) -> None:
+        with self._lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+class RateLimiter:
+    """
+    Async token bucket limiter keyed per API key, with optional per-endpoint-family buckets.
+
+    Attach it to a client with `Client(rate_limiter=RateLimiter())`; every request sent through
+    that client then waits for a token of its API key (and of its endpoint family, when one is
+    configured) before it goes out. By default the limiter paces each key at 95% of Vultr's
+    30 requests/second with no burst, so sustained throughput sits right under the limit.
+
+    ```python
+    limiter = RateLimiter(families={"billing": (2.0, 1.0)}, backend=FileBackend("/run/vultr-rl"))
+    ```
+    """
+    def __init__(
+        self,
+        rate: float = VULTR_REQUESTS_PER_SECOND * DEFAULT_HEADROOM,
+        burst: float = 1.0,
+        families: dict[str, tuple[float, float]] | None = None,
+        backend: BucketBackend | None = None,
+    ):
+        """
+        Args:
+            rate (float): Tokens added per second to each API key bucket.
+            burst (float): Bucket capacity, i.e. how many calls may go out back to back.
+            families (dict[str, tuple[float, float]] | None): Extra `(rate, burst)` buckets per endpoint family, e.g. `"instances"`.
+            backend (BucketBackend | None): Where bucket state lives. Defaults to `MemoryBackend()`.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self._rate = rate
+        self._burst = burst
+        self._families = dict(families or {})
+        self._backend: BucketBackend = backend if backend is not None else MemoryBackend()
+        self._key_ids: dict[str, str] = {}
+        self.waited = 0.0
+        self.throttled = 0
+
+    def _key_id(self, api_key: str) -> str:
+        key_id = self._key_ids.get(api_key)
+        if key_id is None:
+            key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+            self._key_ids[api_key] = key_id
+        return key_id
+
+    def reserve(self, api_key: str, family: str | None = None) -> float:
+        """
+        Reserve a token without waiting.
+
+        Returns:
+            float: Seconds until the reserved token becomes valid.
+        """
+        delay = self._backend.reserve(self._key_id(api_key), self._rate, self._burst)
+        if family is not None:
+            delay = max(delay, self.reserve_family(api_key, family))
+        return delay
+
+    def reserve_family(self, api_key: str, family: str) -> float:
+        """
+        Reserve a token from the `family` bucket of `api_key` only, without waiting.
+
+        Returns:
+            float: Seconds until the reserved token becomes valid; 0 if `family` has no bucket.
+        """
+        limits = self._families.get(family)
+        if limits is None:
+            return 0.0
+        rate, burst = limits
+        return self._backend.reserve(f"{self._key_id(api_key)}:{family}", rate, burst)
+
+    async def acquire(self, api_key: str, family: str | None = None) -> float:
+        """
+        Wait until a request for `api_key` (and `family`) may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        delay = self.reserve(api_key, family)
+        if delay > 0:
+            self.throttled += 1
+            self.waited += delay
+            logger.debug("Rate limited: waiting %.3fs (family=%s)", delay, family)
+            await asyncio.sleep(delay)
+        return delay
@@ -1,41 +1,274 @@
+import asyncio
+import datetime
 import json
-import aiohttp
+import re
+import time
 import logging
+from collections.abc import AsyncIterator, Callable, Mapping
 from http import HTTPMethod
-from typing import TypedDict, cast
+from typing import TYPE_CHECKING, Final, NotRequired, TypedDict, cast
 
 from rustipy.result import Err, Ok, Result
 
+from . import codec
+from .codec import ArrayItemParser
+from .client import Client, current_client
+from .credentials import Credential, resolve_credential
+from .timeouts import current_deadline, remaining, request_timeout
+
+# aiohttp dominates the package's import time, so it is imported where a request is actually sent.
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 class MetaInfo(TypedDict, total=False):
     total: int
     links: dict[str, str | None]
 
+class RequestTimings(TypedDict, total=False):
+    """
+    Where the time of one attempt went, in seconds (see `tracing.RequestTracer`). Connection
+    phases are present only when they happened; `bytes` is the response body size.
+    """
+    dns: float
+    connect: float
+    wait_for_connection: float
+    ttfb: float
+    body_read: float
+    decode: float
+    total: float
+    bytes: int
+
+class RequestKwargs(TypedDict):
+    """
+    Keyword arguments of one `aiohttp.ClientSession.request()` call.
+    """
+    method: str
+    url: str
+    headers: dict[str, str]
+    params: dict[str, str | int]
+    data: bytes | None
+    timeout: NotRequired['aiohttp.ClientTimeout']
+    trace_request_ctx: NotRequired[dict[str, float]]
+
 class SuccessResponse(TypedDict):
     status_code: int
     data: dict[str, object] | list[object] | None
     meta: MetaInfo | None
+    timings: NotRequired[RequestTimings]
 
 class ErrorResponse(TypedDict):
+    """
+    A failed request. `not_sent` marks errors raised by the client before anything was sent,
+    which say nothing about the health of the API.
+    """
     status_code: int
     error: str
+    retry_after: NotRequired[float]
+    circuit_open: NotRequired[bool]
+    preempted: NotRequired[bool]
+    not_sent: NotRequired[bool]
+    timings: NotRequired[RequestTimings]
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a `Retry-After` header given either as delta-seconds or as an HTTP-date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # HTTP-dates are rare here; `email.utils` is comparatively slow to import.
+    import email.utils
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
 
 class Url:
+    """
+    Immutable URL path template.
+
+    `uri()` splits the template once into alternating literal and placeholder segments, so the
+    module-level constants in `urls.py` are compiled at import time. `assign()` never mutates the
+    template; it returns a new bound `Url` sharing the compiled segments, and `to_str()` renders a
+    fresh string per call. Placeholders left unassigned render as `{name}`.
+    """
+    __slots__ = ("_base_url", "_uri", "_segments", "_values")
+
+    _PLACEHOLDER: Final[re.Pattern[str]] = re.compile(r"\{([^{}]+)\}")
+
     def __init__(self, base_url: str):
         self._base_url = base_url
         self._uri = ""
-    
+        self._segments: tuple[str, ...] = (base_url,)
+        self._values: dict[str, str] = {}
+
+    @property
+    def template(self) -> str:
+        return self._uri
+
+    @property
+    def placeholders(self) -> tuple[str, ...]:
+        return self._segments[1::2]
+
+    def _derive(self, uri: str, segments: tuple[str, ...], values: dict[str, str]) -> 'Url':
+        url = Url.__new__(Url)
+        url._base_url = self._base_url
+        url._uri = uri
+        url._segments = segments
+        url._values = values
+        return url
+
+    @classmethod
+    def compiled(cls, base_url: str, template: str, segments: tuple[str, ...]) -> 'Url':
+        """
+        Build a template from segments that were already split, e.g. by the route table generator.
+        """
+        url = cls(base_url)
+        return url._derive(template, (base_url + segments[0], *segments[1:]), {})
+
     def uri(self, token: str) -> 'Url':
-        self._uri = token
-        return self
-    
+        segments = Url._PLACEHOLDER.split(token)
+        segments[0] = self._base_url + segments[0]
+        return self._derive(token, tuple(segments), {})
+
     def assign(self, placeholder: str, value: str) -> 'Url':
-        self._uri = self._uri.replace(f"{{{placeholder}}}", value)
-        return self
-    
+        return self._derive(self._uri, self._segments, {**self._values, placeholder: value})
+
     def to_str(self) -> str:
-        return self._base_url + self._uri
+        segments = self._segments
+        if len(segments) == 1:
+            return segments[0]
+
+        values = self._values
+        parts = list(segments)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            value = values.get(name)
+            parts[i] = f"{{{name}}}" if value is None else value
+        return "".join(parts)
+
+def api_path(url: str) -> str:
+    """
+    Return the API path of a URL without the `v2` version prefix or query string, e.g.
+    `"instances/abc/ipv4"` for `https://api.vultr.com/v2/instances/abc/ipv4?per_page=10`.
+    """
+    path = url.split("://", 1)[-1].partition("/")[2].partition("?")[0]
+    return path.removeprefix("v2/").strip("/")
+
+LOG_BODY_LIMIT: Final[int] = 512
+"""Characters of a request or response body included in log records."""
+
+def redact_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """
+    Copy `headers` with the credential in `Authorization` replaced by `***`.
+    """
+    return {k: "Bearer ***" if k.lower() == "authorization" else v for k, v in headers.items()}
+
+class LazyBody:
+    """
+    Log argument that renders a body only when a handler actually formats the record, truncated
+    to `LOG_BODY_LIMIT` characters. Passing the raw body costs nothing while the level is disabled.
+    """
+    __slots__ = ("_body",)
+
+    def __init__(self, body: bytes | str | None):
+        self._body = body
+
+    def __str__(self) -> str:
+        body = self._body
+        if body is None:
+            return "-"
+        size = len(body)
+        if isinstance(body, bytes):
+            body = body[:LOG_BODY_LIMIT].decode("utf-8", errors="replace")
+        else:
+            body = body[:LOG_BODY_LIMIT]
+        return body if size <= LOG_BODY_LIMIT else f"{body}...(+{size - LOG_BODY_LIMIT})"
+
+def log_response(method: HTTPMethod, url: str, status: int, started: float, size: int) -> None:
+    """
+    Emit the per-request summary record as `key=value` fields: method, endpoint, status, latency and bytes.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "request.done method=%s endpoint=%s url=%s status=%d latency_ms=%.1f bytes=%d",
+            method.name, endpoint_family(url), url, status, (time.perf_counter() - started) * 1000, size,
+        )
+
+def endpoint_family(url: str) -> str:
+    """
+    Return the endpoint family of an API URL: the first segment of its API path, e.g. `"instances"`.
+    """
+    return api_path(url).partition("/")[0]
+
+def deadline_exceeded(stage: str) -> ErrorResponse:
+    """
+    The error of a request abandoned because the ambient `deadline()` ran out `stage`, e.g.
+    `"before the request was sent"`. Nothing reached the API, so it is marked `not_sent`.
+    """
+    return ErrorResponse(status_code=0, error=f"Deadline exceeded {stage}", not_sent=True)
+
+def decode_response(body: bytes, url: str, extract: bool = True) -> tuple[object, dict[str, object] | list[object] | None, 'MetaInfo | None']:
+    """
+    Decode a response body and, when `extract` is set, its data payload and `meta`.
+
+    A body with a single key besides `meta` yields that key's value as the payload; otherwise the
+    object without `meta` is the payload. Runs inline or on a `DecodeOffload` worker.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    raw_body = codec.loads(body) if body.strip() else None
+    if not extract:
+        return raw_body, None, None
+    data_payload, meta_payload = _extract_payload(raw_body, url)
+    return raw_body, data_payload, meta_payload
+
+def _extract_payload(raw_body: object, url: str) -> tuple[dict[str, object] | list[object] | None, 'MetaInfo | None']:
+    """
+    Split a decoded response body into its data payload and `meta` (see `decode_response`).
+    """
+    data_payload: dict[str, object] | list[object] | None = None
+    meta_payload: MetaInfo | None = None
+    if isinstance(raw_body, dict):
+        document = cast(dict[str, object], raw_body)
+        possible_data_keys = [k for k in document if k != 'meta']
+        if len(possible_data_keys) == 1:
+            potential_payload = document.get(possible_data_keys[0])
+            # Check if the payload is a dict or list before assigning
+            if isinstance(potential_payload, (dict, list)):
+                # Cast is safe here because we checked the type
+                data_payload = cast(dict[str, object] | list[object], potential_payload)
+            elif potential_payload is None:
+                 data_payload = None # Explicitly handle None case
+            else:
+                logger.warning("response.unexpected_payload url=%s key=%s type=%s", url, possible_data_keys[0], type(potential_payload).__name__)
+                data_payload = None
+        else:
+            # If multiple keys (or zero keys besides meta), treat the dict itself as payload (excluding meta)
+            data_payload = {k: v for k, v in document.items() if k != 'meta'}
+        # Safely get meta information
+        meta_payload = cast(MetaInfo | None, document.get("meta"))
+    # Explicitly check if raw_body is a list
+    elif isinstance(raw_body, list):
+        data_payload = cast(list[object], raw_body)
+    elif raw_body is None:
+         data_payload = None # Explicitly handle None case
+    else:
+        # Handle cases where raw_body is neither dict, list, nor None (e.g., str, int)
+        logger.warning("response.unexpected_payload url=%s type=%s", url, type(raw_body).__name__)
+        data_payload = None
+
+    return data_payload, meta_payload
 
 class Request:
     def __init__(self, url: str):
@@ -43,7 +276,37 @@ class Request:
         self._method: HTTPMethod | None = None
         self._headers: dict[str, str] = {}
         self._params: dict[str, str | int] = {}
-        self._body: str | None = None
+        self._body: bytes | None = None
+        self._payload: tuple[type | None, object] | None = None
+        self._client: Client | None = None
+        self._authorize = False
+
+    @classmethod
+    def for_route(cls, operation_id: str, path: Mapping[str, str] | None = None) -> 'Request':
+        """
+        Build a request for any operation in the bundled OpenAPI spec.
+
+        Args:
+            operation_id (str): The operation id, e.g. `"get-instance"`.
+            path (Mapping[str, str] | None): Values for the path placeholders, e.g. `{"instance-id": "..."}`.
+
+        Returns:
+            Request: The request with its URL and method set.
+
+        Raises:
+            KeyError: If the operation id is unknown.
+            ValueError: If a path placeholder has no value.
+        """
+        from .routing import route
+
+        target = route(operation_id)
+        url = target.url()
+        for name, value in (path or {}).items():
+            url = url.assign(name, value)
+        missing = [name for name in target.placeholders if not path or name not in path]
+        if missing:
+            raise ValueError(f"Missing path parameters for {operation_id}: {', '.join(missing)}")
+        return cls(url.to_str()).set_method(target.method)
 
     def set_method(self, method: HTTPMethod) -> 'Request':
         self._method = method
@@ -57,109 +320,452 @@ class Request:
         self._params[key] = value
         return self
     
-    def set_body(self, body: str) -> 'Request':
-        self._body = body
+    def set_body(self, body: str | bytes) -> 'Request':
+        """
+        Set an already serialized JSON body. It is sent as-is, without being encoded again.
+        """
+        self._body = body.encode() if isinstance(body, str) else body
+        self._headers.setdefault("Content-Type", "application/json")
+        return self
+
+    def set_json(self, payload: Mapping[str, object], model: type | None = None) -> 'Request':
+        """
+        Serialize `payload` once to UTF-8 JSON bytes, dropping keys whose value is `None`.
+
+        Args:
+            payload (Mapping[str, object]): The request body.
+            model (type | None): The `TypedDict` the payload should match, checked before sending when the client has `validate_payloads` enabled.
+        """
+        cleaned = codec.without_none(payload)
+        self._payload = (model, cleaned)
+        self._body = codec.dumps(cleaned)
+        self._headers.setdefault("Content-Type", "application/json")
+        return self
+
+    def authorize(self) -> 'Request':
+        """
+        Send the request with the active credential: a `use_api_key()` override, else the
+        client's credential provider, else the `VULTR_API_KEY` environment variable.
+        """
+        self._authorize = True
+        return self
+
+    def set_client(self, client: Client) -> 'Request':
+        self._client = client
         return self
     
     async def request(self) -> Result[SuccessResponse, ErrorResponse]:
         if self._method is None:
-            logger.error(f"Request method not set for URL: {self._url}")
+            logger.error("request.invalid url=%s error=method not set", self._url)
             return Err(ErrorResponse(status_code=0, error="Request method not set"))
 
+        client = self._client or current_client()
+        if client is not None and client.validate_payloads and self._payload is not None:
+            from .validation import check_request, invalid_payload
+
+            model, payload = self._payload
+            errors = check_request(self._method, self._url, model, payload)
+            if errors:
+                logger.warning("request.invalid url=%s errors=%d first=%s", self._url, len(errors), errors[0])
+                return Err(invalid_payload(errors))
+
+        credential = self._resolve_credential(client, self._method)
+        if credential is None:
+            return await self._execute(client, self._method)
+
+        credential.begin()
+        ok = False
+        try:
+            result = await self._execute(client, self._method)
+            ok = result.is_ok()
+            return result
+        finally:
+            credential.end(ok)
+
+    def _resolve_credential(self, client: Client | None, method: HTTPMethod) -> Credential | None:
+        if not self._authorize or "Authorization" in self._headers:
+            return None
+        credential = resolve_credential(client.credentials if client is not None else None, method)
+        self._headers["Authorization"] = credential.authorization
+        return credential
+
+    async def _execute(self, client: Client | None, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        if client is not None and client.is_open:
+            return await self._dispatch(client, method)
+
+        import aiohttp
         async with aiohttp.ClientSession() as session:
-            try:
-                logger.debug(f"Sending {self._method.name} request to {self._url} with params={self._params}, headers={self._headers}, body={self._body}")
-                async with session.request(
-                    method=self._method.name,
-                    url=self._url,
-                    headers=self._headers,
-                    params=self._params,
-                    json=self._body
-                ) as response:
-                    status = response.status
-                    logger.debug(f"Request to {self._url} returned status {status}")
-
-                    if status == 204:
-                        logger.info(f"Request successful (204 No Content): {self._url}")
-                        return Ok(SuccessResponse(status_code=status, data=None, meta=None))
-
-                    raw_body: dict[str, object] | list[object] | None = None
-                    parsing_error_message: str | None = None
+            return await self._send(session, method)
+
+    def stream(self, key: str | None = None, chunk_size: int = 65536) -> 'ResponseStream':
+        """
+        Stream the elements of a list response instead of decoding the whole body at once.
+
+        Like `request()`, a stream counts against its credential and goes through the client's
+        rate limiter or scheduler, circuit breaker and metrics. It is never cached, coalesced,
+        retried, hedged or traced, since elements already yielded cannot be taken back.
+
+        Args:
+            key (str | None): Top-level key holding the array, e.g. `"instances"`. Defaults to the first key other than `meta`.
+            chunk_size (int): Bytes read from the socket per step.
+
+        Returns:
+            ResponseStream: Async iterator over the array elements.
+        """
+        return ResponseStream(lambda stream: self._stream_items(stream, key, chunk_size))
+
+    async def _stream_items(self, stream: 'ResponseStream', key: str | None, chunk_size: int) -> AsyncIterator[object]:
+        method = self._method or HTTPMethod.GET
+        client = self._client or current_client()
+        credential = self._resolve_credential(client, method)
+        if credential is not None:
+            credential.begin()
+        try:
+            if client is not None and client.is_open:
+                async for item in self._stream_attempt(stream, key, chunk_size, client, method):
+                    yield item
+            elif self._stream_budget_left(stream):
+                import aiohttp
+                async with aiohttp.ClientSession() as session:
+                    async for item in self._read_stream(stream, key, chunk_size, session, method):
+                        yield item
+        finally:
+            if credential is not None:
+                credential.end(stream.error is None)
+
+    def _stream_budget_left(self, stream: 'ResponseStream') -> bool:
+        budget = remaining()
+        if budget is not None and budget <= 0:
+            logger.warning("stream.deadline_exceeded url=%s", self._url)
+            stream.error = deadline_exceeded("before the request was sent")
+            return False
+        return True
+
+    async def _stream_attempt(
+        self,
+        stream: 'ResponseStream',
+        key: str | None,
+        chunk_size: int,
+        client: Client,
+        method: HTTPMethod,
+    ) -> AsyncIterator[object]:
+        family = endpoint_family(self._url)
+        breaker = client.breaker if client.breaker is not None and client.breaker.applies_to(family) else None
+        if breaker is not None and not breaker.allow(family):
+            stream.error = breaker.rejection(family)
+            return
+        recorded = False
+        try:
+            stream.error = await self._admit(client, family)
+            if stream.error is not None or not self._stream_budget_left(stream):
+                return
+            started = time.perf_counter()
+            async for item in self._read_stream(stream, key, chunk_size, client.session, method, client):
+                yield item
+            elapsed = time.perf_counter() - started
+            status = stream.error["status_code"] if stream.error is not None else stream.status_code or 0
+            if client.metrics is not None:
+                client.metrics.observe(method.name, family, status, {"total": elapsed})
+            if breaker is not None:
+                breaker.record(family, status, elapsed)
+                recorded = True
+        finally:
+            # Rejected before sending, or abandoned by the consumer part-way.
+            if breaker is not None and not recorded:
+                breaker.release(family)
+
+    async def _read_stream(
+        self,
+        stream: 'ResponseStream',
+        key: str | None,
+        chunk_size: int,
+        session: 'aiohttp.ClientSession',
+        method: HTTPMethod,
+        client: Client | None = None,
+    ) -> AsyncIterator[object]:
+        import aiohttp
+        url = self._url
+        try:
+            async with session.request(**self._request_kwargs(method, client)) as response:
+                stream.status_code = response.status
+                if not 200 <= response.status < 300:
+                    body = await response.read()
                     try:
-                        raw_body = await response.json(content_type=None)
-                        logger.debug(f"Raw API response body: {raw_body}")
-                    except aiohttp.ContentTypeError:
-                        try:
-                            text_response = await response.text()
-                            error_detail = f"Non-JSON response: {text_response[:100]}..."
-                            logger.warning(f"API request to {self._url} returned status {status} with non-JSON body: {text_response}")
-                        except Exception as text_err:
-                            logger.warning(f"API request to {self._url} returned status {status} with non-JSON body, failed to read text: {text_err}")
-                            error_detail = "Non-JSON response, unable to read text."
-                        parsing_error_message = f"Status {status}: {error_detail}"
-                    except json.JSONDecodeError as json_err:
-                        logger.warning(f"API request to {self._url} returned status {status} but failed to decode JSON response: {json_err}")
-                        parsing_error_message = f"Status {status}: Failed to decode JSON response"
-                    except Exception as e:
-                        logger.error(f"Unexpected error processing response body from {self._url} (status {status}): {e}", exc_info=True)
-                        parsing_error_message = f"Status {status}: Unexpected error processing response body: {e}"
-
-                    if 200 <= status < 300:
-                        if parsing_error_message is not None:
-                            logger.warning(f"Request to {self._url} had status {status} but failed body processing: {parsing_error_message}")
-                            return Err(ErrorResponse(status_code=status, error=parsing_error_message))
-
-                        data_payload: dict[str, object] | list[object] | None = None
-                        meta_payload: MetaInfo | None = None
-
-                        if isinstance(raw_body, dict):
-                            possible_data_keys = [k for k in raw_body if k != 'meta']
-                            if len(possible_data_keys) == 1:
-                                potential_payload = raw_body.get(possible_data_keys[0])
-                                # Check if the payload is a dict or list before assigning
-                                if isinstance(potential_payload, (dict, list)):
-                                    # Cast is safe here because we checked the type
-                                    data_payload = cast(dict[str, object] | list[object], potential_payload)
-                                elif potential_payload is None:
-                                     data_payload = None # Explicitly handle None case
-                                else:
-                                    logger.warning(f"Expected dict or list for single data key '{possible_data_keys[0]}' in response from {self._url}, but got {type(potential_payload)}. Setting data_payload to None.")
-                                    data_payload = None
-                            else:
-                                # If multiple keys (or zero keys besides meta), treat the dict itself as payload (excluding meta)
-                                data_payload = {k: v for k, v in raw_body.items() if k != 'meta'}
-                            # Safely get meta information
-                            meta_payload = cast(MetaInfo | None, raw_body.get("meta"))
-                        # Explicitly check if raw_body is a list
-                        elif isinstance(raw_body, list):
-                            data_payload = raw_body
-                        elif raw_body is None:
-                             data_payload = None # Explicitly handle None case
-                        else:
-                            # Handle cases where raw_body is neither dict, list, nor None (e.g., str, int)
-                            logger.warning(f"Expected dict or list as response body from {self._url}, but got {type(raw_body)}. Setting data_payload to None.")
-                            data_payload = None
-
-                        logger.info(f"Request successful (Status {status}): {self._url}")
-                        return Ok(SuccessResponse(status_code=status, data=data_payload, meta=meta_payload))
+                        decoded = codec.loads(body) if body.strip() else None
+                    except json.JSONDecodeError:
+                        decoded = None
+                    error = str(cast(dict[str, object], decoded)["error"]) if isinstance(decoded, dict) and "error" in decoded else f"API request failed with status {response.status}"
+                    stream.error = ErrorResponse(status_code=response.status, error=error)
+                    logger.warning("stream.failed url=%s status=%d error=%s body=%s", url, response.status, error, LazyBody(body))
+                    return
+
+                parser = ArrayItemParser(key)
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    for item in parser.feed(chunk):
+                        yield item
+                for item in parser.feed(b"", final=True):
+                    yield item
+                stream.meta = cast(MetaInfo | None, parser.fields.get("meta"))
+        except json.JSONDecodeError as json_err:
+            logger.warning("stream.decode_error url=%s error=%s", url, json_err)
+            stream.error = ErrorResponse(status_code=stream.status_code or 0, error="Failed to decode JSON response")
+        except TimeoutError as timeout_err:
+            logger.warning("stream.timeout url=%s error=%s", url, timeout_err)
+            stream.error = ErrorResponse(status_code=0, error=f"Timeout: {str(timeout_err) or 'request took too long'}")
+        except aiohttp.ClientError as client_err:
+            logger.error("stream.network_error url=%s error=%s", url, client_err, exc_info=True)
+            stream.error = ErrorResponse(status_code=0, error=f"Network error: {client_err}")
+
+    def _request_kwargs(self, method: HTTPMethod, client: Client | None = None) -> RequestKwargs:
+        kwargs = RequestKwargs(method=method.name, url=self._url, headers=self._headers, params=self._params, data=self._body)
+        timeout = request_timeout(client.timeouts if client is not None else None, endpoint_family(self._url))
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return kwargs
+
+    def _api_key(self) -> str:
+        authorization = self._headers.get("Authorization", "")
+        return authorization.removeprefix("Bearer ")
+
+    async def _dispatch(self, client: Client, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        if client.cache is not None and method == HTTPMethod.GET:
+            ttl = client.cache.ttl_for(self._url)
+            if ttl is not None:
+                return await client.cache.fetch(self._url, self._params, self._api_key(), ttl, lambda: self._coalesced(client, method))
+        return await self._coalesced(client, method)
+
+    async def _coalesced(self, client: Client, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        if client.coalescer is not None and client.coalescer.applies_to(method):
+            return await client.coalescer.run(method, self._url, self._params, self._api_key(), lambda: self._retrying(client, method))
+        return await self._retrying(client, method)
+
+    async def _retrying(self, client: Client, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        if client.retry_policy is None:
+            return await self._hedged(client, method)
+        if client.metrics is None:
+            return await client.retry_policy.run(method, lambda: self._hedged(client, method), current_deadline())
+
+        attempts = 0
+
+        async def counted() -> Result[SuccessResponse, ErrorResponse]:
+            nonlocal attempts
+            attempts += 1
+            return await self._hedged(client, method)
+
+        result = await client.retry_policy.run(method, counted, current_deadline())
+        client.metrics.record_retries(method.name, endpoint_family(self._url), attempts - 1)
+        return result
 
+    async def _hedged(self, client: Client, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        if client.hedging is not None and client.hedging.applies_to(method, self._url):
+            return await client.hedging.run(self._url, lambda: self._attempt(client, method))
+        return await self._attempt(client, method)
+
+    async def _attempt(self, client: Client, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        breaker = client.breaker
+        family = endpoint_family(self._url)
+        if breaker is None or not breaker.applies_to(family):
+            rejected = await self._admit(client, family)
+            if rejected is not None:
+                return Err(rejected)
+            return await self._observed(client, method)
+
+        if not breaker.allow(family):
+            return Err(breaker.rejection(family))
+        try:
+            rejected = await self._admit(client, family)
+            if rejected is not None:
+                breaker.release(family)
+                return Err(rejected)
+            started = time.monotonic()
+            result = await self._observed(client, method)
+        except BaseException:
+            breaker.release(family)
+            raise
+        response = result.unwrap() if result.is_ok() else result.unwrap_err()
+        if response.get("not_sent"):
+            breaker.release(family)
+        else:
+            breaker.record(family, response["status_code"], time.monotonic() - started)
+        return result
+
+    async def _admit(self, client: Client, family: str) -> ErrorResponse | None:
+        """
+        Wait for the client's scheduler or rate limiter, for no longer than the ambient deadline
+        allows. Return the error of a preempted or timed-out request.
+        """
+        if client.scheduler is None and client.rate_limiter is None:
+            return None
+        budget = remaining()
+        if budget is not None and budget <= 0:
+            return deadline_exceeded("before the request was sent")
+        try:
+            async with asyncio.timeout(budget):
+                if client.scheduler is not None:
+                    if not await client.scheduler.acquire(self._api_key(), family, client.rate_limiter):
+                        return client.scheduler.rejection()
+                elif client.rate_limiter is not None:
+                    await client.rate_limiter.acquire(self._api_key(), family)
+        except TimeoutError:
+            logger.warning("request.deadline_exceeded url=%s stage=admission", self._url)
+            return deadline_exceeded("while waiting for the rate limit")
+        return None
+
+    async def _observed(self, client: Client, method: HTTPMethod) -> Result[SuccessResponse, ErrorResponse]:
+        traced = client.tracer is not None and client.tracer.sample()
+        if client.metrics is None and not traced:
+            return await self._send(client.session, method, client)
+
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        result = await self._send(client.session, method, client, timings)
+        timings["total"] = time.perf_counter() - started
+        response = result.unwrap() if result.is_ok() else result.unwrap_err()
+        if client.metrics is not None:
+            client.metrics.observe(method.name, endpoint_family(self._url), response["status_code"], timings)
+        if traced:
+            response["timings"] = cast(RequestTimings, timings)
+        return result
+
+    async def _send(
+        self,
+        session: 'aiohttp.ClientSession',
+        method: HTTPMethod,
+        client: Client | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> Result[SuccessResponse, ErrorResponse]:
+        import aiohttp
+        budget = remaining()
+        if budget is not None and budget <= 0:
+            logger.warning("request.deadline_exceeded method=%s url=%s", method.name, self._url)
+            return Err(deadline_exceeded("before the request was sent"))
+
+        offload = client.offload if client is not None else None
+        kwargs = self._request_kwargs(method, client)
+        if timings is not None:
+            kwargs["trace_request_ctx"] = timings
+        started = time.perf_counter()
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "request.send method=%s url=%s params=%s headers=%s body=%s",
+                    method.name, self._url, self._params, redact_headers(self._headers), LazyBody(self._body),
+                )
+            async with session.request(**kwargs) as response:
+                status = response.status
+                if timings is not None:
+                    timings["ttfb"] = time.perf_counter() - started
+
+                if status == 204:
+                    log_response(method, self._url, status, started, 0)
+                    return Ok(SuccessResponse(status_code=status, data=None, meta=None))
+
+                raw_body: object = None
+                data_payload: dict[str, object] | list[object] | None = None
+                meta_payload: MetaInfo | None = None
+                body_bytes = b""
+                parsing_error_message: str | None = None
+                read_at = started
+                try:
+                    body_bytes = await response.read()
+                    if timings is not None:
+                        read_at = time.perf_counter()
+                        timings["body_read"] = read_at - started - timings["ttfb"]
+                        timings["bytes"] = len(body_bytes)
+                    extract = 200 <= status < 300
+                    if offload is not None:
+                        raw_body, data_payload, meta_payload = await offload.decode(body_bytes, self._url, extract)
                     else:
-                        error_message_to_return: str
-                        if parsing_error_message is not None:
-                            error_message_to_return = parsing_error_message
-                        elif isinstance(raw_body, dict) and "error" in raw_body:
-                            api_error = str(raw_body.get("error", f"Unknown API error (status {status})"))
-                            error_message_to_return = api_error
-                        else:
-                            error_message_to_return = f"API request failed with status {status}"
-
-                        logger.warning(f"Request failed (Status {status}): {self._url}. Error: {error_message_to_return}. Raw Body: {raw_body}")
-                        return Err(ErrorResponse(status_code=status, error=error_message_to_return))
-
-            except aiohttp.ClientError as client_err:
-                logger.error(f"Network or client error during request to {self._url}: {client_err}", exc_info=True)
-                return Err(ErrorResponse(status_code=0, error=f"Network error: {client_err}"))
-            except Exception as general_err:
-                logger.error(f"Unexpected error during request execution for {self._url}: {general_err}", exc_info=True)
-                return Err(ErrorResponse(status_code=0, error=f"Unexpected error: {general_err}"))
+                        raw_body, data_payload, meta_payload = decode_response(body_bytes, self._url, extract)
+                    if timings is not None:
+                        timings["decode"] = time.perf_counter() - read_at
+                    logger.debug("response.body url=%s body=%s", self._url, LazyBody(body_bytes))
+                except aiohttp.ContentTypeError:
+                    try:
+                        text_response = await response.text()
+                        error_detail = f"Non-JSON response: {text_response[:100]}..."
+                        logger.warning("response.non_json url=%s status=%d body=%s", self._url, status, LazyBody(text_response))
+                    except Exception as text_err:
+                        logger.warning("response.non_json url=%s status=%d read_error=%s", self._url, status, text_err)
+                        error_detail = "Non-JSON response, unable to read text."
+                    parsing_error_message = f"Status {status}: {error_detail}"
+                except json.JSONDecodeError as json_err:
+                    logger.warning("response.decode_error url=%s status=%d error=%s body=%s", self._url, status, json_err, LazyBody(body_bytes))
+                    parsing_error_message = f"Status {status}: Failed to decode JSON response"
+                except Exception as e:
+                    logger.error("response.body_error url=%s status=%d error=%s", self._url, status, e, exc_info=True)
+                    parsing_error_message = f"Status {status}: Unexpected error processing response body: {e}"
+
+                log_response(method, self._url, status, started, len(body_bytes))
+
+                if 200 <= status < 300:
+                    if parsing_error_message is not None:
+                        return Err(ErrorResponse(status_code=status, error=parsing_error_message))
+
+                    return Ok(SuccessResponse(status_code=status, data=data_payload, meta=meta_payload))
+
+                else:
+                    error_message_to_return: str
+                    if parsing_error_message is not None:
+                        error_message_to_return = parsing_error_message
+                    elif isinstance(raw_body, dict) and "error" in raw_body:
+                        api_error = str(cast(dict[str, object], raw_body)["error"])
+                        error_message_to_return = api_error
+                    else:
+                        error_message_to_return = f"API request failed with status {status}"
+
+                    logger.warning("request.failed method=%s url=%s status=%d error=%s body=%s", method.name, self._url, status, error_message_to_return, LazyBody(body_bytes))
+                    error_response = ErrorResponse(status_code=status, error=error_message_to_return)
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        error_response["retry_after"] = retry_after
+                    return Err(error_response)
+
+        except TimeoutError as timeout_err:
+            logger.warning("request.timeout method=%s url=%s latency_ms=%.1f error=%s", method.name, self._url, (time.perf_counter() - started) * 1000, timeout_err)
+            return Err(ErrorResponse(status_code=0, error=f"Timeout: {str(timeout_err) or 'request took too long'}"))
+        except aiohttp.ClientError as client_err:
+            logger.error("request.network_error method=%s url=%s latency_ms=%.1f error=%s", method.name, self._url, (time.perf_counter() - started) * 1000, client_err, exc_info=True)
+            return Err(ErrorResponse(status_code=0, error=f"Network error: {client_err}"))
+        except Exception as general_err:
+            logger.error("request.unexpected_error method=%s url=%s error=%s", method.name, self._url, general_err, exc_info=True)
+            return Err(ErrorResponse(status_code=0, error=f"Unexpected error: {general_err}"))
+
+
+
+class ResponseStream:
+    """
+    Async iterator over the elements of a list response, decoded incrementally as the body arrives.
+
+    ```python
+    stream = (
+        Request(URL_INSTANCE_LIST.to_str())
+            .set_method(HTTPMethod.GET)
+            .authorize()
+            .add_param("per_page", 500)
+            .stream("instances")
+    )
+    async for instance in stream:
+        ...
+    if stream.error is not None:
+        ...
+    ```
+
+    Peak memory is one socket chunk plus one element rather than the whole page and its decoded
+    tree. After iteration `status_code`, `meta` and `next_cursor` describe the response; a failed
+    request or malformed body stops iteration and sets `error`.
+    """
+    def __init__(self, items: Callable[['ResponseStream'], AsyncIterator[object]]):
+        self._items = items
+        self.status_code: int | None = None
+        self.meta: MetaInfo | None = None
+        self.error: ErrorResponse | None = None
+
+    @property
+    def next_cursor(self) -> str | None:
+        if not self.meta:
+            return None
+        return (self.meta.get("links") or {}).get("next") or None
 
+    def __aiter__(self) -> AsyncIterator[object]:
+        return self._items(self)
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from http import HTTPMethod
+from typing import Final
+
+from rustipy.result import Result
+
+from .request import ErrorResponse, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS: Final[frozenset[HTTPMethod]] = frozenset({
+    HTTPMethod.GET,
+    HTTPMethod.HEAD,
+    HTTPMethod.OPTIONS,
+    HTTPMethod.PUT,
+    HTTPMethod.DELETE,
+    HTTPMethod.TRACE,
+})
+
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({0, 408, 425, 429, 500, 502, 503, 504})
+"""`0` is the status `Request.request()` reports for network errors."""
+
+class RetryPolicy:
+    """
+    Retries failed requests with decorrelated-jitter exponential backoff.
+
+    Attach it with `Client(retry_policy=RetryPolicy())`. A failed attempt is retried when its status
+    is in `retry_statuses` and the method is idempotent. `429 Too Many Requests` is always
+    retried because the API did not process the call. Errors of an open `CircuitBreaker` and
+    requests shed by a `PriorityScheduler` are never retried. A `Retry-After` header on the error response sets the minimum wait. Retries stop
+    after `max_attempts` attempts or when the next wait would overrun the per-call `deadline`.
+
+    Counters are kept on `stats` and returned by `metrics()`.
+    """
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.2,
+        max_delay: float = 10.0,
+        deadline: float | None = 60.0,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUSES,
+        retry_non_idempotent: bool = False,
+        max_retry_after: float = 60.0,
+    ):
+        """
+        Args:
+            max_attempts (int): Total attempts per call, including the first one.
+            base_delay (float): Minimum backoff in seconds.
+            max_delay (float): Maximum backoff in seconds.
+            deadline (float | None): Overall budget in seconds for one call including every retry.
+            retry_statuses (frozenset[int]): Status codes worth retrying.
+            retry_non_idempotent (bool): Also retry `POST`/`PATCH` on statuses other than 429.
+            max_retry_after (float): Upper bound honored for a server-sent `Retry-After`.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self._retry_statuses = retry_statuses
+        self._retry_non_idempotent = retry_non_idempotent
+        self._max_retry_after = max_retry_after
+        self.stats: Counter[str] = Counter()
+
+    def should_retry(self, method: HTTPMethod, error: ErrorResponse) -> bool:
+        if error.get("circuit_open") or error.get("preempted"):
+            return False
+        status = error["status_code"]
+        if status == 429:
+            return True
+        if status not in self._retry_statuses:
+            return False
+        return self._retry_non_idempotent or method in IDEMPOTENT_METHODS
+
+    def backoff(self, previous: float) -> float:
+        """
+        Next decorrelated-jitter delay: `min(max_delay, uniform(base_delay, previous * 3))`.
+        """
+        return min(self._max_delay, random.uniform(self._base_delay, max(self._base_delay, previous * 3)))
+
+    async def run(
+        self,
+        method: HTTPMethod,
+        send: Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]],
+        deadline: float | None = None,
+    ) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Call `send` until it succeeds, fails permanently, or the retry budget runs out.
+
+        Args:
+            method (HTTPMethod): Method of the request, used for the idempotency check.
+            send (Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]]): Performs one attempt.
+            deadline (float | None): Absolute `time.monotonic()` by which the call must finish. Tightens the policy's own budget.
+
+        Returns:
+            Result[SuccessResponse, ErrorResponse]: The first success or the last error.
+        """
+        started = time.monotonic()
+        if self._deadline is not None:
+            deadline = min(deadline, started + self._deadline) if deadline is not None else started + self._deadline
+
+        self.stats["calls"] += 1
+        delay = self._base_delay
+        attempt = 1
+        while True:
+            result = await send()
+            if result.is_ok():
+                if attempt > 1:
+                    self.stats["recovered"] += 1
+                return result
+
+            error = result.unwrap_err()
+            if not self.should_retry(method, error):
+                return result
+            if attempt >= self._max_attempts:
+                self.stats["exhausted"] += 1
+                return result
+
+            delay = self.backoff(delay)
+            retry_after = error.get("retry_after")
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self._max_retry_after))
+
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                self.stats["deadline_exceeded"] += 1
+                logger.warning("Retry budget exhausted after %d attempt(s) (status %d)", attempt, error["status_code"])
+                return result
+
+            self.stats["retries"] += 1
+            self.stats[f"status_{error['status_code']}"] += 1
+            logger.info("Retrying %s after status %d in %.3fs (attempt %d/%d)", method.name, error["status_code"], delay, attempt + 1, self._max_attempts)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def metrics(self) -> dict[str, int]:
+        return dict(self.stats)
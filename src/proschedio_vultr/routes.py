@@ -0,0 +1,337 @@
+"""
+Route table compiled from the bundled `openapi.json` by `scripts/generate_routes.py`. Do not edit.
+
+`ROUTES` maps each OpenAPI operation id to `(method, path segments, query parameters, required
+body fields, declared body fields)`. Path segments are relative to `SERVER_URL` and alternate literal text and
+placeholder names, starting with a literal. Use `routing.route()` for a typed view.
+
+The hand-written actions still build their URLs from `urls.py`, which stays authoritative for
+them. This table backs `Request.for_route()` and payload validation; `tests/test_routes.py`
+checks that every `urls.py` template has a matching route here.
+"""
+from typing import Final
+
+SPEC_VERSION: Final[str] = "2.0"
+
+SERVER_URL: Final[str] = "https://api.vultr.com/v2/"
+
+ROUTES: Final[dict[str, tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]]] = {
+    "attach-baremetals-vpc2": ("POST", ("bare-metals/", "baremetal-id", "/vpc2/attach"), (), (), ("vpc_id", "ip_address")),
+    "attach-baremetals-vpcs": ("POST", ("bare-metals/", "baremetal-id", "/vpcs/attach"), (), (), ("vpc_id",)),
+    "attach-block": ("POST", ("blocks/", "block-id", "/attach"), (), ("instance_id",), ("instance_id", "live")),
+    "attach-instance-iso": ("POST", ("instances/", "instance-id", "/iso/attach"), (), (), ("iso_id",)),
+    "attach-instance-network": ("POST", ("instances/", "instance-id", "/private-networks/attach"), (), (), ("network_id",)),
+    "attach-instance-vpc": ("POST", ("instances/", "instance-id", "/vpcs/attach"), (), (), ("vpc_id",)),
+    "attach-instance-vpc2": ("POST", ("instances/", "instance-id", "/vpc2/attach"), (), ("vpc_id",), ("vpc_id", "ip_address")),
+    "attach-reserved-ip": ("POST", ("reserved-ips/", "reserved-ip", "/attach"), (), ("instance_id",), ("instance_id",)),
+    "attach-vpc2-nodes": ("POST", ("vpc2/", "vpc-id", "/nodes/attach"), (), ("nodes",), ("nodes",)),
+    "convert-reserved-ip": ("POST", ("reserved-ips/convert",), (), ("ip_address",), ("ip_address", "label")),
+    "create-baremetal": ("POST", ("bare-metals",), (), ("region", "plan"), ("region", "plan", "script_id", "enable_ipv6", "sshkey_id", "user_data", "label", "activation_email", "hostname", "tag", "reserved_ipv4", "os_id", "snapshot_id", "app_id", "image_id", "persistent_pxe", "attach_vpc2", "detach_vpc2", "enable_vpc2", "tags", "user_scheme", "mdisk_mode", "app_variables")),
+    "create-baremetal-reverse-ipv4": ("POST", ("bare-metals/", "baremetal-id", "/ipv4/reverse"), (), ("ip", "reverse"), ("ip", "reverse")),
+    "create-baremetal-reverse-ipv6": ("POST", ("bare-metals/", "baremetal-id", "/ipv6/reverse"), (), ("ip", "reverse"), ("ip", "reverse")),
+    "create-block": ("POST", ("blocks",), (), ("region", "size_gb"), ("region", "size_gb", "label", "block_type")),
+    "create-connection-pool": ("POST", ("databases/", "database-id", "/connection-pools"), (), ("name", "database", "username", "mode", "size"), ("name", "database", "username", "mode", "size")),
+    "create-database": ("POST", ("databases",), (), ("database_engine", "database_engine_version", "region", "plan", "label"), ("database_engine", "database_engine_version", "region", "plan", "label", "tag", "vpc_id", "maintenance_dow", "maintenance_time", "trusted_ips", "mysql_sql_modes", "mysql_require_primary_key", "mysql_slow_query_log", "mysql_long_query_time", "redis_eviction_policy", "eviction_policy")),
+    "create-database-connector": ("POST", ("databases/", "database-id", "/connectors"), (), ("name", "class", "topics"), ("name", "class", "topics", "config")),
+    "create-database-db": ("POST", ("databases/", "database-id", "/dbs"), (), ("name",), ("name",)),
+    "create-database-quota": ("POST", ("databases/", "database-id", "/quotas"), (), ("client_id", "consumer_byte_rate", "producer_byte_rate", "request_percentage", "user"), ("client_id", "consumer_byte_rate", "producer_byte_rate", "request_percentage", "user")),
+    "create-database-topic": ("POST", ("databases/", "database-id", "/topics"), (), ("name", "partitions", "replication", "retention_hours", "retention_bytes"), ("name", "partitions", "replication", "retention_hours", "retention_bytes")),
+    "create-database-user": ("POST", ("databases/", "database-id", "/users"), (), ("username",), ("username", "password", "encryption", "permission")),
+    "create-dns-domain": ("POST", ("domains",), (), ("domain",), ("domain", "ip", "dns_sec")),
+    "create-dns-domain-record": ("POST", ("domains/", "dns-domain", "/records"), (), ("name", "type", "data"), ("name", "type", "data", "ttl", "priority")),
+    "create-firewall-group": ("POST", ("firewalls",), (), (), ("description",)),
+    "create-inference": ("POST", ("inference",), (), ("label",), ("label",)),
+    "create-instance": ("POST", ("instances",), (), ("region", "plan"), ("region", "plan", "os_id", "ipxe_chain_url", "iso_id", "script_id", "snapshot_id", "enable_ipv6", "disable_public_ipv4", "attach_private_network", "attach_vpc", "attach_vpc2", "label", "sshkey_id", "backups", "app_id", "image_id", "user_data", "ddos_protection", "activation_email", "hostname", "tag", "firewall_group_id", "reserved_ipv4", "enable_private_network", "enable_vpc", "enable_vpc2", "tags", "user_scheme", "app_variables")),
+    "create-instance-backup-schedule": ("POST", ("instances/", "instance-id", "/backup-schedule"), (), ("type",), ("type", "hour", "dow", "dom")),
+    "create-instance-ipv4": ("POST", ("instances/", "instance-id", "/ipv4"), (), (), ("reboot",)),
+    "create-instance-reverse-ipv4": ("POST", ("instances/", "instance-id", "/ipv4/reverse"), (), ("ip", "reverse"), ("ip", "reverse")),
+    "create-instance-reverse-ipv6": ("POST", ("instances/", "instance-id", "/ipv6/reverse"), (), ("ip", "reverse"), ("ip", "reverse")),
+    "create-iso": ("POST", ("iso",), (), ("url",), ("url",)),
+    "create-kubernetes-cluster": ("POST", ("kubernetes/clusters",), (), ("region", "version"), ("label", "region", "version", "vpc_id", "ha_controlplanes", "enable_firewall", "node_pools")),
+    "create-load-balancer": ("POST", ("load-balancers",), (), ("region",), ("region", "balancing_algorithm", "ssl_redirect", "http2", "http3", "nodes", "proxy_protocol", "timeout", "health_check", "forwarding_rules", "sticky_session", "ssl", "label", "instances", "firewall_rules", "private_network", "vpc", "auto_ssl", "global_regions")),
+    "create-load-balancer-forwarding-rules": ("POST", ("load-balancers/", "load-balancer-id", "/forwarding-rules"), (), ("frontend_protocol", "frontend_port", "backend_protocol", "backend_port"), ("frontend_protocol", "frontend_port", "backend_protocol", "backend_port")),
+    "create-network": ("POST", ("private-networks",), (), ("region",), ("region", "description", "v4_subnet", "v4_subnet_mask")),
+    "create-nodepools": ("POST", ("kubernetes/clusters/", "vke-id", "/node-pools"), (), ("node_quantity", "label", "plan"), ("node_quantity", "label", "plan", "tag", "auto_scaler", "min_nodes", "max_nodes", "labels", "taints")),
+    "create-object-storage": ("POST", ("object-storage",), (), ("cluster_id", "tier_id"), ("cluster_id", "tier_id", "label")),
+    "create-pullzone": ("POST", ("cdns/pull-zones",), (), ("label", "origin_scheme", "origin_domain"), ("label", "origin_scheme", "origin_domain", "vanity_domain", "ssl_cert", "ssl_cert_key", "cors", "gzip", "block_ai", "block_bad_bots")),
+    "create-pushzone": ("POST", ("cdns/push-zones",), (), ("label",), ("label", "vanity_domain", "ssl_cert", "ssl_cert_key", "cors", "gzip", "block_ai", "block_bad_bots")),
+    "create-pushzone-upload": ("POST", ("cdns/push-zones/", "pushzone-id", "/files"), (), ("name", "size"), ("name", "size")),
+    "create-registry": ("POST", ("registry",), (), ("name", "public", "region", "plan"), ("name", "public", "region", "plan")),
+    "create-registry-docker-credentials": ("OPTIONS", ("registry/", "registry-id", "/docker-credentials"), ("expiry_seconds", "read_write"), (), ()),
+    "create-registry-kubernetes-docker-credentials": ("OPTIONS", ("registry/", "registry-id", "/docker-credentials/kubernetes"), ("expiry_seconds", "read_write", "base64_encode"), (), ()),
+    "create-reserved-ip": ("POST", ("reserved-ips",), (), ("region", "ip_type"), ("region", "ip_type", "label")),
+    "create-snapshot": ("POST", ("snapshots",), (), ("instance_id",), ("instance_id", "description")),
+    "create-snapshot-create-from-url": ("POST", ("snapshots/create-from-url",), (), ("url",), ("url", "description", "uefi")),
+    "create-ssh-key": ("POST", ("ssh-keys",), (), ("name", "ssh_key"), ("name", "ssh_key")),
+    "create-startup-script": ("POST", ("startup-scripts",), (), ("name", "script"), ("name", "type", "script")),
+    "create-subaccount": ("POST", ("subaccounts",), (), ("email",), ("email", "subaccount_name", "subaccount_id")),
+    "create-user": ("POST", ("users",), (), ("email", "name", "password"), ("email", "name", "password", "api_enabled", "acls")),
+    "create-vpc": ("POST", ("vpcs",), (), ("region",), ("region", "description", "v4_subnet", "v4_subnet_mask")),
+    "create-vpc2": ("POST", ("vpc2",), (), ("region",), ("region", "description", "ip_type", "ip_block", "prefix_length")),
+    "createVFS": ("POST", ("vfs",), (), ("region", "label", "storage_size"), ("region", "label", "storage_size", "disk_type", "tags")),
+    "createVFSAttachment": ("PUT", ("vfs/", "vfs_id", "/attachments/", "vps_id", ""), (), (), ()),
+    "database-add-read-replica": ("POST", ("databases/", "database-id", "/read-replica"), (), ("region", "label"), ("region", "label")),
+    "database-detach-migration": ("DELETE", ("databases/", "database-id", "/migration"), (), (), ()),
+    "database-fork": ("POST", ("databases/", "database-id", "/fork"), (), ("label", "region", "plan"), ("label", "region", "plan", "vpc_id", "type", "date", "time")),
+    "database-promote-read-replica": ("POST", ("databases/", "database-id", "/promote-read-replica"), (), (), ()),
+    "database-restore-from-backup": ("POST", ("databases/", "database-id", "/restore"), (), ("label",), ("label", "type", "date", "time")),
+    "database-start-migration": ("POST", ("databases/", "database-id", "/migration"), (), ("host", "port", "username", "password", "ssl"), ("host", "port", "username", "password", "database", "ignored_databases", "ssl")),
+    "delete-artifact": ("DELETE", ("registry/", "registry-id", "/repository/", "repository-image", "/artifact/", "artifact-digest", ""), (), (), ()),
+    "delete-baremetal": ("DELETE", ("bare-metals/", "baremetal-id", ""), (), (), ()),
+    "delete-baremetal-reverse-ipv6": ("DELETE", ("bare-metals/", "baremetal-id", "/ipv6/reverse/", "ipv6", ""), (), (), ()),
+    "delete-block": ("DELETE", ("blocks/", "block-id", ""), (), (), ()),
+    "delete-connection-pool": ("DELETE", ("databases/", "database-id", "/connection-pools/", "pool-name", ""), (), (), ()),
+    "delete-database": ("DELETE", ("databases/", "database-id", ""), (), (), ()),
+    "delete-database-connector": ("DELETE", ("databases/", "database-id", "/connectors/", "connector-name", ""), (), (), ()),
+    "delete-database-db": ("DELETE", ("databases/", "database-id", "/dbs/", "db-name", ""), (), (), ()),
+    "delete-database-quota": ("DELETE", ("databases/", "database-id", "/quotas/", "client-id", "/", "username", ""), (), (), ()),
+    "delete-database-topic": ("DELETE", ("databases/", "database-id", "/topics/", "topic-name", ""), (), (), ()),
+    "delete-database-user": ("DELETE", ("databases/", "database-id", "/users/", "username", ""), (), (), ()),
+    "delete-dns-domain": ("DELETE", ("domains/", "dns-domain", ""), (), (), ()),
+    "delete-dns-domain-record": ("DELETE", ("domains/", "dns-domain", "/records/", "record-id", ""), (), (), ()),
+    "delete-firewall-group": ("DELETE", ("firewalls/", "firewall-group-id", ""), (), (), ()),
+    "delete-firewall-group-rule": ("DELETE", ("firewalls/", "firewall-group-id", "/rules/", "firewall-rule-id", ""), (), (), ()),
+    "delete-inference": ("DELETE", ("inference/", "inference-id", ""), (), (), ()),
+    "delete-instance": ("DELETE", ("instances/", "instance-id", ""), (), (), ()),
+    "delete-instance-ipv4": ("DELETE", ("instances/", "instance-id", "/ipv4/", "ipv4", ""), (), (), ()),
+    "delete-instance-reverse-ipv6": ("DELETE", ("instances/", "instance-id", "/ipv6/reverse/", "ipv6", ""), (), (), ()),
+    "delete-iso": ("DELETE", ("iso/", "iso-id", ""), (), (), ()),
+    "delete-kubernetes-cluster": ("DELETE", ("kubernetes/clusters/", "vke-id", ""), (), (), ()),
+    "delete-kubernetes-cluster-vke-id-delete-with-linked-resources": ("DELETE", ("kubernetes/clusters/", "vke-id", "/delete-with-linked-resources"), (), (), ()),
+    "delete-load-balancer": ("DELETE", ("load-balancers/", "load-balancer-id", ""), (), (), ()),
+    "delete-load-balancer-auto-ssl": ("DELETE", ("load-balancers/", "load-balancer-id", "/auto_ssl"), (), (), ()),
+    "delete-load-balancer-forwarding-rule": ("DELETE", ("load-balancers/", "load-balancer-id", "/forwarding-rules/", "forwarding-rule-id", ""), (), (), ()),
+    "delete-load-balancer-ssl": ("DELETE", ("load-balancers/", "load-balancer-id", "/ssl"), (), (), ()),
+    "delete-network": ("DELETE", ("private-networks/", "network-id", ""), (), (), ()),
+    "delete-nodepool": ("DELETE", ("kubernetes/clusters/", "vke-id", "/node-pools/", "nodepool-id", ""), (), (), ()),
+    "delete-nodepool-instance": ("DELETE", ("kubernetes/clusters/", "vke-id", "/node-pools/", "nodepool-id", "/nodes/", "node-id", ""), (), (), ()),
+    "delete-object-storage": ("DELETE", ("object-storage/", "object-storage-id", ""), (), (), ()),
+    "delete-pullzone": ("DELETE", ("cdns/pull-zones/", "pullzone-id", ""), (), (), ()),
+    "delete-pushzone": ("DELETE", ("cdns/push-zones/", "pushzone-id", ""), (), (), ()),
+    "delete-pushzone-file": ("DELETE", ("cdns/push-zones/", "pushzone-id", "/files/", "file-name", ""), (), (), ()),
+    "delete-registry": ("DELETE", ("registry/", "registry-id", ""), (), (), ()),
+    "delete-repository": ("DELETE", ("registry/", "registry-id", "/repository/", "repository-image", ""), (), (), ()),
+    "delete-reserved-ip": ("DELETE", ("reserved-ips/", "reserved-ip", ""), (), (), ()),
+    "delete-robot": ("DELETE", ("registry/", "registry-id", "/robot/", "robot-name", ""), (), (), ()),
+    "delete-snapshot": ("DELETE", ("snapshots/", "snapshot-id", ""), (), (), ()),
+    "delete-ssh-key": ("DELETE", ("ssh-keys/", "ssh-key-id", ""), (), (), ()),
+    "delete-startup-script": ("DELETE", ("startup-scripts/", "startup-id", ""), (), (), ()),
+    "delete-user": ("DELETE", ("users/", "user-id", ""), (), (), ()),
+    "delete-vpc": ("DELETE", ("vpcs/", "vpc-id", ""), (), (), ()),
+    "delete-vpc2": ("DELETE", ("vpc2/", "vpc-id", ""), (), (), ()),
+    "deleteVFS": ("DELETE", ("vfs/", "vfs_id", ""), (), (), ()),
+    "deleteVFSAttachment": ("DELETE", ("vfs/", "vfs_id", "/attachments/", "vps_id", ""), (), (), ()),
+    "detach-baremetal-vpc2": ("POST", ("bare-metals/", "baremetal-id", "/vpc2/detach"), (), (), ("vpc_id",)),
+    "detach-baremetal-vpcs": ("POST", ("bare-metals/", "baremetal-id", "/vpcs/detach"), (), (), ("vpc_id",)),
+    "detach-block": ("POST", ("blocks/", "block-id", "/detach"), (), (), ("live",)),
+    "detach-instance-iso": ("POST", ("instances/", "instance-id", "/iso/detach"), (), (), ()),
+    "detach-instance-network": ("POST", ("instances/", "instance-id", "/private-networks/detach"), (), (), ("network_id",)),
+    "detach-instance-vpc": ("POST", ("instances/", "instance-id", "/vpcs/detach"), (), (), ("vpc_id",)),
+    "detach-instance-vpc2": ("POST", ("instances/", "instance-id", "/vpc2/detach"), (), ("vpc_id",), ("vpc_id",)),
+    "detach-reserved-ip": ("POST", ("reserved-ips/", "reserved-ip", "/detach"), (), (), ()),
+    "detach-vpc2-nodes": ("POST", ("vpc2/", "vpc-id", "/nodes/detach"), (), ("nodes",), ("nodes",)),
+    "get-account": ("GET", ("account",), (), (), ()),
+    "get-account-bandwidth": ("GET", ("account/bandwidth",), (), (), ()),
+    "get-account-bgp": ("GET", ("account/bgp",), (), (), ()),
+    "get-backup": ("GET", ("backups/", "backup-id", ""), (), (), ()),
+    "get-backup-information": ("GET", ("databases/", "database-id", "/backups"), (), (), ()),
+    "get-bandwidth-baremetal": ("GET", ("bare-metals/", "baremetal-id", "/bandwidth"), (), (), ()),
+    "get-bare-metal-userdata": ("GET", ("bare-metals/", "baremetal-id", "/user-data"), (), (), ()),
+    "get-bare-metal-vnc": ("GET", ("bare-metals/", "baremetal-id", "/vnc"), (), (), ()),
+    "get-bare-metals-upgrades": ("GET", ("bare-metals/", "baremetal-id", "/upgrades"), ("type",), (), ()),
+    "get-baremetal": ("GET", ("bare-metals/", "baremetal-id", ""), (), (), ()),
+    "get-block": ("GET", ("blocks/", "block-id", ""), (), (), ()),
+    "get-cdn-push-zone-file": ("GET", ("cdns/push-zones/", "pushzone-id", "/files/", "file-name", ""), (), (), ()),
+    "get-connection-pool": ("GET", ("databases/", "database-id", "/connection-pools/", "pool-name", ""), (), (), ()),
+    "get-database": ("GET", ("databases/", "database-id", ""), (), (), ()),
+    "get-database-connector": ("GET", ("databases/", "database-id", "/connectors/", "connector-name", ""), (), (), ()),
+    "get-database-connector-configuration-schema": ("GET", ("databases/", "database-id", "/available-connectors/", "connector-class", "/configuration"), (), (), ()),
+    "get-database-connector-status": ("GET", ("databases/", "database-id", "/connectors/", "connector-name", "/status"), (), (), ()),
+    "get-database-db": ("GET", ("databases/", "database-id", "/dbs/", "db-name", ""), (), (), ()),
+    "get-database-quota": ("GET", ("databases/", "database-id", "/quotas/", "client-id", "/", "username", ""), (), (), ()),
+    "get-database-topic": ("GET", ("databases/", "database-id", "/topics/", "topic-name", ""), (), (), ()),
+    "get-database-usage": ("GET", ("databases/", "database-id", "/usage"), (), (), ()),
+    "get-database-user": ("GET", ("databases/", "database-id", "/users/", "username", ""), (), (), ()),
+    "get-dns-domain": ("GET", ("domains/", "dns-domain", ""), (), (), ()),
+    "get-dns-domain-dnssec": ("GET", ("domains/", "dns-domain", "/dnssec"), (), (), ()),
+    "get-dns-domain-record": ("GET", ("domains/", "dns-domain", "/records/", "record-id", ""), (), (), ()),
+    "get-dns-domain-soa": ("GET", ("domains/", "dns-domain", "/soa"), (), (), ()),
+    "get-firewall-group": ("GET", ("firewalls/", "firewall-group-id", ""), (), (), ()),
+    "get-firewall-group-rule": ("GET", ("firewalls/", "firewall-group-id", "/rules/", "firewall-rule-id", ""), (), (), ()),
+    "get-inference": ("GET", ("inference/", "inference-id", ""), (), (), ()),
+    "get-inference-usage": ("GET", ("inference/", "inference-id", "/usage"), (), (), ()),
+    "get-instance": ("GET", ("instances/", "instance-id", ""), (), (), ()),
+    "get-instance-backup-schedule": ("GET", ("instances/", "instance-id", "/backup-schedule"), (), (), ()),
+    "get-instance-bandwidth": ("GET", ("instances/", "instance-id", "/bandwidth"), ("date_range",), (), ()),
+    "get-instance-ipv4": ("GET", ("instances/", "instance-id", "/ipv4"), ("public_network", "per_page", "cursor"), (), ()),
+    "get-instance-ipv6": ("GET", ("instances/", "instance-id", "/ipv6"), (), (), ()),
+    "get-instance-iso-status": ("GET", ("instances/", "instance-id", "/iso"), (), (), ()),
+    "get-instance-neighbors": ("GET", ("instances/", "instance-id", "/neighbors"), (), (), ()),
+    "get-instance-upgrades": ("GET", ("instances/", "instance-id", "/upgrades"), ("type",), (), ()),
+    "get-instance-userdata": ("GET", ("instances/", "instance-id", "/user-data"), (), (), ()),
+    "get-invoice": ("GET", ("billing/invoices/", "invoice-id", ""), (), (), ()),
+    "get-invoice-items": ("GET", ("billing/invoices/", "invoice-id", "/items"), (), (), ()),
+    "get-ipv4-baremetal": ("GET", ("bare-metals/", "baremetal-id", "/ipv4"), (), (), ()),
+    "get-ipv6-baremetal": ("GET", ("bare-metals/", "baremetal-id", "/ipv6"), (), (), ()),
+    "get-kubernetes-available-upgrades": ("GET", ("kubernetes/clusters/", "vke-id", "/available-upgrades"), (), (), ()),
+    "get-kubernetes-clusters": ("GET", ("kubernetes/clusters/", "vke-id", ""), (), (), ()),
+    "get-kubernetes-clusters-config": ("GET", ("kubernetes/clusters/", "vke-id", "/config"), (), (), ()),
+    "get-kubernetes-resources": ("GET", ("kubernetes/clusters/", "vke-id", "/resources"), (), (), ()),
+    "get-kubernetes-versions": ("GET", ("kubernetes/versions",), (), (), ()),
+    "get-load-balancer": ("GET", ("load-balancers/", "load-balancer-id", ""), (), (), ()),
+    "get-load-balancer-forwarding-rule": ("GET", ("load-balancers/", "load-balancer-id", "/forwarding-rules/", "forwarding-rule-id", ""), (), (), ()),
+    "get-loadbalancer-firewall-rule": ("GET", ("load-balancers/", "loadbalancer-id", "/firewall-rules/", "firewall-rule-id", ""), (), (), ()),
+    "get-network": ("GET", ("private-networks/", "network-id", ""), (), (), ()),
+    "get-nodepool": ("GET", ("kubernetes/clusters/", "vke-id", "/node-pools/", "nodepool-id", ""), (), (), ()),
+    "get-nodepools": ("GET", ("kubernetes/clusters/", "vke-id", "/node-pools"), (), (), ()),
+    "get-object-storage": ("GET", ("object-storage/", "object-storage-id", ""), (), (), ()),
+    "get-pullzone": ("GET", ("cdns/pull-zones/", "pullzone-id", ""), (), (), ()),
+    "get-pushzone": ("GET", ("cdns/push-zones/", "pushzone-id", ""), (), (), ()),
+    "get-pushzone-files": ("GET", ("cdns/push-zones/", "pushzone-id", "/files"), (), (), ()),
+    "get-reserved-ip": ("GET", ("reserved-ips/", "reserved-ip", ""), (), (), ()),
+    "get-snapshot": ("GET", ("snapshots/", "snapshot-id", ""), (), (), ()),
+    "get-ssh-key": ("GET", ("ssh-keys/", "ssh-key-id", ""), (), (), ()),
+    "get-startup-script": ("GET", ("startup-scripts/", "startup-id", ""), (), (), ()),
+    "get-user": ("GET", ("users/", "user-id", ""), (), (), ()),
+    "get-vpc": ("GET", ("vpcs/", "vpc-id", ""), (), (), ()),
+    "get-vpc2": ("GET", ("vpc2/", "vpc-id", ""), (), (), ()),
+    "getVFS": ("GET", ("vfs/", "vfs_id", ""), (), (), ()),
+    "getVFSAttachment": ("GET", ("vfs/", "vfs_id", "/attachments/", "vps_id", ""), (), (), ()),
+    "halt-baremetal": ("POST", ("bare-metals/", "baremetal-id", "/halt"), (), (), ()),
+    "halt-baremetals": ("POST", ("bare-metals/halt",), (), (), ("baremetal_ids",)),
+    "halt-instance": ("POST", ("instances/", "instance-id", "/halt"), (), (), ()),
+    "halt-instances": ("POST", ("instances/halt",), (), (), ("instance_ids",)),
+    "iso-get": ("GET", ("iso/", "iso-id", ""), (), (), ()),
+    "list-advanced-options": ("GET", ("databases/", "database-id", "/advanced-options"), (), (), ()),
+    "list-applications": ("GET", ("applications",), ("type", "per_page", "cursor"), (), ()),
+    "list-available-plans-region": ("GET", ("regions/", "region-id", "/availability"), ("type",), (), ()),
+    "list-available-versions": ("GET", ("databases/", "database-id", "/version-upgrade"), (), (), ()),
+    "list-backups": ("GET", ("backups",), ("instance_id", "per_page", "cursor"), (), ()),
+    "list-baremetal-vpc2": ("GET", ("bare-metals/", "baremetal-id", "/vpc2"), (), (), ()),
+    "list-baremetal-vpcs": ("GET", ("bare-metals/", "baremetal-id", "/vpcs"), (), (), ()),
+    "list-baremetals": ("GET", ("bare-metals",), ("per_page", "cursor"), (), ()),
+    "list-billing-history": ("GET", ("billing/history",), (), (), ()),
+    "list-blocks": ("GET", ("blocks",), ("per_page", "cursor"), (), ()),
+    "list-connection-pools": ("GET", ("databases/", "database-id", "/connection-pools"), (), (), ()),
+    "list-database-available-connectors": ("GET", ("databases/", "database-id", "/available-connectors"), (), (), ()),
+    "list-database-connectors": ("GET", ("databases/", "database-id", "/connectors"), (), (), ()),
+    "list-database-dbs": ("GET", ("databases/", "database-id", "/dbs"), (), (), ()),
+    "list-database-plans": ("GET", ("databases/plans",), ("engine", "nodes", "region"), (), ()),
+    "list-database-quotas": ("GET", ("databases/", "database-id", "/quotas"), (), (), ()),
+    "list-database-topics": ("GET", ("databases/", "database-id", "/topics"), (), (), ()),
+    "list-database-users": ("GET", ("databases/", "database-id", "/users"), (), (), ()),
+    "list-databases": ("GET", ("databases",), ("label", "tag", "region"), (), ()),
+    "list-dns-domain-records": ("GET", ("domains/", "dns-domain", "/records"), ("per_page", "cursor"), (), ()),
+    "list-dns-domains": ("GET", ("domains",), ("per_page", "cursor"), (), ()),
+    "list-firewall-group-rules": ("GET", ("firewalls/", "firewall-group-id", "/rules"), ("per_page", "cursor"), (), ()),
+    "list-firewall-groups": ("GET", ("firewalls",), ("per_page", "cursor"), (), ()),
+    "list-inference": ("GET", ("inference",), (), (), ()),
+    "list-instance-ipv6-reverse": ("GET", ("instances/", "instance-id", "/ipv6/reverse"), (), (), ()),
+    "list-instance-private-networks": ("GET", ("instances/", "instance-id", "/private-networks"), ("per_page", "cursor"), (), ()),
+    "list-instance-vpc2": ("GET", ("instances/", "instance-id", "/vpc2"), ("per_page", "cursor"), (), ()),
+    "list-instance-vpcs": ("GET", ("instances/", "instance-id", "/vpcs"), ("per_page", "cursor"), (), ()),
+    "list-instances": ("GET", ("instances",), ("per_page", "cursor", "tag", "label", "main_ip", "region", "firewall_group_id", "hostname", "show_pending_charges"), (), ()),
+    "list-invoices": ("GET", ("billing/invoices",), (), (), ()),
+    "list-isos": ("GET", ("iso",), ("per_page", "cursor"), (), ()),
+    "list-kubernetes-clusters": ("GET", ("kubernetes/clusters",), (), (), ()),
+    "list-load-balancer-forwarding-rules": ("GET", ("load-balancers/", "load-balancer-id", "/forwarding-rules"), ("per_page", "cursor"), (), ()),
+    "list-load-balancers": ("GET", ("load-balancers",), ("per_page", "cursor"), (), ()),
+    "list-loadbalancer-firewall-rules": ("GET", ("load-balancers/", "loadbalancer-id", "/firewall-rules"), ("per_page", "cursor"), (), ()),
+    "list-maintenance-updates": ("GET", ("databases/", "database-id", "/maintenance"), (), (), ()),
+    "list-marketplace-app-variables": ("GET", ("marketplace/apps/", "image-id", "/variables"), (), (), ()),
+    "list-metal-plans": ("GET", ("plans-metal",), ("per_page", "cursor"), (), ()),
+    "list-networks": ("GET", ("private-networks",), ("per_page", "cursor"), (), ()),
+    "list-object-storage-cluster-tiers": ("GET", ("object-storage/clusters/", "cluster-id", "/tiers"), (), (), ()),
+    "list-object-storage-clusters": ("GET", ("object-storage/clusters",), ("per_page", "cursor"), (), ()),
+    "list-object-storage-tiers": ("GET", ("object-storage/tiers",), (), (), ()),
+    "list-object-storages": ("GET", ("object-storage",), ("per_page", "cursor"), (), ()),
+    "list-os": ("GET", ("os",), ("per_page", "cursor"), (), ()),
+    "list-plans": ("GET", ("plans",), ("type", "per_page", "cursor", "os"), (), ()),
+    "list-public-isos": ("GET", ("iso-public",), (), (), ()),
+    "list-pullzones": ("GET", ("cdns/pull-zones",), (), (), ()),
+    "list-pushzones": ("GET", ("cdns/push-zones",), (), (), ()),
+    "list-regions": ("GET", ("regions",), ("per_page", "cursor"), (), ()),
+    "list-registries": ("GET", ("registries",), (), (), ()),
+    "list-registry-plans": ("GET", ("registry/plan/list",), (), (), ()),
+    "list-registry-regions": ("GET", ("registry/region/list",), (), (), ()),
+    "list-registry-repositories": ("GET", ("registry/", "registry-id", "/repositories"), (), (), ()),
+    "list-registry-repository-artifacts": ("GET", ("registry/", "registry-id", "/repository/", "repository-image", "/artifacts"), (), (), ()),
+    "list-registry-robots": ("GET", ("registry/", "registry-id", "/robots"), (), (), ()),
+    "list-reserved-ips": ("GET", ("reserved-ips",), ("per_page", "cursor"), (), ()),
+    "list-service-alerts": ("POST", ("databases/", "database-id", "/alerts"), (), ("period",), ("period",)),
+    "list-snapshots": ("GET", ("snapshots",), ("description", "per_page", "cursor"), (), ()),
+    "list-ssh-keys": ("GET", ("ssh-keys",), ("per_page", "cursor"), (), ()),
+    "list-startup-scripts": ("GET", ("startup-scripts",), ("per_page", "cursor"), (), ()),
+    "list-subaccounts": ("GET", ("subaccounts",), ("per_page", "cursor"), (), ()),
+    "list-users": ("GET", ("users",), ("per_page", "cursor"), (), ()),
+    "list-vpc2": ("GET", ("vpc2",), ("per_page", "cursor"), (), ()),
+    "list-vpc2-nodes": ("GET", ("vpc2/", "vpc-id", "/nodes"), ("per_page", "cursor"), (), ()),
+    "list-vpcs": ("GET", ("vpcs",), ("per_page", "cursor"), (), ()),
+    "listRegions": ("GET", ("vfs/regions",), (), (), ()),
+    "listVFS": ("GET", ("vfs",), (), (), ()),
+    "listVFSAttachments": ("GET", ("vfs/", "vfs_id", "/attachments"), (), (), ()),
+    "patch-reserved-ips-reserved-ip": ("PATCH", ("reserved-ips/", "reserved-ip", ""), (), ("label",), ("label",)),
+    "pause-database-connector": ("POST", ("databases/", "database-id", "/connectors/", "connector-name", "/pause"), (), (), ()),
+    "pending-charges": ("GET", ("billing/pending-charges",), (), (), ()),
+    "post-baremetal-instance-id-ipv4-reverse-default": ("POST", ("bare-metals/", "baremetal-id", "/ipv4/reverse/default"), (), ("ip",), ("ip",)),
+    "post-firewalls-firewall-group-id-rules": ("POST", ("firewalls/", "firewall-group-id", "/rules"), (), ("ip_type", "protocol", "subnet", "subnet_size"), ("ip_type", "protocol", "subnet", "subnet_size", "port", "source", "notes")),
+    "post-instances-instance-id-ipv4-reverse-default": ("POST", ("instances/", "instance-id", "/ipv4/reverse/default"), (), ("ip",), ("ip",)),
+    "purge-pullzone": ("GET", ("cdns/pull-zones/", "pullzone-id", "/purge"), (), (), ()),
+    "put-snapshots-snapshot-id": ("PUT", ("snapshots/", "snapshot-id", ""), (), ("description",), ("description",)),
+    "read-artifact": ("GET", ("registry/", "registry-id", "/repository/", "repository-image", "/artifact/", "artifact-digest", ""), (), (), ()),
+    "read-registry": ("GET", ("registry/", "registry-id", ""), (), (), ()),
+    "read-registry-repository": ("GET", ("registry/", "registry-id", "/repository/", "repository-image", ""), (), (), ()),
+    "read-robot": ("GET", ("registry/", "registry-id", "/robot/", "robot-name", ""), (), (), ()),
+    "reboot-bare-metals": ("POST", ("bare-metals/reboot",), (), (), ("baremetal_ids",)),
+    "reboot-baremetal": ("POST", ("bare-metals/", "baremetal-id", "/reboot"), (), (), ()),
+    "reboot-instance": ("POST", ("instances/", "instance-id", "/reboot"), (), (), ()),
+    "reboot-instances": ("POST", ("instances/reboot",), (), (), ("instance_ids",)),
+    "recycle-nodepool-instance": ("POST", ("kubernetes/clusters/", "vke-id", "/node-pools/", "nodepool-id", "/nodes/", "node-id", "/recycle"), (), (), ()),
+    "regenerate-object-storage-keys": ("POST", ("object-storage/", "object-storage-id", "/regenerate-keys"), (), (), ()),
+    "reinstall-baremetal": ("POST", ("bare-metals/", "baremetal-id", "/reinstall"), (), (), ("hostname",)),
+    "reinstall-instance": ("POST", ("instances/", "instance-id", "/reinstall"), (), (), ("hostname",)),
+    "restart-database-connector": ("POST", ("databases/", "database-id", "/connectors/", "connector-name", "/restart"), (), (), ()),
+    "restart-database-connector-task": ("POST", ("databases/", "database-id", "/connectors/", "connector-name", "/tasks/", "task-id", "/restart"), (), (), ()),
+    "restore-instance": ("POST", ("instances/", "instance-id", "/restore"), (), (), ("backup_id", "snapshot_id")),
+    "resume-database-connector": ("POST", ("databases/", "database-id", "/connectors/", "connector-name", "/resume"), (), (), ()),
+    "set-database-user-acl": ("PUT", ("databases/", "database-id", "/users/", "username", "/access-control"), (), (), ("redis_acl_categories", "redis_acl_channels", "redis_acl_commands", "redis_acl_keys", "acl_categories", "acl_channels", "acl_commands", "acl_keys", "permission")),
+    "start-bare-metals": ("POST", ("bare-metals/start",), (), (), ("baremetal_ids",)),
+    "start-baremetal": ("POST", ("bare-metals/", "baremetal-id", "/start"), (), (), ()),
+    "start-instance": ("POST", ("instances/", "instance-id", "/start"), (), (), ()),
+    "start-instances": ("POST", ("instances/start",), (), (), ("instance_ids",)),
+    "start-kubernetes-cluster-upgrade": ("POST", ("kubernetes/clusters/", "vke-id", "/upgrades"), (), ("upgrade_version",), ("upgrade_version",)),
+    "start-maintenance-updates": ("POST", ("databases/", "database-id", "/maintenance"), (), (), ()),
+    "start-version-upgrade": ("POST", ("databases/", "database-id", "/version-upgrade"), (), ("version",), ("version",)),
+    "update-advanced-options": ("PUT", ("databases/", "database-id", "/advanced-options"), (), (), ("autovacuum_analyze_scale_factor", "autovacuum_analyze_threshold", "autovacuum_freeze_max_age", "autovacuum_max_workers", "autovacuum_naptime", "autovacuum_vacuum_cost_delay", "autovacuum_vacuum_cost_limit", "autovacuum_vacuum_scale_factor", "autovacuum_vacuum_threshold", "bgwriter_delay", "bgwriter_flush_after", "bgwriter_lru_maxpages", "bgwriter_lru_multiplier", "deadlock_timeout", "default_toast_compression", "idle_in_transaction_session_timeout", "jit", "log_autovacuum_min_duration", "log_error_verbosity", "log_line_prefix", "log_min_duration_statement", "max_files_per_process", "max_locks_per_transaction", "max_logical_replication_workers", "max_parallel_workers", "max_parallel_workers_per_gather", "max_pred_locks_per_transaction", "max_prepared_transactions", "max_replication_slots", "max_stack_depth", "max_standby_archive_delay", "max_standby_streaming_delay", "max_wal_senders", "max_worker_processes", "pg_partman_bgw.interval", "pg_partman_bgw.role", "pg_stat_statements.track", "temp_file_limit", "track_activity_query_size", "track_commit_timestamp", "track_functions", "track_io_timing", "wal_sender_timeout", "wal_writer_delay", "connect_timeout", "group_concat_max_len", "innodb_change_buffer_max_size", "innodb_flush_neighbors", "innodb_ft_min_token_size", "innodb_ft_server_stopword_table", "innodb_lock_wait_timeout", "innodb_log_buffer_size", "innodb_online_alter_log_max_size", "innodb_print_all_deadlocks", "innodb_read_io_threads", "innodb_rollback_on_timeout", "innodb_thread_concurrency", "innodb_write_io_threads", "internal_tmp_mem_storage_engine", "net_buffer_length", "net_read_timeout", "net_write_timeout", "wait_timeout", "max_allowed_packet", "max_heap_table_size", "sort_buffer_size", "tmp_table_size", "compression_type", "group_initial_rebalance_delay_ms", "group_min_session_timeout_ms", "group_max_session_timeout_ms", "connections_max_idle_ms", "max_incremental_fetch_session_cache_slots", "message_max_bytes", "offsets_retention_minutes", "log_cleaner_delete_retention_ms", "log_cleaner_min_cleanable_ratio", "log_cleaner_max_compaction_lag_ms", "log_cleaner_min_compaction_lag_ms", "log_cleanup_policy", "log_flush_interval_messages", "log_flush_interval_ms", "log_index_interval_bytes", "log_index_size_max_bytes", "log_local_retention_ms", "log_local_retention_bytes", "log_message_downconversion_enable", "log_message_timestamp_type", "log_message_timestamp_difference_max_ms", "log_preallocate", "log_retention_bytes", "log_retention_hours", "log_retention_ms", "log_roll_jitter_ms", "log_roll_ms", "log_segment_bytes", "log_segment_delete_delay_ms", "auto_create_topics_enable", "min_insync_replicas", "num_partitions", "default_replication_factor", "replica_fetch_max_bytes", "replica_fetch_response_max_bytes", "max_connections_per_ip", "producer_purgatory_purge_interval_requests", "sasl_oauthbearer_expected_audience", "sasl_oauthbearer_expected_issuer", "sasl_oauthbearer_jwks_endpoint_url", "sasl_oauthbearer_sub_claim_name", "socket_request_max_bytes", "transaction_state_log_segment_bytes", "transaction_remove_expired_transaction_cleanup_interval_ms", "transaction_partition_verification_enable")),
+    "update-baremetal": ("PATCH", ("bare-metals/", "baremetal-id", ""), (), (), ("user_data", "label", "tag", "os_id", "app_id", "image_id", "enable_ipv6", "attach_vpc2", "detach_vpc2", "enable_vpc2", "tags", "user_scheme", "mdisk_mode", "ipxe_chain_url")),
+    "update-block": ("PATCH", ("blocks/", "block-id", ""), (), (), ("label", "size_gb")),
+    "update-connection-pool": ("PUT", ("databases/", "database-id", "/connection-pools/", "pool-name", ""), (), (), ("database", "username", "mode", "size")),
+    "update-container-registry-password": ("PUT", ("registry/", "registry-id", "/user/password"), (), (), ("old_password", "new_password")),
+    "update-database": ("PUT", ("databases/", "database-id", ""), (), (), ("region", "plan", "label", "tag", "vpc_id", "maintenance_dow", "maintenance_time", "cluster_time_zone", "trusted_ips", "mysql_sql_modes", "mysql_require_primary_key", "mysql_slow_query_log", "mysql_long_query_time", "redis_eviction_policy", "eviction_policy")),
+    "update-database-connector": ("PUT", ("databases/", "database-id", "/connectors/", "connector-name", ""), (), (), ("topics", "config")),
+    "update-database-topic": ("PUT", ("databases/", "database-id", "/topics/", "topic-name", ""), (), (), ("partitions", "replication", "retention_hours", "retention_bytes")),
+    "update-database-user": ("PUT", ("databases/", "database-id", "/users/", "username", ""), (), ("password",), ("password",)),
+    "update-dns-domain": ("PUT", ("domains/", "dns-domain", ""), (), ("dns_sec",), ("dns_sec",)),
+    "update-dns-domain-record": ("PATCH", ("domains/", "dns-domain", "/records/", "record-id", ""), (), (), ("name", "data", "ttl", "priority")),
+    "update-dns-domain-soa": ("PATCH", ("domains/", "dns-domain", "/soa"), (), (), ("nsprimary", "email")),
+    "update-firewall-group": ("PUT", ("firewalls/", "firewall-group-id", ""), (), ("description",), ("description",)),
+    "update-inference": ("PATCH", ("inference/", "inference-id", ""), (), (), ("label",)),
+    "update-instance": ("PATCH", ("instances/", "instance-id", ""), (), (), ("app_id", "image_id", "backups", "firewall_group_id", "enable_ipv6", "os_id", "user_data", "tag", "plan", "ddos_protection", "attach_private_network", "attach_vpc", "attach_vpc2", "detach_private_network", "detach_vpc", "detach_vpc2", "enable_private_network", "enable_vpc", "enable_vpc2", "label", "tags", "user_scheme")),
+    "update-kubernetes-cluster": ("PUT", ("kubernetes/clusters/", "vke-id", ""), (), ("label",), ("label",)),
+    "update-load-balancer": ("PATCH", ("load-balancers/", "load-balancer-id", ""), (), (), ("ssl", "sticky_session", "forwarding_rules", "health_check", "proxy_protocol", "timeout", "ssl_redirect", "http2", "http3", "nodes", "balancing_algorithm", "instances", "label", "private_network", "vpc", "firewall_rules", "auto_ssl", "global_regions")),
+    "update-network": ("PUT", ("private-networks/", "network-id", ""), (), ("description",), ("description",)),
+    "update-nodepool": ("PATCH", ("kubernetes/clusters/", "vke-id", "/node-pools/", "nodepool-id", ""), (), (), ("node_quantity", "tag", "auto_scaler", "min_nodes", "max_nodes", "labels", "taints")),
+    "update-object-storage": ("PUT", ("object-storage/", "object-storage-id", ""), (), ("label",), ("label",)),
+    "update-pullzone": ("PUT", ("cdns/pull-zones/", "pullzone-id", ""), (), (), ("label", "vanity_domain", "ssl_cert", "ssl_cert_key", "cors", "gzip", "block_ai", "block_bad_bots", "regions")),
+    "update-pushzone": ("PUT", ("cdns/push-zones/", "pushzone-id", ""), (), (), ("label", "vanity_domain", "ssl_cert", "ssl_cert_key", "cors", "gzip", "block_ai", "block_bad_bots", "regions")),
+    "update-registry": ("PUT", ("registry/", "registry-id", ""), (), (), ("public", "plan")),
+    "update-repository": ("PUT", ("registry/", "registry-id", "/repository/", "repository-image", ""), (), (), ("description",)),
+    "update-robot": ("PUT", ("registry/", "registry-id", "/robot/", "robot-name", ""), (), (), ("description", "disable", "duration", "access")),
+    "update-ssh-key": ("PATCH", ("ssh-keys/", "ssh-key-id", ""), (), (), ("name", "ssh_key")),
+    "update-startup-script": ("PATCH", ("startup-scripts/", "startup-id", ""), (), (), ("name", "script", "type")),
+    "update-user": ("PATCH", ("users/", "user-id", ""), (), (), ("email", "name", "password", "api_enabled", "acls")),
+    "update-vpc": ("PUT", ("vpcs/", "vpc-id", ""), (), ("description",), ("description",)),
+    "update-vpc2": ("PUT", ("vpc2/", "vpc-id", ""), (), ("description",), ("description",)),
+    "updateVFS": ("PUT", ("vfs/", "vfs_id", ""), (), (), ("label", "storage_size")),
+    "view-migration-status": ("GET", ("databases/", "database-id", "/migration"), (), (), ()),
+}
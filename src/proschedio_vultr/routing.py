@@ -0,0 +1,115 @@
+"""
+Typed lookups over the route table generated from `openapi.json` (see `routes.py`).
+
+Only `Request.for_route()` and payload validation use it. The hand-written actions build their
+URLs from `urls.py`, which stays authoritative for them; `tests/test_routes.py` checks that
+every `urls.py` template still has a matching route here.
+"""
+from collections.abc import Iterator
+from http import HTTPMethod
+from typing import NamedTuple
+
+from .request import Url, api_path
+from .routes import ROUTES, SERVER_URL
+
+class Route(NamedTuple):
+    """
+    One operation of the Vultr API as compiled into `routes.py`.
+    """
+    operation_id: str
+    method: HTTPMethod
+    segments: tuple[str, ...]
+    query: tuple[str, ...]
+    required: tuple[str, ...]
+    properties: tuple[str, ...]
+
+    @property
+    def template(self) -> str:
+        """
+        The path template relative to the API root, e.g. `"instances/{instance-id}"`.
+        """
+        return "".join(
+            segment if i % 2 == 0 else f"{{{segment}}}"
+            for i, segment in enumerate(self.segments)
+        )
+
+    @property
+    def placeholders(self) -> tuple[str, ...]:
+        return self.segments[1::2]
+
+    def url(self, base_url: str = SERVER_URL) -> Url:
+        """
+        Return the route's `Url` template, built from the precompiled segments without any parsing.
+        """
+        return Url.compiled(base_url, self.template, self.segments)
+
+_cache: dict[str, Route] = {}
+
+def route(operation_id: str) -> Route:
+    """
+    Look up an operation by its OpenAPI operation id.
+
+    Raises:
+        KeyError: If the operation id is unknown.
+    """
+    cached = _cache.get(operation_id)
+    if cached is not None:
+        return cached
+    try:
+        method, segments, query, required, properties = ROUTES[operation_id]
+    except KeyError:
+        raise KeyError(f"Unknown operation id: {operation_id!r}") from None
+    cached = _cache[operation_id] = Route(operation_id, HTTPMethod(method), segments, query, required, properties)
+    return cached
+
+def routes() -> Iterator[Route]:
+    """
+    Iterate over every operation in the spec.
+    """
+    for operation_id in ROUTES:
+        yield route(operation_id)
+
+class _Node:
+    __slots__ = ("literals", "wildcard", "routes")
+
+    def __init__(self):
+        self.literals: dict[str, _Node] = {}
+        self.wildcard: _Node | None = None
+        self.routes: dict[HTTPMethod, Route] = {}
+
+_tree: _Node | None = None
+
+def _build_tree() -> _Node:
+    root = _Node()
+    for target in routes():
+        node = root
+        for component in target.template.strip("/").split("/"):
+            if component.startswith("{") and component.endswith("}"):
+                node.wildcard = node.wildcard or _Node()
+                node = node.wildcard
+            else:
+                node = node.literals.setdefault(component, _Node())
+        node.routes[target.method] = target
+    return root
+
+def _walk(node: _Node, components: list[str], position: int, method: HTTPMethod) -> Route | None:
+    if position == len(components):
+        return node.routes.get(method)
+    child = node.literals.get(components[position])
+    if child is not None:
+        found = _walk(child, components, position + 1, method)
+        if found is not None:
+            return found
+    if node.wildcard is not None:
+        return _walk(node.wildcard, components, position + 1, method)
+    return None
+
+def match(method: HTTPMethod, url: str) -> Route | None:
+    """
+    Find the operation a concrete URL belongs to, e.g. `get-instance` for `GET .../instances/abc`.
+    Literal path components take precedence over placeholders.
+    """
+    global _tree
+    if _tree is None:
+        _tree = _build_tree()
+    return _walk(_tree, api_path(url).split("/"), 0, method)
@@ -0,0 +1,272 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Generator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from .metrics import LATENCY_BUCKETS, Histogram
+from .request import ErrorResponse
+
+if TYPE_CHECKING:
+    from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_CLASSES: Final[tuple[str, ...]] = ("interactive", "default", "batch")
+"""Default priority classes, highest first."""
+
+class Priority(NamedTuple):
+    """
+    Priority class and tenant of the requests made inside a `use_priority()` block.
+    """
+    cls: str
+    tenant: str
+
+_priority: ContextVar[Priority | None] = ContextVar("proschedio_vultr_priority", default=None)
+
+@contextmanager
+def use_priority(cls: str, tenant: str = "default") -> Generator[Priority, None, None]:
+    """
+    Schedule every request made inside the block (and tasks spawned from it) in priority class
+    `cls` on behalf of `tenant`.
+
+    ```python
+    with use_priority("batch", tenant="nightly-billing"):
+        await paginate(Action.billings().get_billing_invoice_items, invoice_id).collect()
+    ```
+    """
+    priority = Priority(cls, tenant)
+    token = _priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _priority.reset(token)
+
+class _Waiter:
+    __slots__ = ("future", "family", "priority", "enqueued")
+
+    def __init__(self, future: asyncio.Future[float | None], family: str, priority: Priority):
+        self.future = future
+        self.family = family
+        self.priority = priority
+        self.enqueued = time.monotonic()
+
+class _Lane:
+    """
+    Queued requests of one API key: a weighted-fair-queueing heap per priority class. `size`
+    counts live waiters only; cancelled ones stay in the heaps until popped. `spare` is set while
+    a reserved token has not been handed to a waiter yet.
+    """
+    __slots__ = ("heaps", "finish", "clock", "size", "task", "spare")
+
+    def __init__(self, classes: Sequence[str]):
+        self.heaps: dict[str, list[tuple[float, int, _Waiter]]] = {cls: [] for cls in classes}
+        self.finish: dict[tuple[str, str], float] = {}
+        self.clock: dict[str, float] = dict.fromkeys(classes, 0.0)
+        self.size = 0
+        self.task: asyncio.Task[None] | None = None
+        self.spare = False
+
+class ClassMetrics:
+    """
+    Queue depth, dispatch counts and queueing delay of one priority class.
+    """
+    __slots__ = ("queued", "max_queued", "dispatched", "preempted", "wait")
+
+    def __init__(self):
+        self.queued = 0
+        self.max_queued = 0
+        self.dispatched = 0
+        self.preempted = 0
+        self.wait = Histogram(LATENCY_BUCKETS)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "dispatched": self.dispatched,
+            "preempted": self.preempted,
+            "wait_mean": self.wait.sum / self.wait.count if self.wait.count else 0.0,
+            "wait_p50": self.wait.quantile(0.5),
+            "wait_p99": self.wait.quantile(0.99),
+        }
+
+class PriorityScheduler:
+    """
+    Orders requests that compete for the same API key's rate budget.
+
+    Attach it with `Client(rate_limiter=RateLimiter(), scheduler=PriorityScheduler())` and mark
+    callers with `use_priority()`. Instead of every request reserving a token in arrival order,
+    requests queue per API key and one dispatcher per key hands out the limiter's tokens as they
+    become valid, so the rate limit is never exceeded:
+
+    - Priority classes are strict: a queued request of a higher class always goes first, even
+      if lower-class requests have been waiting longer.
+    - Within a class, tenants share the budget by weighted fair queueing: each request gets a
+      virtual finish time of `max(class clock, tenant's last finish) + 1 / weight`, and the
+      lowest one is dispatched next.
+    - When `max_queued` requests already wait for one key, an arriving request preempts the
+      newest queued request of the lowest class below its own, or is refused if there is none.
+      The request that loses fails with `status_code` 0 and `preempted` set; the retry policy
+      does not retry it and the circuit breaker does not count it.
+
+    Without a rate limiter requests are dispatched at once. Per-class queue depth, dispatch
+    and preemption counts, and queueing delay are returned by `metrics()`.
+    """
+    def __init__(
+        self,
+        classes: Sequence[str] = PRIORITY_CLASSES,
+        default_class: str = "default",
+        tenant_weights: Mapping[str, float] | None = None,
+        max_queued: int = 1000,
+    ):
+        """
+        Args:
+            classes (Sequence[str]): Priority classes, highest first.
+            default_class (str): Class of requests made outside `use_priority()`.
+            tenant_weights (Mapping[str, float] | None): Share of each tenant within its class. Unlisted tenants weigh 1.
+            max_queued (int): Requests that may wait per API key before lower-priority ones are preempted.
+        """
+        if default_class not in classes:
+            raise ValueError(f"default_class {default_class!r} is not one of {list(classes)}")
+
+        self._classes = tuple(classes)
+        self._rank = {cls: rank for rank, cls in enumerate(self._classes)}
+        self._default = Priority(default_class, "default")
+        self._weights = dict(tenant_weights or {})
+        self._max_queued = max_queued
+        self._lanes: dict[str, _Lane] = {}
+        self._sequence = itertools.count()
+        self._metrics = {cls: ClassMetrics() for cls in self._classes}
+
+    def _current(self) -> Priority:
+        priority = _priority.get()
+        if priority is None:
+            return self._default
+        if priority.cls not in self._rank:
+            logger.warning("scheduler.unknown_class class=%s; using %s", priority.cls, self._default.cls)
+            return Priority(self._default.cls, priority.tenant)
+        return priority
+
+    async def acquire(self, api_key: str, family: str, rate_limiter: 'RateLimiter | None') -> bool:
+        """
+        Wait until a request for `api_key` and `family` may be sent.
+
+        Returns:
+            bool: `False` if the request was preempted by higher-priority work and must not be sent.
+        """
+        priority = self._current()
+        metrics = self._metrics[priority.cls]
+        if rate_limiter is None:
+            metrics.dispatched += 1
+            metrics.wait.observe(0.0)
+            return True
+
+        lane = self._lanes.get(api_key)
+        if lane is None:
+            lane = self._lanes[api_key] = _Lane(self._classes)
+        if lane.size >= self._max_queued and not self._preempt(lane, priority):
+            metrics.preempted += 1
+            return False
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), family, priority)
+        self._push(lane, waiter)
+        if lane.task is None or lane.task.done():
+            lane.task = asyncio.create_task(self._dispatch(api_key, lane, rate_limiter))
+
+        try:
+            delay = await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.cancelled():  # still queued
+                lane.size -= 1
+                metrics.queued -= 1
+            raise
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+    def _push(self, lane: _Lane, waiter: _Waiter) -> None:
+        cls, tenant = waiter.priority
+        start = max(lane.clock[cls], lane.finish.get((cls, tenant), 0.0))
+        finish = start + 1.0 / self._weights.get(tenant, 1.0)
+        lane.finish[(cls, tenant)] = finish
+        heapq.heappush(lane.heaps[cls], (finish, next(self._sequence), waiter))
+        lane.size += 1
+        metrics = self._metrics[cls]
+        metrics.queued += 1
+        metrics.max_queued = max(metrics.max_queued, metrics.queued)
+
+    def _pop(self, lane: _Lane) -> _Waiter | None:
+        for cls in self._classes:
+            heap = lane.heaps[cls]
+            while heap:
+                finish, _, waiter = heapq.heappop(heap)
+                if waiter.future.done():
+                    continue  # cancelled while queued, already uncounted
+                lane.size -= 1
+                self._metrics[cls].queued -= 1
+                lane.clock[cls] = finish
+                return waiter
+        return None
+
+    def _preempt(self, lane: _Lane, priority: Priority) -> bool:
+        """
+        Fail the newest queued request of the lowest class below `priority`. Return whether one was found.
+        """
+        for cls in reversed(self._classes[self._rank[priority.cls] + 1:]):
+            heap = lane.heaps[cls]
+            live = [entry for entry in heap if not entry[2].future.done()]
+            if not live:
+                continue
+            victim = max(live, key=lambda entry: entry[1])
+            heap.remove(victim)
+            heapq.heapify(heap)
+            lane.size -= 1
+            metrics = self._metrics[cls]
+            metrics.queued -= 1
+            metrics.preempted += 1
+            victim[2].future.set_result(None)
+            logger.info("scheduler.preempted class=%s tenant=%s by=%s", cls, victim[2].priority.tenant, priority.cls)
+            return True
+        return False
+
+    async def _dispatch(self, api_key: str, lane: _Lane, rate_limiter: 'RateLimiter') -> None:
+        while lane.size:
+            if not lane.spare:
+                delay = rate_limiter.reserve(api_key)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lane.spare = True
+            # Pick only once the token is valid, so work queued meanwhile can still go first.
+            waiter = self._pop(lane)
+            if waiter is None:
+                break  # every waiter was cancelled meanwhile; the token goes to the next one
+            lane.spare = False
+            metrics = self._metrics[waiter.priority.cls]
+            metrics.dispatched += 1
+            metrics.wait.observe(time.monotonic() - waiter.enqueued)
+            waiter.future.set_result(rate_limiter.reserve_family(api_key, waiter.family))
+
+    def reset_after_fork(self) -> None:
+        """
+        Drop the queues and dispatch tasks inherited from the parent process; their waiters belong
+        to its event loop.
+        """
+        self._lanes.clear()
+        for metrics in self._metrics.values():
+            metrics.queued = 0
+
+    def rejection(self) -> ErrorResponse:
+        """
+        The error returned for a preempted request.
+        """
+        return ErrorResponse(status_code=0, error="Preempted by higher-priority requests", preempted=True, not_sent=True)
+
+    def metrics(self) -> dict[str, dict[str, object]]:
+        return {cls: metrics.snapshot() for cls, metrics in self._metrics.items()}
@@ -0,0 +1,37 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+class SingleFlight(Generic[K, V]):
+    """
+    De-duplicates concurrent calls that share a key.
+
+    The first caller for a key starts `fn()` in its own task; callers arriving while it is still
+    running await the same task instead of starting another. Because the work runs in a separate
+    task, cancelling one awaiter never cancels the call for the others.
+    """
+    def __init__(self):
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> tuple[V, bool]:
+        """
+        Returns:
+            tuple[V, bool]: The result, and whether it was shared with an earlier in-flight call.
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key, task=task: self._forget(key, task))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
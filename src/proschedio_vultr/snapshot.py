@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import logging
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Mapping
+from typing import Final, cast
+
+from rustipy.result import Err, Ok, Result
+
+from .pagination import Paginator
+from .request import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION: Final[int] = 1
+
+CATALOGS: Final[tuple[str, ...]] = ("regions", "plans", "plans_metal", "os", "applications")
+
+_MAGIC: Final[bytes] = b"PVCS"
+_HEADER: Final[struct.Struct] = struct.Struct("<4sHHdI")
+"""magic, format version, marshal version, fetched_at, table-of-contents length"""
+
+_AVAILABILITY: Final[str] = "availability"
+
+Catalog = list[dict[str, object]]
+Availability = dict[str, tuple[str, ...]]
+"""Plan ids by region id."""
+
+def _availability(catalogs: Mapping[str, list[object]]) -> Availability:
+    by_region: dict[str, list[str]] = {}
+    for name in ("plans", "plans_metal"):
+        for plan in catalogs.get(name, []):
+            if not isinstance(plan, dict):
+                continue
+            entry = cast(dict[str, object], plan)
+            for region in cast(list[str], entry.get("locations") or []):
+                by_region.setdefault(region, []).append(str(entry["id"]))
+    return {region: tuple(plans) for region, plans in by_region.items()}
+
+class CatalogSnapshot:
+    """
+    Read-only view of the region/plan/OS/application catalogs as of `fetched_at`.
+
+    Sections are decoded lazily on first access, so a process that only asks
+    `plans_in_region("ewr")` decodes the small precomputed availability index and nothing else.
+    """
+    def __init__(self, fetched_at: float, toc: dict[str, tuple[int, int, str]], buffer: bytes | mmap.mmap, base: int = 0):
+        self.fetched_at = fetched_at
+        self._toc = toc
+        self._buffer = buffer
+        self._base = base
+        self._catalogs: dict[str, Catalog] = {}
+        self._availability: Availability | None = None
+
+    @classmethod
+    def build(cls, catalogs: Mapping[str, list[object]], fetched_at: float | None = None) -> 'CatalogSnapshot':
+        """
+        Build a snapshot in memory from already fetched catalog lists.
+        """
+        sections: dict[str, list[object] | Availability] = {name: catalogs.get(name, []) for name in CATALOGS}
+        sections[_AVAILABILITY] = _availability(catalogs)
+
+        toc: dict[str, tuple[int, int, str]] = {}
+        blobs: list[bytes] = []
+        offset = 0
+        for name, value in sections.items():
+            blob = marshal.dumps(value)
+            toc[name] = (offset, len(blob), hashlib.sha256(blob).hexdigest()[:16])
+            blobs.append(blob)
+            offset += len(blob)
+        return cls(time.time() if fetched_at is None else fetched_at, toc, b"".join(blobs))
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def etag(self, name: str) -> str | None:
+        """
+        Content hash of a catalog section; unchanged catalogs keep the same tag across refreshes.
+        """
+        entry = self._toc.get(name)
+        return entry[2] if entry is not None else None
+
+    def _load(self, name: str) -> object:
+        entry = self._toc.get(name)
+        if entry is None:
+            raise KeyError(name)
+        offset, length, _ = entry
+        start = self._base + offset
+        return marshal.loads(self._buffer[start:start + length])
+
+    def catalog(self, name: str) -> Catalog:
+        """
+        Return one catalog list, e.g. `"plans"` or `"regions"`.
+        """
+        value = self._catalogs.get(name)
+        if value is None:
+            value = self._catalogs[name] = cast(Catalog, self._load(name))
+        return value
+
+    def plans_in_region(self, region_id: str) -> tuple[str, ...]:
+        """
+        Return the ids of every VPS and Bare Metal plan available in `region_id`.
+        """
+        if self._availability is None:
+            self._availability = cast(Availability, self._load(_AVAILABILITY))
+        return self._availability.get(region_id, ())
+
+    def to_bytes(self) -> bytes:
+        toc = marshal.dumps(self._toc)
+        header = _HEADER.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, marshal.version, self.fetched_at, len(toc))
+        return header + toc + bytes(self._buffer[self._base:])
+
+class SnapshotStore:
+    """
+    Versioned on-disk store for the catalog snapshot.
+
+    The file is a fixed header, a table of contents with per-section offsets and content hashes,
+    and `marshal`-encoded sections. It is memory-mapped on `load()`, so cold starts cost one
+    `mmap` plus decoding of whatever section is actually used. Writes go to a temporary file and
+    are swapped in with `os.replace`, so readers never see a partial snapshot.
+
+    ```python
+    store = SnapshotStore("/var/cache/vultr/catalog.bin")
+    snapshot = store.load()
+    if snapshot is None or store.is_stale(snapshot):
+        snapshot = (await store.refresh()).unwrap()
+    snapshot.plans_in_region("fra")
+    ```
+    """
+    def __init__(self, path: str | os.PathLike[str], max_age: float = 86400.0):
+        """
+        Args:
+            path (str | os.PathLike[str]): Location of the snapshot file.
+            max_age (float): Seconds after which `is_stale()` reports a snapshot as outdated.
+        """
+        self._path = os.fspath(path)
+        self._max_age = max_age
+        self._refresh_task: asyncio.Task[None] | None = None
+        self.current: CatalogSnapshot | None = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def is_stale(self, snapshot: CatalogSnapshot) -> bool:
+        return snapshot.age > self._max_age
+
+    def load(self) -> CatalogSnapshot | None:
+        """
+        Memory-map the snapshot file.
+
+        Returns:
+            CatalogSnapshot | None: The snapshot, or `None` when the file is missing, corrupt, or
+            was written by an incompatible format or Python version.
+        """
+        try:
+            with open(self._path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError, OSError) as e:
+            logger.debug("No usable catalog snapshot at %s: %s", self._path, e)
+            return None
+
+        try:
+            magic, version, marshal_version, fetched_at, toc_length = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC or version != SNAPSHOT_FORMAT_VERSION or marshal_version != marshal.version:
+                logger.info("Ignoring catalog snapshot %s with incompatible format", self._path)
+                buffer.close()
+                return None
+            start = _HEADER.size
+            toc = cast(dict[str, tuple[int, int, str]], marshal.loads(buffer[start:start + toc_length]))
+        except (struct.error, ValueError, EOFError, TypeError) as e:
+            logger.warning("Corrupt catalog snapshot %s: %s", self._path, e)
+            buffer.close()
+            return None
+
+        self.current = CatalogSnapshot(fetched_at, toc, buffer, base=_HEADER.size + toc_length)
+        return self.current
+
+    def save(self, snapshot: CatalogSnapshot) -> None:
+        """
+        Atomically write `snapshot` to the store's path.
+        """
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(snapshot.to_bytes())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.current = snapshot
+
+    async def fetch(self) -> Result[CatalogSnapshot, ErrorResponse]:
+        """
+        Download every catalog from the API, following pagination, into a new snapshot.
+        """
+        from .actions import Applications, OperatingSystems, Plans, PlansMetal, Regions
+
+        pagers = {
+            "regions": Paginator(Regions.list_regions),
+            "plans": Paginator(Plans.list_plans, "all", os_=None),
+            "plans_metal": Paginator(PlansMetal.list_metal_plans),
+            "os": Paginator(OperatingSystems.list_os_images),
+            "applications": Paginator(Applications.list_applications, "all"),
+        }
+        results = await asyncio.gather(*(pager.collect() for pager in pagers.values()))
+
+        catalogs: dict[str, list[object]] = {}
+        for name, result in zip(pagers, results):
+            if result.is_err():
+                return Err(result.unwrap_err())
+            catalogs[name] = result.unwrap()
+        return Ok(CatalogSnapshot.build(catalogs))
+
+    async def refresh(self) -> Result[CatalogSnapshot, ErrorResponse]:
+        """
+        Fetch fresh catalogs and persist them.
+
+        Returns:
+            Result[CatalogSnapshot, ErrorResponse]: The new snapshot, or the first fetch error.
+        """
+        result = await self.fetch()
+        if result.is_ok():
+            snapshot = result.unwrap()
+            previous = self.current
+            await asyncio.to_thread(self.save, snapshot)
+            if previous is not None:
+                changed = [name for name in CATALOGS if previous.etag(name) != snapshot.etag(name)]
+                logger.info("Catalog snapshot refreshed; changed sections: %s", changed or "none")
+        return result
+
+    def start_refresh(self, interval: float = 3600.0) -> asyncio.Task[None]:
+        """
+        Refresh the snapshot every `interval` seconds in a background task until `stop_refresh()`.
+        """
+        async def loop() -> None:
+            while True:
+                result = await self.refresh()
+                if result.is_err():
+                    logger.warning("Background catalog refresh failed: %s", result.unwrap_err()["error"])
+                await asyncio.sleep(interval)
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(loop())
+        return self._refresh_task
+
+    async def stop_refresh(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,192 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import logging
+import os
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from types import TracebackType
+from typing import TypeVar
+
+from .actions import Action
+from ._bulk import Bulk, BulkReport, ItemMethod
+from .client import Client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class SyncGroup:
+    """
+    Blocking view of one action group: every coroutine method of the group becomes a plain
+    method that runs on the `SyncClient` loop and returns its `Result`.
+    """
+    def __init__(self, group: object, client: 'SyncClient'):
+        self._group = group
+        self._client = client
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attribute = getattr(self._group, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def blocking(*args: object, **kwargs: object) -> object:
+            return self._client.call(attribute, *args, **kwargs)
+
+        setattr(self, name, blocking)
+        return blocking
+
+class SyncClient:
+    """
+    Blocking facade for synchronous code (Celery tasks, Django views, scripts).
+
+    One event loop runs in a background daemon thread and owns a shared `Client`, so every call
+    from any thread reuses the same connection pool and client policies instead of paying for
+    a fresh loop, session and handshake per `asyncio.run()`. Action groups are available under
+    their `Action` accessor names, with every method blocking:
+
+    ```python
+    with SyncClient(Client(rate_limiter=RateLimiter())) as vultr:
+        instance = vultr.instance().get(instance_id)
+        report = vultr.batch(vultr.instance().get_bandwidth, instance_ids, None, concurrency=10)
+        future = vultr.submit(Action.dns().list_domains, 100, None)
+    ```
+
+    `submit()` and `batch()` may be called from any thread. Context set in the calling thread
+    with `use_api_key()`, `deadline()` or `use_priority()` applies to the calls it makes. After
+    a fork, the child process starts its own loop thread and session on first use.
+    """
+    def __init__(self, client: Client | None = None):
+        """
+        Args:
+            client (Client | None): The client the loop thread opens and shares. Defaults to `Client()`.
+        """
+        self.client = client if client is not None else Client()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Callable[[], SyncGroup]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        accessor = getattr(Action, name)
+        group = SyncGroup(accessor(), self)
+
+        def sync_accessor() -> SyncGroup:
+            return group
+
+        setattr(self, name, sync_accessor)
+        return sync_accessor
+
+    def start(self) -> 'SyncClient':
+        """
+        Start the loop thread and open the client. Calling `start()` on a started facade is a no-op.
+        """
+        self._ensure_loop()
+        return self
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._pid != os.getpid():
+                # The loop thread and the session's sockets belong to the parent process.
+                self._loop = self._thread = None
+                self.client.reset_after_fork()
+                self._pid = os.getpid()
+            if self._loop is not None:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._run_loop, args=(loop,), name="proschedio-vultr-loop", daemon=True)
+            thread.start()
+            asyncio.run_coroutine_threadsafe(self.client.open(), loop).result()
+            self._loop, self._thread = loop, thread
+            logger.debug("sync.started thread=%s", thread.name)
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _bound(self, fn: Callable[..., Awaitable[T]], args: tuple[object, ...], kwargs: dict[str, object]) -> T:
+        # Each submission runs in its own task, whose context is a copy of the caller's.
+        self.client.bind()
+        return await fn(*args, **kwargs)
+
+    def submit(self, fn: Callable[..., Awaitable[T]], *args: object, **kwargs: object) -> 'concurrent.futures.Future[T]':
+        """
+        Schedule `fn(*args, **kwargs)` on the loop thread and return at once.
+
+        Args:
+            fn (Callable[..., Awaitable[T]]): An action method or any coroutine function.
+            *args (object): Positional arguments of `fn`.
+            **kwargs (object): Keyword arguments of `fn`.
+
+        Returns:
+            concurrent.futures.Future[T]: Resolves to the call's result.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("SyncClient cannot block on its own loop thread; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(self._bound(fn, args, kwargs), loop)
+
+    def call(self, fn: Callable[..., Awaitable[T]], *args: object, **kwargs: object) -> T:
+        """
+        Run `fn(*args, **kwargs)` on the loop thread and wait for its result.
+        """
+        return self.submit(fn, *args, **kwargs).result()
+
+    def batch(
+        self,
+        method: ItemMethod,
+        items: Sequence[str],
+        *args: object,
+        concurrency: int = 8,
+        stop_on_error: bool = False,
+        **kwargs: object,
+    ) -> BulkReport:
+        """
+        Call `method` for every id in `items` concurrently on the loop thread and wait for all of
+        them (see `Bulk`). `method` may be an `Action` method or its blocking `SyncGroup` wrapper.
+
+        Returns:
+            BulkReport: Per-item results in input order plus a summary of failures.
+        """
+        method = getattr(method, "__wrapped__", method)
+        bulk = Bulk(method, items, *args, concurrency=concurrency, stop_on_error=stop_on_error, **kwargs)
+        return self.call(bulk.run)
+
+    def close(self) -> None:
+        """
+        Close the client and stop the loop thread. A later call starts them again.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or self._pid != os.getpid():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.close(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            logger.debug("sync.closed")
+
+    def __enter__(self) -> 'SyncClient':
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
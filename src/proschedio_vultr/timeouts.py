@@ -0,0 +1,120 @@
+import time
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Final, NamedTuple, TypedDict
+
+if TYPE_CHECKING:
+    import aiohttp
+
+class Timeouts(NamedTuple):
+    """
+    Per-attempt limits in seconds. `None` disables a limit.
+
+    `connect` covers waiting for a pooled connection and opening a new one, `sock_read` the
+    longest gap between two reads, and `total` the whole attempt including the body.
+    """
+    connect: float | None = 10.0
+    sock_read: float | None = 30.0
+    total: float | None = 60.0
+
+class TimeoutOverrides(TypedDict, total=False):
+    """
+    The limits of one endpoint family that differ from the policy default.
+    """
+    connect: float | None
+    sock_read: float | None
+    total: float | None
+
+MIN_TOTAL: Final[float] = 0.001
+"""Total timeout used once the deadline has passed; aiohttp treats a non-positive total as no limit."""
+
+class TimeoutPolicy:
+    """
+    Timeouts per endpoint family, with a default for the rest.
+
+    Attach it with `Client(timeouts=TimeoutPolicy(...))`. Without one, aiohttp's default
+    5-minute total timeout applies. Each retry or hedge is a separate attempt with its own
+    timeouts; an ambient `deadline()` caps all of them together.
+
+    A family given as `TimeoutOverrides` inherits every limit it does not set from `default`;
+    a family given as a full `Timeouts` replaces `default` entirely.
+
+    ```python
+    timeouts = TimeoutPolicy(
+        Timeouts(connect=5, sock_read=15, total=30),
+        {"kubernetes": {"total": 120}, "instances": {"sock_read": 10, "total": 20}},
+    )
+    ```
+    """
+    def __init__(self, default: Timeouts = Timeouts(), families: Mapping[str, Timeouts | TimeoutOverrides] | None = None):
+        """
+        Args:
+            default (Timeouts): Timeouts of endpoint families not listed in `families`.
+            families (Mapping[str, Timeouts | TimeoutOverrides] | None): Timeouts by endpoint family, e.g. `"kubernetes"`.
+        """
+        self.default = default
+        self._families = {
+            family: limits if isinstance(limits, Timeouts) else default._replace(**limits)
+            for family, limits in (families or {}).items()
+        }
+
+    def for_family(self, family: str) -> Timeouts:
+        return self._families.get(family, self.default)
+
+_deadline: ContextVar[float | None] = ContextVar("proschedio_vultr_deadline", default=None)
+
+@contextmanager
+def deadline(seconds: float) -> Generator[float, None, None]:
+    """
+    Give every request made inside the block (and tasks spawned from it) one shared budget of
+    `seconds`, including retries, hedges and paginated pages. Once it is spent, requests fail
+    immediately with `status_code` 0. A nested block can shorten the budget but never extend it.
+
+    ```python
+    with deadline(10.0):
+        records = await paginate(Action.dns().list_domain_records, "example.com").collect()
+    ```
+
+    Yields:
+        float: The effective deadline as a `time.monotonic()` value.
+    """
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        at = min(at, outer)
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+def current_deadline() -> float | None:
+    """
+    Return the ambient deadline as a `time.monotonic()` value, if a `deadline()` block is active.
+    """
+    return _deadline.get()
+
+def remaining() -> float | None:
+    """
+    Return the seconds left before the ambient deadline (negative once it passed), or `None`.
+    """
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+def request_timeout(policy: TimeoutPolicy | None, family: str) -> 'aiohttp.ClientTimeout | None':
+    """
+    Build the `aiohttp.ClientTimeout` of one attempt to endpoint `family` from `policy` and the
+    ambient deadline, or return `None` to keep the session default.
+    """
+    budget = remaining()
+    if policy is None and budget is None:
+        return None
+
+    import aiohttp
+
+    limits = policy.for_family(family) if policy is not None else Timeouts(None, None, None)
+    total = limits.total
+    if budget is not None:
+        total = max(MIN_TOTAL, budget if total is None else min(total, budget))
+    return aiohttp.ClientTimeout(total=total, connect=limits.connect, sock_read=limits.sock_read)
@@ -0,0 +1,86 @@
+import logging
+import random
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+def _timings(context: SimpleNamespace) -> dict[str, float] | None:
+    """
+    The timings dict a traced request passed as `trace_request_ctx`, or `None` for untraced requests.
+    """
+    timings: object = context.trace_request_ctx
+    return cast(dict[str, float], timings) if isinstance(timings, dict) else None
+
+async def _on_queued_start(session: 'aiohttp.ClientSession', context: SimpleNamespace, params: 'aiohttp.TraceConnectionQueuedStartParams') -> None:
+    context.queued_started = time.perf_counter()
+
+async def _on_queued_end(session: 'aiohttp.ClientSession', context: SimpleNamespace, params: 'aiohttp.TraceConnectionQueuedEndParams') -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings["wait_for_connection"] = time.perf_counter() - context.queued_started
+
+async def _on_create_start(session: 'aiohttp.ClientSession', context: SimpleNamespace, params: 'aiohttp.TraceConnectionCreateStartParams') -> None:
+    context.create_started = time.perf_counter()
+
+async def _on_create_end(session: 'aiohttp.ClientSession', context: SimpleNamespace, params: 'aiohttp.TraceConnectionCreateEndParams') -> None:
+    timings = _timings(context)
+    if timings is not None:
+        # Host resolution happens inside connection creation; report it separately.
+        elapsed = time.perf_counter() - context.create_started
+        timings["connect"] = max(0.0, elapsed - timings.get("dns", 0.0))
+
+async def _on_dns_start(session: 'aiohttp.ClientSession', context: SimpleNamespace, params: 'aiohttp.TraceDnsResolveHostStartParams') -> None:
+    context.dns_started = time.perf_counter()
+
+async def _on_dns_end(session: 'aiohttp.ClientSession', context: SimpleNamespace, params: 'aiohttp.TraceDnsResolveHostEndParams') -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings["dns"] = time.perf_counter() - context.dns_started
+
+def trace_config() -> 'aiohttp.TraceConfig':
+    """
+    Return a `TraceConfig` that writes connection-phase timings (seconds) into the dict passed as
+    `trace_request_ctx`: `dns`, `connect` (TCP and TLS handshake) and `wait_for_connection`
+    (queueing for a pooled connection). Requests sent without a dict are ignored.
+    """
+    import aiohttp
+
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_on_queued_start)
+    config.on_connection_queued_end.append(_on_queued_end)
+    config.on_connection_create_start.append(_on_create_start)
+    config.on_connection_create_end.append(_on_create_end)
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    return config
+
+class RequestTracer:
+    """
+    Opt-in per-request timing breakdown.
+
+    With `Client(tracer=RequestTracer(sample_rate=0.01))`, a sampled request's `SuccessResponse`
+    or `ErrorResponse` carries `timings`: `dns`, `connect`, `wait_for_connection` (present only
+    when that phase happened), `ttfb`, `body_read`, `decode` and `total`, in seconds. TLS is
+    part of `connect`, as aiohttp has no separate TLS hook. Unsampled requests pay one
+    `random()` call.
+    """
+    def __init__(self, sample_rate: float = 1.0):
+        """
+        Args:
+            sample_rate (float): Fraction of requests traced, from 0 to 1.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.traced = 0
+
+    def sample(self) -> bool:
+        if self.sample_rate >= 1.0 or random.random() < self.sample_rate:
+            self.traced += 1
+            return True
+        return False
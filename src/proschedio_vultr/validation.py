@@ -0,0 +1,201 @@
+import functools
+import logging
+import types
+from collections.abc import Callable, Iterable, Mapping
+from http import HTTPMethod
+from typing import Any, Literal, cast, get_args, get_origin, get_type_hints, is_typeddict
+
+from rustipy.result import Err, Ok, Result
+
+from .request import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+Check = Callable[[object, str, list[str]], None]
+"""Appends a message to the error list when the value at the given path is invalid."""
+
+_UNION_ORIGINS: tuple[object, ...] = (get_origin(Literal[0] | None), types.UnionType)
+"""Origins of union annotations. `Literal[...] | None` still evaluates to a `typing.Union`."""
+
+def _describe(value: object) -> str:
+    return type(value).__name__
+
+def _instance_check(expected: tuple[type, ...], label: str) -> Check:
+    # `bool` is a subclass of `int` but never a valid integer or number.
+    reject_bool = bool not in expected
+
+    def check(value: object, path: str, errors: list[str]) -> None:
+        if not isinstance(value, expected) or (reject_bool and isinstance(value, bool)):
+            errors.append(f"{path}: expected {label}, got {_describe(value)}")
+    return check
+
+def _accept(value: object, path: str, errors: list[str]) -> None:
+    pass
+
+def _compile(annotation: object) -> Check:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if annotation is Any or annotation is object:
+        return _accept
+    if annotation is type(None):
+        return _instance_check((type(None),), "null")
+    if annotation is float:
+        return _instance_check((int, float), "number")
+    if annotation is str or annotation is int or annotation is bool:
+        return _instance_check((annotation,), annotation.__name__)
+    if isinstance(annotation, type) and is_typeddict(annotation):
+        return compile_validator(annotation).check
+
+    if origin is Literal:
+        allowed = frozenset(args)
+        shown = ", ".join(repr(arg) for arg in args)
+
+        def check_literal(value: object, path: str, errors: list[str]) -> None:
+            if isinstance(value, (list, dict)) or value not in allowed:
+                errors.append(f"{path}: expected one of {shown}, got {value!r}")
+        return check_literal
+
+    if origin in _UNION_ORIGINS:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1:
+            # `X | None`: report the errors of `X` itself rather than a generic mismatch.
+            inner = _compile(options[0])
+
+            def check_optional(value: object, path: str, errors: list[str]) -> None:
+                if value is not None:
+                    inner(value, path, errors)
+            return check_optional
+
+        checks = [_compile(arg) for arg in args]
+
+        def check_union(value: object, path: str, errors: list[str]) -> None:
+            for check in checks:
+                attempt: list[str] = []
+                check(value, path, attempt)
+                if not attempt:
+                    return
+            errors.append(f"{path}: unexpected {_describe(value)} {value!r}")
+        return check_union
+
+    if origin is list:
+        item = _compile(args[0]) if args else _accept
+
+        def check_list(value: object, path: str, errors: list[str]) -> None:
+            if not isinstance(value, list):
+                errors.append(f"{path}: expected list, got {_describe(value)}")
+                return
+            for i, element in enumerate(cast(list[object], value)):
+                item(element, f"{path}[{i}]", errors)
+        return check_list
+
+    if origin is dict or annotation is dict:
+        value_check = _compile(args[1]) if len(args) == 2 else _accept
+
+        def check_dict(value: object, path: str, errors: list[str]) -> None:
+            if not isinstance(value, dict):
+                errors.append(f"{path}: expected object, got {_describe(value)}")
+                return
+            for key, element in cast(dict[str, object], value).items():
+                value_check(element, f"{path}.{key}", errors)
+        return check_dict
+
+    logger.debug("No validator for annotation %r; accepting any value", annotation)
+    return _accept
+
+def _admits_none(annotation: object) -> bool:
+    return annotation is type(None) or (
+        get_origin(annotation) in _UNION_ORIGINS and type(None) in get_args(annotation)
+    )
+
+class Validator:
+    """
+    Checks a JSON payload against a `TypedDict` model: unknown keys, missing required keys, and the
+    type of every field, recursing into lists and nested models.
+
+    The model's annotations are resolved once into a tree of small check functions, so validating
+    a payload is a single pass over its keys with no `typing` introspection.
+    """
+    def __init__(self, model: type, required: Iterable[str] = (), allowed: Iterable[str] = ()):
+        """
+        Args:
+            model (type): A `TypedDict` class from `models/`.
+            required (Iterable[str]): Additional required keys, e.g. from the OpenAPI spec.
+            allowed (Iterable[str]): Additional keys accepted with any value, e.g. every body field the OpenAPI spec declares.
+        """
+        hints = get_type_hints(model)
+        self.model = model
+        self._fields: dict[str, Check] = {name: _compile(annotation) for name, annotation in hints.items()}
+        # Keys the API declares but the model lacks are accepted as-is.
+        for name in (*required, *allowed):
+            self._fields.setdefault(name, _accept)
+        # Keys whose type admits `None` may be omitted: `None` values are stripped before sending.
+        self.required = frozenset(
+            name for name in getattr(model, "__required_keys__", ()) if not _admits_none(hints[name])
+        ) | frozenset(required)
+
+    def check(self, value: object, path: str, errors: list[str]) -> None:
+        """
+        Append the problems of `value`, found at `path` of an enclosing payload, to `errors`.
+        """
+        if not isinstance(value, dict):
+            errors.append(f"{path or 'payload'}: expected object, got {_describe(value)}")
+            return
+        document = cast(dict[str, object], value)
+        fields = self._fields
+        prefix = f"{path}." if path else ""
+        for key, element in document.items():
+            check = fields.get(key)
+            if check is None:
+                errors.append(f"{prefix}{key}: unknown field for {self.model.__name__}")
+            else:
+                check(element, f"{prefix}{key}", errors)
+        for key in self.required:
+            if key not in document:
+                errors.append(f"{prefix}{key}: required")
+
+    def errors(self, payload: object) -> list[str]:
+        """
+        Return every problem found in `payload`; empty when it is valid.
+        """
+        errors: list[str] = []
+        self.check(payload, "", errors)
+        return errors
+
+    def validate(self, payload: Mapping[str, object]) -> Result[Mapping[str, object], ErrorResponse]:
+        """
+        Return `Ok(payload)`, or an `Err` listing every problem.
+        """
+        errors = self.errors(payload)
+        if errors:
+            return Err(invalid_payload(errors))
+        return Ok(payload)
+
+@functools.cache
+def compile_validator(model: type, required: tuple[str, ...] = (), allowed: tuple[str, ...] = ()) -> Validator:
+    """
+    Return the (cached) validator for `model`, compiling it on first use.
+    """
+    if not is_typeddict(model):
+        raise TypeError(f"{model!r} is not a TypedDict")
+    return Validator(model, required, allowed)
+
+def invalid_payload(errors: list[str]) -> ErrorResponse:
+    return ErrorResponse(status_code=0, error=f"Invalid payload: {'; '.join(errors)}")
+
+def check_request(method: HTTPMethod, url: str, model: type | None, payload: object) -> list[str]:
+    """
+    Validate a request body against its model and the matching OpenAPI operation: fields the
+    spec requires must be present, and fields it declares are accepted even when the model
+    lacks them. Either may be missing; with neither, nothing is checked.
+    """
+    from .routing import match
+
+    route = match(method, url)
+    required = route.required if route is not None else ()
+    allowed = route.properties if route is not None else ()
+    if model is not None:
+        return compile_validator(model, required, allowed).errors(payload)
+    if not isinstance(payload, dict):
+        return []
+    return [f"{name}: required" for name in required if name not in payload]
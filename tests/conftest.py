@@ -0,0 +1,22 @@
+from collections.abc import AsyncIterator
+
+import pytest_asyncio
+from aiohttp import web
+
+from .fakes import FakeApi
+
+@pytest_asyncio.fixture
+async def fake_api() -> AsyncIterator[FakeApi]:
+    api = FakeApi()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", api.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    api.base_url = f"http://127.0.0.1:{port}"
+    try:
+        yield api
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,30 @@
+from aiohttp import web
+
+class FakeApi:
+    """
+    Local stand-in for the Vultr API. Each request consumes the next scripted response; once the
+    script is empty every request gets `200 {}`. Requests are recorded as `(method, path, query)`,
+    with their body, headers and client address in `bodies`, `headers` and `peers`.
+    """
+    def __init__(self):
+        self.script: list[tuple[int, bytes, dict[str, str]]] = []
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.bodies: list[bytes] = []
+        self.headers: list[dict[str, str]] = []
+        self.peers: list[object] = []
+        self.base_url = ""
+
+    def respond(self, status: int, body: bytes = b"{}", headers: dict[str, str] | None = None) -> None:
+        self.script.append((status, body, headers or {}))
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}/v2/{path}"
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path, dict(request.query)))
+        self.bodies.append(await request.read())
+        self.headers.append(dict(request.headers))
+        transport = request.transport
+        self.peers.append(transport.get_extra_info("peername") if transport is not None else None)
+        status, body, headers = self.script.pop(0) if self.script else (200, b"{}", {})
+        return web.Response(status=status, body=body, headers=headers, content_type="application/json")
@@ -0,0 +1,37 @@
+from http import HTTPMethod
+
+import pytest
+
+from proschedio_vultr import CircuitBreaker, Client, deadline
+from proschedio_vultr.request import ErrorResponse, Request
+
+from .fakes import FakeApi
+
+@pytest.mark.asyncio
+async def test_deadline_errors_never_trip_the_breaker() -> None:
+    breaker = CircuitBreaker(minimum_calls=1, window=1)
+    async with Client(breaker=breaker):
+        with deadline(0.0):
+            for _ in range(5):
+                result = await Request("https://api.vultr.com/v2/instances").set_method(HTTPMethod.GET).request()
+                assert result.is_err()
+                assert result.unwrap_err().get("not_sent")
+
+    assert breaker.state("instances") == "closed"
+    assert "open" not in breaker.metrics()
+
+@pytest.mark.asyncio
+async def test_streams_trip_and_respect_the_breaker(fake_api: FakeApi) -> None:
+    breaker = CircuitBreaker(minimum_calls=2, window=2)
+    fake_api.respond(503)
+    fake_api.respond(503)
+    errors: list[ErrorResponse | None] = []
+    async with Client(breaker=breaker):
+        for _ in range(3):
+            stream = Request(fake_api.url("instances")).set_method(HTTPMethod.GET).stream("instances")
+            assert [item async for item in stream] == []
+            errors.append(stream.error)
+
+    assert breaker.state("instances") == "open"
+    assert [error.get("circuit_open") if error is not None else None for error in errors] == [None, None, True]
+    assert len(fake_api.requests) == 2
@@ -0,0 +1,20 @@
+from http import HTTPMethod
+
+import pytest
+
+from proschedio_vultr import Client, ResponseCache, use_api_key
+from proschedio_vultr.request import Request
+
+from .fakes import FakeApi
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_not_shared_across_api_keys(fake_api: FakeApi) -> None:
+    cache = ResponseCache()
+    async with Client(cache=cache):
+        for api_key in ("key-a", "key-b", "key-a"):
+            with use_api_key(api_key):
+                result = await Request(fake_api.url("regions")).set_method(HTTPMethod.GET).authorize().request()
+                assert result.is_ok()
+
+    assert len(fake_api.requests) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,24 @@
+import pytest
+
+from proschedio_vultr import PlanIndex
+
+PLANS: list[dict[str, object]] = [
+    {"id": "vc2-1c-1gb", "type": "vc2", "vcpu_count": 1, "ram": 1024, "disk": 25, "monthly_cost": 5, "locations": ["ewr", "fra"]},
+    {"id": "vhf-2c-8gb", "type": "vhf", "vcpu_count": 2, "ram": 8192, "disk": 128, "monthly_cost": 48, "locations": ["fra"]},
+    {"id": "vhf-4c-16gb", "type": "vhf", "vcpu_count": 4, "ram": 16384, "disk": 256, "monthly_cost": 96, "locations": ["fra", "ewr"]},
+]
+REGIONS: list[dict[str, object]] = [
+    {"id": "ewr", "continent": "North America", "country": "US"},
+    {"id": "fra", "continent": "Europe", "country": "DE"},
+]
+
+def test_cheapest_applies_filters() -> None:
+    index = PlanIndex.from_catalogs(PLANS, regions=REGIONS)
+    cheapest = index.cheapest(type="vhf", min_ram=8192, continent="Europe")
+    assert cheapest is not None and cheapest["id"] == "vhf-2c-8gb"
+    assert index.cheapest(min_vcpu=8) is None
+
+def test_cheapest_rejects_unknown_filters() -> None:
+    index = PlanIndex.from_catalogs(PLANS, regions=REGIONS)
+    with pytest.raises(TypeError):
+        index.cheapest(min_memory=8192)  # pyright: ignore[reportCallIssue]
@@ -0,0 +1,32 @@
+import asyncio
+from http import HTTPMethod
+
+import pytest
+
+from proschedio_vultr import Client
+from proschedio_vultr.request import Request
+
+from .fakes import FakeApi
+
+async def get(api: FakeApi) -> None:
+    result = await Request(api.url("instances")).set_method(HTTPMethod.GET).request()
+    assert result.is_ok()
+
+@pytest.mark.asyncio
+async def test_requests_reuse_pooled_connections(fake_api: FakeApi) -> None:
+    async with Client(limit=2) as client:
+        for _ in range(3):
+            await get(fake_api)
+        await asyncio.gather(*(get(fake_api) for _ in range(6)))
+        session = client.session
+
+    assert len(set(fake_api.peers[:3])) == 1
+    assert len(set(fake_api.peers)) <= 2
+    assert session.closed and not client.is_open
+
+@pytest.mark.asyncio
+async def test_requests_outside_a_client_use_one_shot_sessions(fake_api: FakeApi) -> None:
+    await get(fake_api)
+    await get(fake_api)
+    assert len(fake_api.requests) == 2
+    assert fake_api.peers[0] != fake_api.peers[1]
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from proschedio_vultr import codec
+from proschedio_vultr.codec import ArrayItemParser
+
+BODY = json.dumps(
+    {
+        "instances": [{"id": "a", "label": "café ☕"}, 12345, -0.5, "x,]}", [1, [2]], None, True],
+        "meta": {"total": 7, "links": {"next": "", "prev": ""}},
+    },
+    ensure_ascii=False,
+).encode()
+
+def parse(chunks: list[bytes], key: str | None = "instances") -> tuple[list[object], ArrayItemParser]:
+    parser = ArrayItemParser(key)
+    items: list[object] = []
+    for chunk in chunks[:-1]:
+        items += parser.feed(chunk)
+    items += parser.feed(chunks[-1], final=True)
+    return items, parser
+
+@pytest.mark.parametrize("split", range(1, len(BODY)))
+def test_items_split_across_two_chunks(split: int) -> None:
+    items, parser = parse([BODY[:split], BODY[split:]])
+    expected = json.loads(BODY)
+    assert items == expected["instances"]
+    assert parser.fields == {"meta": expected["meta"]}
+    assert parser.done
+
+def test_items_fed_one_byte_at_a_time() -> None:
+    items, parser = parse([BODY[i:i + 1] for i in range(len(BODY))], key=None)
+    assert items == json.loads(BODY)["instances"]
+    assert parser.array_key == "instances"
+
+def test_truncated_body_is_an_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        parse([BODY[:-3], b""])
+
+def test_without_none_strips_nested_keys_only() -> None:
+    value = {"a": None, "b": {"c": None, "d": [{"e": None}, None, 0]}, "f": False}
+    assert codec.without_none(value) == {"b": {"d": [{}, None, 0]}, "f": False}
@@ -0,0 +1,12 @@
+from http import HTTPMethod
+
+from proschedio_vultr import KeyPool
+
+def test_pool_metrics_keep_keys_with_equal_suffixes_apart() -> None:
+    pool = KeyPool(["aaaa-1234", "bbbb-1234", "abc", "xyz"])
+    for _ in range(4):
+        pool.select(HTTPMethod.GET).begin()
+
+    metrics = pool.metrics()
+    assert list(metrics) == ["0:...1234", "1:...1234", "2:***", "3:***"]
+    assert all(stats["requests"] == 1 for stats in metrics.values())
@@ -0,0 +1,20 @@
+import inspect
+import os
+import subprocess
+import sys
+
+def test_bulk_is_the_function_after_sync_client_import() -> None:
+    from proschedio_vultr import SyncClient, bulk
+
+    assert SyncClient is not None
+    assert inspect.iscoroutinefunction(bulk)
+
+def test_package_import_is_lazy() -> None:
+    code = (
+        "import sys, proschedio_vultr\n"
+        "heavy = ('aiohttp', 'proschedio_vultr.actions', 'proschedio_vultr.urls')\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == ""
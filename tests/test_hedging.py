@@ -0,0 +1,23 @@
+import asyncio
+
+import pytest
+from rustipy.result import Ok, Result
+
+from proschedio_vultr import HedgePolicy
+from proschedio_vultr.request import ErrorResponse, SuccessResponse
+
+@pytest.mark.asyncio
+async def test_hedged_away_attempts_are_recorded_as_lower_bounds() -> None:
+    policy = HedgePolicy(initial_delay=0.05, min_samples=2, min_delay=0.0)
+    delays = iter([0.5, 0.0])
+
+    async def send() -> Result[SuccessResponse, ErrorResponse]:
+        await asyncio.sleep(next(delays))
+        return Ok(SuccessResponse(status_code=200, data=None, meta=None))
+
+    result = await policy.run("https://api.vultr.com/v2/instances", send)
+    assert result.is_ok()
+    await asyncio.sleep(0)  # let the cancelled primary unwind
+    assert policy.metrics() == {"calls": 1, "fired": 1, "won": 1, "censored": 1}
+    # The slow primary counts with at least its elapsed time, not as if it never ran.
+    assert policy.delay("instances") >= 0.05
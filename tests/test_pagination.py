@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from rustipy.result import Ok, Result
+
+from proschedio_vultr.pagination import Paginator
+from proschedio_vultr.request import ErrorResponse, MetaInfo, SuccessResponse
+
+class FakeList:
+    """
+    A cursor-based list method over `pages`, keyed by cursor (`None` for the first page).
+    """
+    def __init__(self, pages: dict[str | None, tuple[list[object], str | None]]):
+        self.pages = pages
+        self.calls: list[str | None] = []
+
+    async def __call__(self, per_page: int, cursor: str | None) -> Result[SuccessResponse, ErrorResponse]:
+        self.calls.append(cursor)
+        await asyncio.sleep(0)
+        items, next_cursor = self.pages[cursor]
+        meta = MetaInfo(total=0, links={"next": next_cursor or "", "prev": ""})
+        return Ok(SuccessResponse(status_code=200, data=items, meta=meta))
+
+@pytest.mark.asyncio
+async def test_prefetch_requests_the_next_page_while_the_current_one_is_consumed() -> None:
+    method = FakeList({None: ([1, 2], "b"), "b": ([3, 4], "c"), "c": ([5], None)})
+    seen: list[tuple[object, list[str | None]]] = []
+    async for item in Paginator(method, prefetch=True):
+        await asyncio.sleep(0)
+        seen.append((item, list(method.calls)))
+
+    assert [item for item, _ in seen] == [1, 2, 3, 4, 5]
+    # Page "b" was already requested while item 1 of the first page was being handled.
+    assert seen[0][1] == [None, "b"]
+    assert method.calls == [None, "b", "c"]
+
+@pytest.mark.asyncio
+async def test_without_prefetch_pages_are_requested_on_demand() -> None:
+    method = FakeList({None: ([1, 2], "b"), "b": ([3], None)})
+    pager = Paginator(method)
+    seen = [(item, list(method.calls)) async for item in pager]
+    assert seen == [(1, [None]), (2, [None]), (3, [None, "b"])]
+    assert pager.pages == 2
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_repeated_cursor_stops_instead_of_looping(prefetch: bool) -> None:
+    method = FakeList({None: ([1], "b"), "b": ([2], "c"), "c": ([3], "b")})
+    pager = Paginator(method, prefetch=prefetch)
+    result = await pager.collect()
+    assert result.unwrap() == [1, 2, 3]
+    assert method.calls == [None, "b", "c"]
+    assert pager.error is None
@@ -0,0 +1,41 @@
+import asyncio
+from http import HTTPMethod
+
+import pytest
+
+from proschedio_vultr import Client
+from proschedio_vultr.request import Request, Url
+
+from .fakes import FakeApi
+
+@pytest.mark.asyncio
+async def test_shared_url_template_is_never_mutated(fake_api: FakeApi) -> None:
+    template = Url(f"{fake_api.base_url}/v2/").uri("instances/{instance-id}/ipv4")
+    ids = [f"id-{i}" for i in range(20)]
+
+    async def get(instance_id: str) -> None:
+        url = template.assign("instance-id", instance_id)
+        await asyncio.sleep(0)  # interleave with the other requests between bind and render
+        result = await Request(url.to_str()).set_method(HTTPMethod.GET).request()
+        assert result.is_ok()
+
+    async with Client():
+        await asyncio.gather(*(get(instance_id) for instance_id in ids))
+
+    assert sorted(path for _, path, _ in fake_api.requests) == sorted(f"/v2/instances/{i}/ipv4" for i in ids)
+    assert template.to_str().endswith("/v2/instances/{instance-id}/ipv4")
+
+@pytest.mark.asyncio
+async def test_set_json_sends_compact_bytes_without_nested_nones(fake_api: FakeApi) -> None:
+    payload: dict[str, object] = {
+        "label": "web",
+        "tag": None,
+        "user_data": {"script": None, "lines": [{"a": 1, "b": None}, None]},
+    }
+    request = Request(fake_api.url("instances")).set_method(HTTPMethod.POST).set_json(payload)
+    async with Client():
+        assert (await request.request()).is_ok()
+
+    assert fake_api.bodies == [b'{"label":"web","user_data":{"lines":[{"a":1},null]}}']
+    assert fake_api.headers[0]["Content-Type"] == "application/json"
+    assert payload["tag"] is None  # the caller's payload is left as it was
@@ -0,0 +1,74 @@
+import time
+from http import HTTPMethod
+
+import pytest
+from rustipy.result import Err, Result
+
+from proschedio_vultr import Client, RetryPolicy
+from proschedio_vultr.request import ErrorResponse, Request, SuccessResponse
+
+from .fakes import FakeApi
+
+def policy(max_attempts: int = 4, deadline: float | None = 60.0) -> RetryPolicy:
+    return RetryPolicy(max_attempts=max_attempts, base_delay=0.01, max_delay=0.05, deadline=deadline)
+
+async def send(api: FakeApi, retry: RetryPolicy, method: HTTPMethod = HTTPMethod.GET) -> Result[SuccessResponse, ErrorResponse]:
+    async with Client(retry_policy=retry):
+        return await Request(api.url("instances")).set_method(method).request()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 503])
+async def test_retry_after_is_honored(fake_api: FakeApi, status: int) -> None:
+    fake_api.respond(status, b'{"error": "slow down"}', {"Retry-After": "0.2"})
+    retry = policy()
+    started = time.monotonic()
+    result = await send(fake_api, retry)
+    assert result.is_ok()
+    assert len(fake_api.requests) == 2
+    assert time.monotonic() - started >= 0.2
+    assert retry.metrics()["recovered"] == 1
+
+@pytest.mark.asyncio
+async def test_non_idempotent_post_is_not_retried(fake_api: FakeApi) -> None:
+    fake_api.respond(503)
+    result = await send(fake_api, policy(), HTTPMethod.POST)
+    assert result.is_err() and result.unwrap_err()["status_code"] == 503
+    assert len(fake_api.requests) == 1
+
+@pytest.mark.asyncio
+async def test_max_attempts_is_exhausted(fake_api: FakeApi) -> None:
+    for _ in range(5):
+        fake_api.respond(503)
+    retry = policy(max_attempts=3)
+    result = await send(fake_api, retry)
+    assert result.is_err()
+    assert len(fake_api.requests) == 3
+    assert retry.metrics()["exhausted"] == 1
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_the_deadline_budget_runs_out(fake_api: FakeApi) -> None:
+    fake_api.respond(503, headers={"Retry-After": "5"})
+    retry = policy(deadline=0.5)
+    started = time.monotonic()
+    result = await send(fake_api, retry)
+    assert result.is_err()
+    assert len(fake_api.requests) == 1
+    assert time.monotonic() - started < 0.5
+    assert retry.metrics()["deadline_exceeded"] == 1
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [
+    ErrorResponse(status_code=0, error="Circuit open", retry_after=0.01, circuit_open=True),
+    ErrorResponse(status_code=0, error="Preempted", retry_after=0.01, preempted=True),
+])
+async def test_local_rejections_are_not_retried(error: ErrorResponse) -> None:
+    calls = 0
+
+    async def rejected() -> Result[SuccessResponse, ErrorResponse]:
+        nonlocal calls
+        calls += 1
+        return Err(error)
+
+    result = await policy().run(HTTPMethod.GET, rejected)
+    assert result.is_err()
+    assert calls == 1
@@ -0,0 +1,23 @@
+from http import HTTPMethod
+
+from proschedio_vultr import urls
+from proschedio_vultr.request import Url
+from proschedio_vultr.routing import match, route
+
+def test_every_url_template_has_a_route() -> None:
+    missing: list[str] = []
+    for name, value in vars(urls).items():
+        if not isinstance(value, Url):
+            continue
+        url = value
+        for placeholder in value.placeholders:
+            url = url.assign(placeholder, "x")
+        if not any(match(method, url.to_str()) is not None for method in HTTPMethod):
+            missing.append(f"{name}: {value.template}")
+    assert missing == []
+
+def test_spec_query_strings_are_not_part_of_the_route() -> None:
+    target = route("create-registry-docker-credentials")
+    assert target.method == HTTPMethod.OPTIONS
+    assert target.template == "registry/{registry-id}/docker-credentials"
+    assert target.query == ("expiry_seconds", "read_write")
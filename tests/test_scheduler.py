@@ -0,0 +1,31 @@
+import asyncio
+import time
+from http import HTTPMethod
+
+import pytest
+
+from proschedio_vultr import PriorityScheduler, RateLimiter, RetryPolicy
+
+def test_preempted_requests_are_not_retried() -> None:
+    error = PriorityScheduler().rejection()
+    assert error.get("preempted")
+    assert error.get("not_sent")
+    assert not RetryPolicy().should_retry(HTTPMethod.GET, error)
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_release_their_slot_and_token() -> None:
+    scheduler = PriorityScheduler()
+    limiter = RateLimiter(rate=5.0, burst=1.0)
+    assert await scheduler.acquire("key", "instances", limiter)
+
+    waiters = [asyncio.create_task(scheduler.acquire("key", "instances", limiter)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    assert scheduler.metrics()["default"]["queued"] == 0
+
+    await asyncio.sleep(0.25)
+    started = time.monotonic()
+    assert await scheduler.acquire("key", "instances", limiter)
+    assert time.monotonic() - started < 0.1
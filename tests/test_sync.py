@@ -0,0 +1,28 @@
+from proschedio_vultr import Client, MetricsRegistry, PriorityScheduler, RateLimiter, SyncClient
+
+def test_child_process_starts_fresh_loop_state() -> None:
+    metrics = MetricsRegistry(loop_lag_interval=60.0)
+    scheduler = PriorityScheduler()
+    limiter = RateLimiter(rate=1000.0, burst=10.0)
+    vultr = SyncClient(Client(metrics=metrics, scheduler=scheduler))
+    parent_loop = vultr.start()._loop  # pyright: ignore[reportPrivateUsage]
+    assert parent_loop is not None
+    assert vultr.call(scheduler.acquire, "key", "instances", limiter)
+    parent_task = metrics._lag_task  # pyright: ignore[reportPrivateUsage]
+    parent_thread = vultr._thread  # pyright: ignore[reportPrivateUsage]
+
+    vultr._pid = -1  # pyright: ignore[reportPrivateUsage]  # as seen by a forked child
+    try:
+        assert vultr.call(scheduler.acquire, "key", "instances", limiter)
+        child_task = metrics._lag_task  # pyright: ignore[reportPrivateUsage]
+        assert child_task is not None and child_task is not parent_task
+        assert child_task.get_loop() is vultr._loop is not parent_loop  # pyright: ignore[reportPrivateUsage]
+        lane_task = scheduler._lanes["key"].task  # pyright: ignore[reportPrivateUsage]
+        assert lane_task is not None and lane_task.get_loop() is vultr._loop  # pyright: ignore[reportPrivateUsage]
+    finally:
+        vultr.close()
+        if parent_task is not None:
+            parent_loop.call_soon_threadsafe(parent_task.cancel)
+        parent_loop.call_soon_threadsafe(parent_loop.stop)
+        if parent_thread is not None:
+            parent_thread.join()
@@ -0,0 +1,45 @@
+import asyncio
+import time
+from http import HTTPMethod
+
+import pytest
+
+from proschedio_vultr import Client, PriorityScheduler, RateLimiter, TimeoutPolicy, Timeouts, deadline
+from proschedio_vultr.request import Request
+from proschedio_vultr.timeouts import MIN_TOTAL, request_timeout
+
+URL = "http://127.0.0.1:9/v2/instances"
+
+def test_family_overrides_inherit_the_default() -> None:
+    policy = TimeoutPolicy(Timeouts(connect=5, sock_read=15, total=30), {"kubernetes": {"total": 120}, "blocks": Timeouts(total=90)})
+    assert policy.for_family("kubernetes") == Timeouts(connect=5, sock_read=15, total=120)
+    assert policy.for_family("blocks") == Timeouts(total=90)
+    assert policy.for_family("instances") == Timeouts(connect=5, sock_read=15, total=30)
+
+@pytest.mark.asyncio
+async def test_expired_deadline_never_disables_the_timeout() -> None:
+    with deadline(0.0):
+        await asyncio.sleep(0.01)
+        timeout = request_timeout(None, "instances")
+    assert timeout is not None and timeout.total == MIN_TOTAL
+
+@pytest.mark.asyncio
+async def test_stream_fails_fast_after_the_deadline() -> None:
+    with deadline(0.01):
+        await asyncio.sleep(0.02)
+        stream = Request(URL).set_method(HTTPMethod.GET).stream("instances")
+        items = [item async for item in stream]
+    assert items == []
+    assert stream.error is not None and stream.error.get("not_sent")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduled", [False, True])
+async def test_rate_limit_wait_is_bounded_by_the_deadline(scheduled: bool) -> None:
+    limiter = RateLimiter(rate=0.1)
+    limiter.reserve("")
+    async with Client(rate_limiter=limiter, scheduler=PriorityScheduler() if scheduled else None):
+        started = time.monotonic()
+        with deadline(0.1):
+            result = await Request(URL).set_method(HTTPMethod.GET).request()
+    assert time.monotonic() - started < 1.0
+    assert result.is_err() and result.unwrap_err().get("not_sent")
@@ -0,0 +1,21 @@
+from http import HTTPMethod
+
+from proschedio_vultr.models.cdns import CreatePushZoneFileConfig
+from proschedio_vultr.models.instance import CreateConfig
+from proschedio_vultr.validation import check_request
+
+INSTANCES = "https://api.vultr.com/v2/instances"
+
+def test_spec_declared_fields_missing_from_the_model_are_accepted() -> None:
+    payload = {"region": "ewr", "plan": "vc2-1c-1gb", "os_id": 2284, "attach_vpc2": ["vpc"], "enable_vpc2": True, "tag": "web"}
+    assert check_request(HTTPMethod.POST, INSTANCES, CreateConfig, payload) == []
+
+def test_fields_unknown_to_model_and_spec_are_rejected() -> None:
+    payload = {"region": "ewr", "plan": "vc2-1c-1gb", "regoin": "ewr"}
+    errors = check_request(HTTPMethod.POST, INSTANCES, CreateConfig, payload)
+    assert errors == ["regoin: unknown field for CreateConfig"]
+
+def test_push_zone_file_uses_its_own_model() -> None:
+    url = "https://api.vultr.com/v2/cdns/push-zones/abc/files"
+    assert check_request(HTTPMethod.POST, url, CreatePushZoneFileConfig, {"name": "a.txt", "size": 10}) == []
+    assert check_request(HTTPMethod.POST, url, CreatePushZoneFileConfig, {"name": "a.txt", "size": "10"}) == ["size: expected int, got str"]